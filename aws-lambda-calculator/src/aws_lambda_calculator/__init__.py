@@ -1,3 +1,72 @@
+import sys
+from importlib import import_module
+from types import ModuleType
+from typing import Any
+
 from .calculator import calculate
+from .instrumentation import HistogramSink, instrument
+from .pricing import pricing_version
+from .regions import load_region_index, select_regions
+from .solver import solve_for
+
+# The vectorized APIs need numpy, which is imported on first access so that the CLI and
+# the Lambda handler only pay for it when they use one of them
+_LAZY_ATTRIBUTES = {
+    "aggregate": ".aggregate",
+    "calculate_account": ".free_tier",
+    "calculate_batch": ".batch",
+    "calculate_batch_result": ".batch",
+    "calculate_by_memory": ".memory_pricing",
+    "compare_regions": ".sweep",
+    "price_provisioned": ".provisioned",
+    "price_series": ".timeseries",
+    "read_csv": ".timeseries",
+    "sensitivity": ".sensitivity",
+    "simulate": ".simulate",
+    "sweep": ".sweep",
+    "sweep_chunks": ".sweep",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+class _Package(ModuleType):
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Importing a submodule binds it on the package, where it would shadow the
+        # function of the same name (aggregate, sensitivity, simulate, sweep)
+        if isinstance(value, ModuleType) and _LAZY_ATTRIBUTES.get(name) == f".{name}":
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
+
 
-__all__ = ["calculate"]
+__all__ = [
+    "HistogramSink",
+    "aggregate",
+    "calculate",
+    "calculate_account",
+    "calculate_batch",
+    "calculate_batch_result",
+    "calculate_by_memory",
+    "compare_regions",
+    "instrument",
+    "load_region_index",
+    "price_provisioned",
+    "price_series",
+    "pricing_version",
+    "read_csv",
+    "select_regions",
+    "sensitivity",
+    "simulate",
+    "solve_for",
+    "sweep",
+    "sweep_chunks",
+]
@@ -0,0 +1,116 @@
+import logging
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from .batch import encode_workloads
+from .free_tier import FreeTierPolicy, price_account
+from .pricing import ARCHITECTURES
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class TierGroup:
+    """Account-wide usage and charges of one (region, architecture) tier group."""
+
+    region: str
+    architecture: str
+    functions: int
+    total_compute_gb_sec: float
+    requests_per_month: float
+    compute_charges: float
+    request_charges: float
+
+
+@dataclass(frozen=True, slots=True)
+class AggregateResult:
+    """Account-level charges, attributed back to each function."""
+
+    compute_charges: np.ndarray
+    request_charges: np.ndarray
+    ephemeral_storage_charges: np.ndarray
+    total_cost: np.ndarray
+    groups: list[TierGroup]
+
+    @property
+    def account_total(self) -> float:
+        """The monthly cost of the whole account."""
+        return float(self.total_cost.sum())
+
+
+def aggregate(
+    region: ArrayLike = "us-east-1",
+    architecture: ArrayLike = "x86",
+    number_of_requests: ArrayLike = 1000000,
+    request_unit: ArrayLike = "per day",
+    duration_of_each_request_in_ms: ArrayLike = 1500,
+    memory: ArrayLike = 128,
+    memory_unit: ArrayLike = "MB",
+    ephemeral_storage: ArrayLike = 512,
+    storage_unit: ArrayLike = "MB",
+    include_free_tier: bool = True,
+    free_tier_policy: FreeTierPolicy = "pro-rata",
+) -> AggregateResult:
+    """
+    @brief Price a fleet of functions the way AWS bills an account.
+    GB-seconds and requests are summed per (region, architecture) tier group before the
+    tiers are applied, so functions sharing a group climb the tiers together. The free
+    tier is granted once per account and shared between the functions by
+    free_tier_policy, see allocate_free_tier(). Each group's charges are attributed back
+    to its functions in proportion to their billable GB-seconds (compute) and requests.
+    Every element of the inputs is one function of a single month; this is
+    calculate_account() over the flattened fleet, summarized per group.
+    @param include_free_tier: Whether the account still has the monthly free tier.
+    @return: Per-function attributed charges and per-group totals.
+    """
+    workloads = encode_workloads(
+        region,
+        architecture,
+        number_of_requests,
+        request_unit,
+        duration_of_each_request_in_ms,
+        memory,
+        memory_unit,
+        ephemeral_storage,
+        storage_unit,
+        include_free_tier,
+    )
+    shape = workloads.region_index.shape
+    workloads = workloads.reshape(-1)
+    logger.debug(f"Aggregating {workloads.region_index.size:,} functions")
+    result = price_account(workloads, free_tier_policy)
+
+    table = workloads.table
+    group = workloads.tier_group()
+    group_count = len(table.regions) * len(ARCHITECTURES)
+    functions = np.bincount(group, minlength=group_count)
+    group_gb_sec, group_requests, group_compute, group_request = (
+        np.bincount(group, column, minlength=group_count)
+        for column in (
+            result.total_compute_gb_sec,
+            result.requests_per_month,
+            result.compute_charges,
+            result.request_charges,
+        )
+    )
+    groups = [
+        TierGroup(
+            region=table.regions[g // len(ARCHITECTURES)],
+            architecture=ARCHITECTURES[g % len(ARCHITECTURES)],
+            functions=int(functions[g]),
+            total_compute_gb_sec=float(group_gb_sec[g]),
+            requests_per_month=float(group_requests[g]),
+            compute_charges=float(group_compute[g]),
+            request_charges=float(group_request[g]),
+        )
+        for g in np.flatnonzero(functions)
+    ]
+    return AggregateResult(
+        compute_charges=result.compute_charges.reshape(shape),
+        request_charges=result.request_charges.reshape(shape),
+        ephemeral_storage_charges=result.ephemeral_storage_charges.reshape(shape),
+        total_cost=result.total_cost.reshape(shape),
+        groups=groups,
+    )
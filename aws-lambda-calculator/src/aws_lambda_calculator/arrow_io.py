@@ -0,0 +1,197 @@
+import logging
+from collections.abc import Callable, Mapping, Sequence
+from functools import partial
+from typing import Any
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError as error:
+    raise ImportError(
+        "Arrow and Parquet I/O requires pyarrow, "
+        "install it with: pip install 'aws-lambda-calculator[arrow]'"
+    ) from error
+
+from .batch import (
+    UNIT_TO_GB,
+    WORKLOAD_COLUMNS,
+    WORKLOAD_TYPES,
+    Workloads,
+    requests_per_month_multiplier,
+    unit_to_gb,
+    validate_workloads,
+)
+from .calculator import REQUESTS_PER_MONTH
+from .pricing import ARCHITECTURES
+from .pricing_table import load_pricing_table
+from .results import BatchResult
+
+logger = logging.getLogger(__name__)
+
+# Categorical columns and the lookup tables mapping their values to the engine's codes
+CATEGORIES: dict[str, Mapping[str, Any]] = {
+    "architecture": {arch: i for i, arch in enumerate(ARCHITECTURES)},
+    "request_unit": REQUESTS_PER_MONTH,
+    "memory_unit": UNIT_TO_GB,
+    "storage_unit": UNIT_TO_GB,
+    "workload_type": {kind: i for i, kind in enumerate(WORKLOAD_TYPES)},
+}
+# Unit columns may also hold pre-encoded unit codes, converted by a single gather
+UNIT_CODES: dict[str, Callable[[np.ndarray], np.ndarray]] = {
+    "request_unit": requests_per_month_multiplier,
+    "memory_unit": partial(unit_to_gb, name="memory unit"),
+    "storage_unit": partial(unit_to_gb, name="storage unit"),
+}
+COST_COLUMNS = (
+    "compute_charges",
+    "request_charges",
+    "ephemeral_storage_charges",
+    "response_streaming_charges",
+    "total_cost",
+)
+
+
+def _non_null(table: pa.Table, name: str) -> pa.Array:
+    column = table.column(name)
+    if column.null_count:
+        raise ValueError(f"Missing values in column: {name}")
+    # combining always copies, even a single chunk
+    return column.chunk(0) if column.num_chunks == 1 else column.combine_chunks()
+
+
+def dictionary_codes(table: pa.Table, name: str) -> tuple[list[Any], np.ndarray]:
+    """
+    @brief Dictionary-encode a categorical column, if it is not already.
+    Dictionary columns are used as stored, chunks with different dictionaries unified;
+    other columns are encoded by Arrow, so Python only ever sees the distinct values.
+    @return: The values of the dictionary that occur in the column, and the position of
+        each row's value among them.
+    """
+    array = _non_null(table, name)
+    if not pa.types.is_dictionary(array.type):
+        array = pc.dictionary_encode(array)
+    indices = array.indices.to_numpy()
+    used = np.flatnonzero(np.bincount(indices, minlength=len(array.dictionary)))
+    # unused dictionary entries are dropped so that they are never looked up
+    positions = np.zeros(len(array.dictionary), dtype=np.intp)
+    positions[used] = np.arange(used.size)
+    values = array.dictionary.take(pa.array(used)).to_pylist()
+    return values, positions[indices]
+
+
+def encode_column(table: pa.Table, name: str, mapping: Mapping[str, Any]) -> np.ndarray:
+    """
+    @brief Map a categorical column through a lookup table, one lookup per distinct value.
+    @return: The encoded value of each row.
+    """
+    values, codes = dictionary_codes(table, name)
+    unknown = [value for value in values if value not in mapping]
+    if unknown:
+        raise ValueError(f"Unknown {name.replace('_', ' ')}: {unknown[0]}")
+    return np.array([mapping[value] for value in values])[codes]
+
+
+def encode_table(table: pa.Table) -> Workloads:
+    """
+    @brief Encode and validate workloads given as an Arrow table of calculate() arguments.
+    Columns are named after the arguments; missing ones take calculate()'s defaults and
+    other columns are ignored. Numeric float64 columns without nulls are used zero-copy;
+    integer unit columns are read as unit codes.
+    @param table: One row per workload.
+    @return: The encoded workloads along with the pricing table of their regions.
+    """
+    n = table.num_rows
+    regions: list[Any] = [WORKLOAD_COLUMNS["region"]]
+    columns: dict[str, np.ndarray] = {}
+    for name, default in WORKLOAD_COLUMNS.items():
+        if name == "region":
+            if name in table.column_names:
+                regions, columns[name] = dictionary_codes(table, name)
+            else:
+                columns[name] = np.zeros(n, dtype=np.intp)
+        elif name not in table.column_names:
+            value = CATEGORIES[name][str(default)] if name in CATEGORIES else default
+            columns[name] = np.broadcast_to(np.asarray(value), (n,))
+        elif name in UNIT_CODES and pa.types.is_integer(table.schema.field(name).type):
+            codes = _non_null(table, name).to_numpy(zero_copy_only=False)
+            columns[name] = UNIT_CODES[name](codes)
+        elif name in CATEGORIES:
+            columns[name] = encode_column(table, name, CATEGORIES[name])
+        elif name == "include_free_tier":
+            columns[name] = _non_null(table, name).to_numpy(zero_copy_only=False)
+        else:
+            columns[name] = np.asarray(
+                _non_null(table, name).to_numpy(zero_copy_only=False), dtype=float
+            )
+
+    # the dictionary is in first-seen order, the pricing table in sorted order
+    order = np.argsort(regions)
+    sorted_regions = tuple(str(regions[i]) for i in order)
+    position = np.empty(len(regions), dtype=np.intp)
+    position[order] = np.arange(len(regions))
+    workloads = Workloads(
+        load_pricing_table(sorted_regions),
+        region_index=position[columns["region"]],
+        architecture_index=columns["architecture"],
+        number_of_requests=columns["number_of_requests"],
+        requests_per_month_multiplier=columns["request_unit"],
+        duration_of_each_request_in_ms=columns["duration_of_each_request_in_ms"],
+        memory=columns["memory"],
+        memory_to_gb=columns["memory_unit"],
+        ephemeral_storage=columns["ephemeral_storage"],
+        storage_to_gb=columns["storage_unit"],
+        include_free_tier=np.asarray(columns["include_free_tier"], dtype=bool),
+        workload_type=columns["workload_type"],
+        response_size_in_mb=columns["response_size_in_mb"],
+    )
+    validate_workloads(workloads)
+    return workloads
+
+
+def result_table(
+    result: BatchResult, columns: Sequence[str] = COST_COLUMNS
+) -> pa.Table:
+    """
+    @brief Wrap per-workload columns of a batch result as an Arrow table without copying.
+    @param columns: BatchResult fields with one value per workload.
+    @return: A table with one float64 column per field.
+    """
+    return pa.table(
+        {name: pa.array(np.ravel(getattr(result, name))) for name in columns}
+    )
+
+
+def calculate_table(table: pa.Table, columns: Sequence[str] = COST_COLUMNS) -> pa.Table:
+    """
+    @brief Price the workloads of an Arrow table through the vectorized engine.
+    @param table: One row per workload, see encode_table().
+    @param columns: The BatchResult fields to return, the charges by default.
+    @return: The input table with the requested columns appended.
+    """
+    workloads = encode_table(table)
+    logger.debug(f"Pricing a table of {table.num_rows:,} workloads")
+    costs = result_table(workloads.result(), columns)
+    for name in costs.column_names:
+        if name in table.column_names:
+            raise ValueError(f"Column already exists: {name}")
+        table = table.append_column(name, costs.column(name))
+    return table
+
+
+def calculate_parquet(
+    source: str, destination: str, columns: Sequence[str] = COST_COLUMNS
+) -> None:
+    """
+    @brief Price a Parquet file of workloads and write it back with cost columns.
+    Dictionary-encoded region and unit columns are read as dictionaries, so they map to
+    pricing indexes without decoding a string per row.
+    @param source: A Parquet file with one row per workload, see encode_table().
+    @param destination: Where to write the priced workloads.
+    @param columns: The BatchResult fields to append, the charges by default.
+    """
+    categorical = ["region", *CATEGORIES]
+    table = pq.read_table(source, read_dictionary=categorical)
+    pq.write_table(calculate_table(table, columns), destination)
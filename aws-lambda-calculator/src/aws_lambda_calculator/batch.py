@@ -0,0 +1,652 @@
+import logging
+from collections.abc import Mapping
+from dataclasses import dataclass, fields
+from typing import Any
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from .calculator import (
+    FREE_EPHEMERAL_STORAGE_GB,
+    FREE_TIER_COMPUTE_GB_SEC,
+    FREE_TIER_REQUESTS,
+    MB_TO_GB,
+    REQUESTS_PER_MONTH,
+)
+from .models import REQUEST_UNITS, SIZE_UNITS
+from .pricing import ARCHITECTURES, FREE_STREAMED_RESPONSE_MB
+from .pricing_table import PricingTable, load_pricing_table
+from .results import BatchResult
+
+logger = logging.getLogger(__name__)
+
+UNIT_TO_GB = {"MB": MB_TO_GB, "GB": 1.0}
+# Unit conversions indexed by unit code, see REQUEST_UNITS and SIZE_UNITS
+REQUESTS_PER_MONTH_BY_CODE = np.array([REQUESTS_PER_MONTH[u] for u in REQUEST_UNITS])
+UNIT_TO_GB_BY_CODE = np.array([UNIT_TO_GB[u] for u in SIZE_UNITS])
+WORKLOAD_TYPES = ("standard", "edge", "streaming")
+EDGE, STREAMING = WORKLOAD_TYPES.index("edge"), WORKLOAD_TYPES.index("streaming")
+
+# calculate() arguments taken as batch columns, with their defaults
+WORKLOAD_COLUMNS = {
+    "region": "us-east-1",
+    "architecture": "x86",
+    "number_of_requests": 1000000,
+    "request_unit": "per day",
+    "duration_of_each_request_in_ms": 1500,
+    "memory": 128,
+    "memory_unit": "MB",
+    "ephemeral_storage": 512,
+    "storage_unit": "MB",
+    "include_free_tier": True,
+    "workload_type": "standard",
+    "response_size_in_mb": 0,
+}
+
+# AWS Lambda limits per unit, mirroring CalculationRequest.validate_aws_lambda_limits
+MEMORY_LIMITS = {MB_TO_GB: (128, 10240), 1.0: (0.125, 10.24)}
+STORAGE_LIMITS = {MB_TO_GB: (512, 10240), 1.0: (0.5, 10.24)}
+
+
+def encode(values: ArrayLike, mapping: Mapping[Any, Any], name: str) -> np.ndarray:
+    """
+    @brief Map categorical values (units, architectures, regions) through a lookup table.
+    @param values: A scalar or array of categories.
+    @param mapping: Category to encoded value.
+    @param name: What the values are, for error messages.
+    @return: The encoded values, with the shape of the input.
+    """
+    values = np.asarray(values)
+    categories, inverse = np.unique(values, return_inverse=True)
+    for category in categories:
+        if category.item() not in mapping:
+            raise ValueError(f"Unknown {name}: {category}")
+    lookup = np.array([mapping[category.item()] for category in categories])
+    return lookup[inverse].reshape(values.shape)
+
+
+def encode_unit(values: ArrayLike, units: tuple[str, ...], name: str) -> np.ndarray:
+    """
+    @brief Encode units as small integer codes, their positions in `units`.
+    Pre-encoded integer codes are only range-checked, so a batch can skip the string
+    handling entirely.
+    @param values: A scalar or array of unit names or codes.
+    @param units: REQUEST_UNITS or SIZE_UNITS.
+    @param name: What the units are, for error messages.
+    @return: The unit codes, with the shape of the input.
+    """
+    values = np.asarray(values)
+    if values.dtype.kind not in "iu":
+        values = encode(values, {unit: i for i, unit in enumerate(units)}, name)
+    elif np.any((values < 0) | (values >= len(units))):
+        bad = values[(values < 0) | (values >= len(units))].flat[0]
+        raise ValueError(f"Unknown {name} code: {bad}")
+    return values.astype(np.int8)
+
+
+def requests_per_month_multiplier(request_unit: ArrayLike) -> np.ndarray:
+    """The per-month multiplier of request units given as names or codes."""
+    return REQUESTS_PER_MONTH_BY_CODE[
+        encode_unit(request_unit, REQUEST_UNITS, "request unit")
+    ]
+
+
+def unit_to_gb(unit: ArrayLike, name: str) -> np.ndarray:
+    """The to-GB multiplier of memory or storage units given as names or codes."""
+    return UNIT_TO_GB_BY_CODE[encode_unit(unit, SIZE_UNITS, name)]
+
+
+def validate_limits(
+    number_of_requests: np.ndarray,
+    duration_of_each_request_in_ms: np.ndarray,
+    memory: np.ndarray,
+    memory_to_gb: np.ndarray,
+    ephemeral_storage: np.ndarray,
+    storage_to_gb: np.ndarray,
+) -> None:
+    """Validate inputs against the AWS Lambda limits enforced by CalculationRequest."""
+    if np.any(number_of_requests <= 0):
+        raise ValueError("Number of requests must be greater than 0")
+    if np.any(duration_of_each_request_in_ms <= 0):
+        raise ValueError("Duration of each request must be greater than 0")
+
+    memory, memory_to_gb = np.broadcast_arrays(memory, memory_to_gb)
+    for multiplier, (low, high) in MEMORY_LIMITS.items():
+        values = memory[memory_to_gb == multiplier]
+        if np.any((values < low) | (values > high)):
+            if multiplier == 1.0:
+                raise ValueError("Memory must be between 0.125 GB and 10.24 GB")
+            raise ValueError("Memory must be between 128 MB and 10,240 MB")
+
+    ephemeral_storage, storage_to_gb = np.broadcast_arrays(
+        ephemeral_storage, storage_to_gb
+    )
+    for multiplier, (low, high) in STORAGE_LIMITS.items():
+        values = ephemeral_storage[storage_to_gb == multiplier]
+        if np.any((values < low) | (values > high)):
+            if multiplier == 1.0:
+                raise ValueError(
+                    "Ephemeral storage must be between 0.5 GB and 10.24 GB"
+                )
+            raise ValueError("Ephemeral storage must be between 512 MB and 10,240 MB")
+
+
+def tiered_cost(
+    usage: np.ndarray,
+    tier_thresholds: np.ndarray,
+    tier_rates: np.ndarray,
+    overflow_rate: np.ndarray,
+) -> np.ndarray:
+    """
+    @brief Vectorized calculate_tiered_cost.
+    @param usage: Billable GB-seconds, shape (n,).
+    @param tier_thresholds: Ascending tier breakpoints, shape (n, tiers).
+    @param tier_rates: Per-GB-second rate of each tier, shape (n, tiers).
+    @param overflow_rate: Rate beyond the highest breakpoint, shape (n,).
+    @return: The tiered cost of each usage.
+    """
+    if tier_thresholds.shape[-1] == 0:
+        return usage * overflow_rate
+
+    lower = np.concatenate(
+        [np.zeros_like(tier_thresholds[..., :1]), tier_thresholds[..., :-1]], axis=-1
+    )
+    usage_in_tier = np.clip(usage[..., None] - lower, 0.0, tier_thresholds - lower)
+    cost = (usage_in_tier * tier_rates).sum(axis=-1)
+    remaining = np.maximum(usage - tier_thresholds[..., -1], 0.0)
+    return cost + remaining * overflow_rate
+
+
+def tier_breakdown(
+    usage: np.ndarray,
+    tier_thresholds: np.ndarray,
+    tier_rates: np.ndarray,
+    overflow_rate: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    @brief The usage and cost of each tier that tiered_cost() sums.
+    @return: Usage in GB-s and cost per tier, shape (n, tiers + 1), the last tier
+        being the usage beyond the highest breakpoint.
+    """
+    lower = np.concatenate(
+        [np.zeros_like(tier_thresholds[..., :1]), tier_thresholds[..., :-1]], axis=-1
+    )
+    usage_in_tier = np.concatenate(
+        [
+            np.clip(usage[..., None] - lower, 0.0, tier_thresholds - lower),
+            np.maximum(usage - tier_thresholds[..., -1], 0.0)[..., None]
+            if tier_thresholds.shape[-1]
+            else usage[..., None],
+        ],
+        axis=-1,
+    )
+    rates = np.concatenate(
+        [tier_rates, np.broadcast_to(overflow_rate, usage.shape)[..., None]], axis=-1
+    )
+    return usage_in_tier, usage_in_tier * rates
+
+
+def pooled_tier_breakdown(
+    table: PricingTable, tier_group: np.ndarray, usage: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    @brief Apply the tiers once to the usage summed per tier group, as AWS bills an
+    account, and attribute each tier back in proportion to each usage's share.
+    @param tier_group: Tier group of each usage, see Workloads.tier_group().
+    @param usage: Billable GB-seconds, shape (functions,) or (functions, months); only
+        the functions of a group are summed, each month is tiered on its own.
+    @return: Usage in GB-s and cost per tier of each usage, shape usage.shape +
+        (tiers + 1,), see tier_breakdown().
+    """
+    usage = np.asarray(usage, dtype=float)
+    periods = int(np.prod(usage.shape[1:]))
+    group_count = len(table.regions) * len(ARCHITECTURES)
+    pool = (
+        np.broadcast_to(tier_group, usage.shape).reshape(len(usage), periods) * periods
+        + np.arange(periods)
+    ).ravel()
+    pooled = np.bincount(pool, usage.ravel(), minlength=group_count * periods)
+    group_of_pool = np.arange(len(pooled)) // periods
+    tier_usage, tier_cost = tier_breakdown(
+        pooled,
+        table.tier_thresholds.reshape(group_count, -1)[group_of_pool],
+        table.tier_rates.reshape(group_count, -1)[group_of_pool],
+        table.overflow_rate.reshape(group_count)[group_of_pool],
+    )
+    share = np.divide(
+        usage.ravel(), pooled[pool], out=np.zeros(pool.shape), where=pooled[pool] > 0
+    )[:, None]
+    shape = (*usage.shape, tier_usage.shape[-1])
+    return (
+        (tier_usage[pool] * share).reshape(shape),
+        (tier_cost[pool] * share).reshape(shape),
+    )
+
+
+def monthly_charges(
+    table: PricingTable,
+    region_index: np.ndarray,
+    architecture_index: np.ndarray,
+    number_of_requests: np.ndarray,
+    requests_per_month_multiplier: np.ndarray,
+    duration_of_each_request_in_ms: np.ndarray,
+    memory: np.ndarray,
+    memory_to_gb: np.ndarray,
+    ephemeral_storage: np.ndarray,
+    storage_to_gb: np.ndarray,
+    include_free_tier: np.ndarray,
+    memory_lookup: np.ndarray | None = None,
+    workload_type: np.ndarray | None = None,
+    free_tier_compute_gb_sec: ArrayLike = FREE_TIER_COMPUTE_GB_SEC,
+    free_tier_requests: ArrayLike = FREE_TIER_REQUESTS,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    @brief Price encoded workloads element-wise, following the same steps as calculate().
+    @param memory_lookup: Per-ms prices indexed by (region, architecture, whole MB), see
+        memory_pricing.memory_price_lookup(); prices the duration from the Memory table
+        instead of the GB-s tiers when given.
+    @param workload_type: Indexes into WORKLOAD_TYPES; Lambda@Edge workloads are billed
+        at its flat rates, without free tier or ephemeral storage.
+    @param free_tier_compute_gb_sec, free_tier_requests: The free tier of each workload,
+        the whole monthly free tier by default; see free_tier.allocate_free_tier() for
+        sharing one free tier between workloads.
+    @return: Monthly compute, request and ephemeral storage charges.
+    """
+    edge = None if workload_type is None else workload_type == EDGE
+    if edge is not None and edge.any():
+        include_free_tier = include_free_tier & ~edge
+    else:
+        edge = None
+
+    requests_per_month = np.floor(number_of_requests * requests_per_month_multiplier)
+    total_compute_sec = requests_per_month * (duration_of_each_request_in_ms * 0.001)
+    total_compute_gb_sec = (memory * memory_to_gb) * total_compute_sec
+
+    billable_compute_gb_sec = np.where(
+        include_free_tier,
+        np.maximum(total_compute_gb_sec - free_tier_compute_gb_sec, 0.0),
+        total_compute_gb_sec,
+    )
+    if memory_lookup is None:
+        compute = tiered_cost(
+            billable_compute_gb_sec,
+            table.tier_thresholds[region_index, architecture_index],
+            table.tier_rates[region_index, architecture_index],
+            table.overflow_rate[region_index, architecture_index],
+        )
+    else:
+        memory_in_gb = memory * memory_to_gb
+        # tolerate float noise so e.g. 0.125 GB lands on 128 MB, not 129 MB
+        memory_mb = np.ceil(memory_in_gb * 1024 - 1e-6).astype(np.intp)
+        billable_ms = billable_compute_gb_sec / memory_in_gb * 1000
+        compute = (
+            billable_ms
+            * memory_lookup[
+                region_index,
+                architecture_index,
+                np.minimum(memory_mb, memory_lookup.shape[-1] - 1),
+            ]
+        )
+
+    billable_requests = np.where(
+        include_free_tier,
+        np.maximum(requests_per_month - free_tier_requests, 0.0),
+        requests_per_month,
+    )
+    request = billable_requests * table.requests_rate[region_index]
+
+    billable_storage = np.maximum(
+        ephemeral_storage * storage_to_gb - FREE_EPHEMERAL_STORAGE_GB, 0.0
+    )
+    storage = (
+        billable_storage
+        * table.ephemeral_storage_rate[region_index]
+        * total_compute_sec
+    )
+
+    if edge is not None:
+        table.warn_fallback(
+            np.broadcast_to(region_index, edge.shape)[edge],
+            "EdgeRequests",
+            "EdgeDuration",
+        )
+        compute = np.where(
+            edge, total_compute_gb_sec * table.edge_duration_rate[region_index], compute
+        )
+        request = np.where(
+            edge, requests_per_month * table.edge_requests_rate[region_index], request
+        )
+        storage = np.where(edge, 0.0, storage)
+    return compute, request, storage
+
+
+def streaming_charges(
+    table: PricingTable,
+    region_index: np.ndarray,
+    number_of_requests: np.ndarray,
+    requests_per_month_multiplier: np.ndarray,
+    workload_type: np.ndarray,
+    response_size_in_mb: np.ndarray,
+) -> np.ndarray:
+    """
+    @brief Vectorized calc_monthly_streaming_charges; zero for non-streaming workloads.
+    @return: Monthly charges for the bytes streamed beyond the first 6 MB of each response.
+    """
+    streaming = workload_type == STREAMING
+    table.warn_fallback(
+        np.broadcast_to(region_index, streaming.shape)[streaming], "ResponseStreaming"
+    )
+    requests_per_month = np.floor(number_of_requests * requests_per_month_multiplier)
+    billable_mb = np.where(
+        streaming,
+        np.maximum(response_size_in_mb - FREE_STREAMED_RESPONSE_MB, 0.0),
+        0.0,
+    )
+    return (
+        requests_per_month
+        * billable_mb
+        * MB_TO_GB
+        * table.response_streaming_rate[region_index]
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class Workloads:
+    """Workloads encoded as broadcast arrays, ready for the vectorized charges."""
+
+    table: PricingTable
+    region_index: np.ndarray
+    architecture_index: np.ndarray
+    number_of_requests: np.ndarray
+    requests_per_month_multiplier: np.ndarray
+    duration_of_each_request_in_ms: np.ndarray
+    memory: np.ndarray
+    memory_to_gb: np.ndarray
+    ephemeral_storage: np.ndarray
+    storage_to_gb: np.ndarray
+    include_free_tier: np.ndarray
+    workload_type: np.ndarray
+    response_size_in_mb: np.ndarray
+
+    def charges(
+        self,
+        memory_lookup: np.ndarray | None = None,
+        free_tier_compute_gb_sec: ArrayLike = FREE_TIER_COMPUTE_GB_SEC,
+        free_tier_requests: ArrayLike = FREE_TIER_REQUESTS,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Monthly compute, request and ephemeral storage charges of each workload."""
+        return monthly_charges(
+            self.table,
+            self.region_index,
+            self.architecture_index,
+            self.number_of_requests,
+            self.requests_per_month_multiplier,
+            self.duration_of_each_request_in_ms,
+            self.memory,
+            self.memory_to_gb,
+            self.ephemeral_storage,
+            self.storage_to_gb,
+            self.include_free_tier,
+            memory_lookup,
+            self.workload_type,
+            free_tier_compute_gb_sec,
+            free_tier_requests,
+        )
+
+    def reshape(self, *shape: int) -> "Workloads":
+        """The same workloads with every array reshaped, e.g. flattened by reshape(-1)."""
+        return Workloads(
+            self.table,
+            *(getattr(self, field.name).reshape(shape) for field in fields(self)[1:]),
+        )
+
+    def tier_group(self) -> np.ndarray:
+        """
+        The (region, architecture) tier group of each workload, a row of the table's
+        tier arrays flattened to (regions * architectures, tiers).
+        """
+        return self.region_index * len(ARCHITECTURES) + self.architecture_index
+
+    def streaming_charges(self) -> np.ndarray:
+        """Monthly response streaming charges of each workload."""
+        return streaming_charges(
+            self.table,
+            self.region_index,
+            self.number_of_requests,
+            self.requests_per_month_multiplier,
+            self.workload_type,
+            self.response_size_in_mb,
+        )
+
+    def result(
+        self,
+        free_tier_compute_gb_sec: ArrayLike = FREE_TIER_COMPUTE_GB_SEC,
+        free_tier_requests: ArrayLike = FREE_TIER_REQUESTS,
+    ) -> BatchResult:
+        """
+        The charges of every workload along with each intermediate value, as columns.
+        The free tier of each workload is the whole monthly free tier by default.
+        """
+        compute, request, storage = self.charges(
+            None, free_tier_compute_gb_sec, free_tier_requests
+        )
+        streaming = self.streaming_charges()
+
+        r, a = self.region_index, self.architecture_index
+        edge = self.workload_type == EDGE
+        free = self.include_free_tier & ~edge
+        requests_per_month = np.floor(
+            self.number_of_requests * self.requests_per_month_multiplier
+        )
+        memory_in_gb = self.memory * self.memory_to_gb
+        storage_in_gb = self.ephemeral_storage * self.storage_to_gb
+        total_compute_sec = requests_per_month * (
+            self.duration_of_each_request_in_ms * 0.001
+        )
+        total_compute_gb_sec = memory_in_gb * total_compute_sec
+        free_tier_compute_gb_sec = np.where(
+            free, np.minimum(total_compute_gb_sec, free_tier_compute_gb_sec), 0.0
+        )
+        free_tier_requests = np.where(
+            free, np.minimum(requests_per_month, free_tier_requests), 0.0
+        )
+        billable_compute_gb_sec = total_compute_gb_sec - free_tier_compute_gb_sec
+
+        tier_thresholds = self.table.tier_thresholds[r, a]
+        tier_rates = np.concatenate(
+            [
+                self.table.tier_rates[r, a],
+                np.where(
+                    edge,
+                    self.table.edge_duration_rate[r],
+                    self.table.overflow_rate[r, a],
+                )[..., None],
+            ],
+            axis=-1,
+        )
+        tier_usage, tier_cost = tier_breakdown(
+            billable_compute_gb_sec,
+            tier_thresholds,
+            tier_rates[..., :-1],
+            tier_rates[..., -1],
+        )
+        if edge.any():
+            # Lambda@Edge duration is one flat rate, i.e. all overflow
+            flat = np.zeros_like(tier_usage)
+            flat[..., -1] = total_compute_gb_sec
+            tier_usage = np.where(edge[..., None], flat, tier_usage)
+            tier_cost = tier_usage * tier_rates
+
+        return BatchResult(
+            compute_charges=compute,
+            request_charges=request,
+            ephemeral_storage_charges=storage,
+            response_streaming_charges=streaming,
+            total_cost=compute + request + storage + streaming,
+            requests_per_month=requests_per_month,
+            memory_in_gb=memory_in_gb,
+            storage_in_gb=storage_in_gb,
+            total_compute_sec=total_compute_sec,
+            total_compute_gb_sec=total_compute_gb_sec,
+            free_tier_compute_gb_sec=free_tier_compute_gb_sec,
+            billable_compute_gb_sec=billable_compute_gb_sec,
+            free_tier_requests=free_tier_requests,
+            billable_requests=requests_per_month - free_tier_requests,
+            billable_ephemeral_storage_gb=np.where(
+                edge,
+                0.0,
+                np.maximum(storage_in_gb - FREE_EPHEMERAL_STORAGE_GB, 0.0),
+            ),
+            tier_thresholds=tier_thresholds,
+            tier_rates=tier_rates,
+            tier_usage_gb_sec=tier_usage,
+            tier_cost=tier_cost,
+        )
+
+
+def validate_workloads(workloads: Workloads) -> None:
+    """Validate encoded workloads against the rules enforced by CalculationRequest."""
+    validate_limits(
+        workloads.number_of_requests,
+        workloads.duration_of_each_request_in_ms,
+        workloads.memory,
+        workloads.memory_to_gb,
+        workloads.ephemeral_storage,
+        workloads.storage_to_gb,
+    )
+    if np.any(workloads.response_size_in_mb < 0):
+        raise ValueError("Response size must not be negative")
+    if np.any(
+        (workloads.workload_type == EDGE)
+        & (workloads.architecture_index != ARCHITECTURES.index("x86"))
+    ):
+        raise ValueError("Lambda@Edge only supports the x86 architecture")
+
+
+def encode_workloads(
+    region: ArrayLike = "us-east-1",
+    architecture: ArrayLike = "x86",
+    number_of_requests: ArrayLike = 1000000,
+    request_unit: ArrayLike = "per day",
+    duration_of_each_request_in_ms: ArrayLike = 1500,
+    memory: ArrayLike = 128,
+    memory_unit: ArrayLike = "MB",
+    ephemeral_storage: ArrayLike = 512,
+    storage_unit: ArrayLike = "MB",
+    include_free_tier: ArrayLike = True,
+    workload_type: ArrayLike = "standard",
+    response_size_in_mb: ArrayLike = 0,
+) -> Workloads:
+    """
+    @brief Encode and validate workloads given as scalars or arrays of calculate() arguments.
+    @return: The broadcast, encoded workloads along with the pricing table of their regions.
+    """
+    region = np.asarray(region)
+    regions = tuple(str(code) for code in np.unique(region))
+    table = load_pricing_table(regions)
+
+    workloads = Workloads(
+        table,
+        *np.broadcast_arrays(
+            encode(region, {code: i for i, code in enumerate(regions)}, "region"),
+            encode(
+                architecture,
+                {arch: i for i, arch in enumerate(ARCHITECTURES)},
+                "architecture",
+            ),
+            np.asarray(number_of_requests, dtype=float),
+            requests_per_month_multiplier(request_unit),
+            np.asarray(duration_of_each_request_in_ms, dtype=float),
+            np.asarray(memory, dtype=float),
+            unit_to_gb(memory_unit, "memory unit"),
+            np.asarray(ephemeral_storage, dtype=float),
+            unit_to_gb(storage_unit, "storage unit"),
+            np.asarray(include_free_tier, dtype=bool),
+            encode(
+                workload_type,
+                {kind: i for i, kind in enumerate(WORKLOAD_TYPES)},
+                "workload type",
+            ),
+            np.asarray(response_size_in_mb, dtype=float),
+        ),
+    )
+    validate_workloads(workloads)
+    return workloads
+
+
+def calculate_batch(
+    region: ArrayLike = "us-east-1",
+    architecture: ArrayLike = "x86",
+    number_of_requests: ArrayLike = 1000000,
+    request_unit: ArrayLike = "per day",
+    duration_of_each_request_in_ms: ArrayLike = 1500,
+    memory: ArrayLike = 128,
+    memory_unit: ArrayLike = "MB",
+    ephemeral_storage: ArrayLike = 512,
+    storage_unit: ArrayLike = "MB",
+    include_free_tier: ArrayLike = True,
+    workload_type: ArrayLike = "standard",
+    response_size_in_mb: ArrayLike = 0,
+) -> np.ndarray:
+    """
+    @brief Calculate the total monthly cost of many workloads at once.
+    Every argument takes the same values as calculate(), either as a scalar or an
+    array; arrays are broadcast against each other.
+    @return: The total monthly cost in USD of each workload.
+    """
+    workloads = encode_workloads(
+        region,
+        architecture,
+        number_of_requests,
+        request_unit,
+        duration_of_each_request_in_ms,
+        memory,
+        memory_unit,
+        ephemeral_storage,
+        storage_unit,
+        include_free_tier,
+        workload_type,
+        response_size_in_mb,
+    )
+    logger.debug(f"Pricing a batch of {workloads.region_index.size:,} workloads")
+
+    compute, request, storage = workloads.charges()
+    return compute + request + storage + workloads.streaming_charges()
+
+
+def calculate_batch_result(
+    region: ArrayLike = "us-east-1",
+    architecture: ArrayLike = "x86",
+    number_of_requests: ArrayLike = 1000000,
+    request_unit: ArrayLike = "per day",
+    duration_of_each_request_in_ms: ArrayLike = 1500,
+    memory: ArrayLike = 128,
+    memory_unit: ArrayLike = "MB",
+    ephemeral_storage: ArrayLike = 512,
+    storage_unit: ArrayLike = "MB",
+    include_free_tier: ArrayLike = True,
+    workload_type: ArrayLike = "standard",
+    response_size_in_mb: ArrayLike = 0,
+) -> BatchResult:
+    """
+    @brief Calculate the charges of many workloads at once, without building a result per workload.
+    Takes the same arguments as calculate_batch().
+    @return: The charges of each workload as columns, convertible to CalculationResult rows.
+    """
+    workloads = encode_workloads(
+        region,
+        architecture,
+        number_of_requests,
+        request_unit,
+        duration_of_each_request_in_ms,
+        memory,
+        memory_unit,
+        ephemeral_storage,
+        storage_unit,
+        include_free_tier,
+        workload_type,
+        response_size_in_mb,
+    )
+    logger.debug(f"Pricing a batch of {workloads.region_index.size:,} workloads")
+
+    return workloads.result()
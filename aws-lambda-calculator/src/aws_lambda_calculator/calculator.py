@@ -1,94 +1,146 @@
-import os
 from dotenv import load_dotenv
 import logging
-import json
-from .models import CalculationRequest, CalculationResult
-from typing import Literal, Any
+from functools import _CacheInfo, lru_cache
+from .exact import NANO_USD, monthly_charges_nanos, streaming_charges_nanos
+from .instrumentation import phase_timer
+from .models import (
+    CalculationRequest,
+    CalculationResult,
+    REQUEST_UNITS,
+    RequestUnit,
+    SIZE_UNITS,
+    SizeUnit,
+    TierUsage,
+    decode_unit,
+)
+from .pricing import (
+    FREE_STREAMED_RESPONSE_MB,
+    RegionPricing,
+    TierSchedule,
+    load_pricing,
+    load_pricing_as_of,
+)
+from datetime import date
+from typing import Any, Literal
 
 # Load environment variables from .env file
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+FREE_TIER_COMPUTE_GB_SEC = 400_000  # 400,000 GB-seconds per month
+FREE_TIER_REQUESTS = 1_000_000  # 1 million free requests per month
+FREE_EPHEMERAL_STORAGE_GB = 0.5  # no additional charges up to 512 MB
+MB_TO_GB = 0.0009765625
 
-def open_json_file(region: str) -> dict[str, Any]:
-    """Open a JSON file containing cost factors for a specific region."""
-    base_dir = os.path.dirname(__file__)
-    file_path = os.path.join(base_dir, "jsons", f"{region}.json")
-    if not os.path.exists(file_path):
-        logger.error(f"Cost factors file for region '{region}' not found.")
-        return {}
+# Bound of the memoized unit conversions, least recently used evicted
+CONVERSION_CACHE_SIZE = 1024
 
-    with open(file_path, "r") as file:
-        data = json.load(file)
-        logger.debug(f"Loaded cost factors for region '{region}': {data}")
-        return data
+# Multiplier turning a request rate in the given unit into requests per month (730 hours)
+REQUESTS_PER_MONTH = {
+    "per second": 60 * 60 * 730,
+    "per minute": 60 * 730,
+    "per hour": 730,
+    "per day": 730 / 24,
+    "per month": 1,
+    "million per month": 1_000_000,
+}
 
 
-def unit_conversion_requests(
-    number_of_requests: int, request_unit: str, steps: list[str]
-) -> int:
+def region_pricing(region: str, as_of: date | None = None) -> RegionPricing:
     """
-    @brief Convert number of requests based on the unit provided. Assuming 730 hours in a month (30 days). Assuming 24 hours in a day.
-    @param number_of_requests: The number of requests to convert.
-    @param request_unit: per second, per minute, per hour, per day, per month, million per month.
-    @return: The number of requests per month.
+    The cached pricing model of a region; a region without cost factors prices at zero.
+    With as_of, the snapshot in effect on that date, which must exist.
     """
+    if as_of is not None:
+        return load_pricing_as_of(region, as_of)
+    try:
+        return load_pricing(region)
+    except ValueError:
+        logger.error(f"Cost factors file for region '{region}' not found.")
+        return RegionPricing.from_cost_factors(region, {})
+
+
+@lru_cache(maxsize=CONVERSION_CACHE_SIZE, typed=True)
+def _convert_requests(number_of_requests: int, request_unit: str) -> tuple[int, str]:
     match request_unit:
         case "per second":
             msg = f"Number of requests: {number_of_requests:,} per second * (60 seconds in a minute * 60 minutes in an hour * 730 hours in a month) = {number_of_requests * (60 * 60 * 730):,} per month"
-            logger.debug(msg)
-            steps.append(msg)
-            return int(number_of_requests * (60 * 60 * 730))
+            return int(number_of_requests * (60 * 60 * 730)), msg
         case "per minute":
             msg = f"Number of requests: {number_of_requests:,} per minute * (60 minutes in an hour * 730 hours in a month) = {int(number_of_requests * (60 * 730)):,} per month"
-            logger.debug(msg)
-            steps.append(msg)
-            return int(number_of_requests * (60 * 730))
+            return int(number_of_requests * (60 * 730)), msg
         case "per hour":
             msg = f"Number of requests: {number_of_requests:,} per hour * (730 hours in a month) = {int(number_of_requests * 730):,} per month"
-            logger.debug(msg)
-            steps.append(msg)
-            return int(number_of_requests * (730))
+            return int(number_of_requests * (730)), msg
         case "per day":
             msg = f"Number of requests: {number_of_requests:,} per day * (730 hours in a month / 24 hours in a day) = {int(number_of_requests * (730 / 24)):,} per month"
-            logger.debug(msg)
-            steps.append(msg)
-            return int(number_of_requests * (730 / 24))
+            return int(number_of_requests * (730 / 24)), msg
         case "per month":
             msg = f"Number of requests: {int(number_of_requests):,} per month"
-            logger.debug(msg)
-            steps.append(msg)
-            return int(number_of_requests)
+            return int(number_of_requests), msg
         case "million per month":
             msg = f"Number of requests: {number_of_requests} million per month * 1,000,000 multiplier = {int(number_of_requests * 1000000):,} per month"
-            logger.debug(msg)
-            steps.append(msg)
-            return int(number_of_requests * 1000000)
+            return int(number_of_requests * 1000000), msg
         case _:
             raise ValueError(f"Unknown request unit: {request_unit}")
 
-    # Fallback return to satisfy static analysis; this line should be unreachable.
-    return 0
+
+def unit_conversion_requests(
+    number_of_requests: int, request_unit: str, steps: list[str]
+) -> int:
+    """
+    @brief Convert number of requests based on the unit provided. Assuming 730 hours in a month (30 days). Assuming 24 hours in a day.
+    Memoized per (number of requests, unit), see cache_stats().
+    @param number_of_requests: The number of requests to convert.
+    @param request_unit: per second, per minute, per hour, per day, per month, million per month.
+    @return: The number of requests per month.
+    """
+    requests_per_month, msg = _convert_requests(number_of_requests, request_unit)
+    logger.debug(msg)
+    steps.append(msg)
+    return requests_per_month
+
+
+@lru_cache(maxsize=CONVERSION_CACHE_SIZE, typed=True)
+def _convert_memory(memory: float, memory_unit: str) -> tuple[float, str | None]:
+    match memory_unit:
+        case "MB":
+            msg = f"Amount of memory allocated: {memory} MB * 0.0009765625 GB in MB = {memory * 0.0009765625} GB"
+            return memory * MB_TO_GB, msg
+        case "GB":
+            return memory, None
+        case _:
+            raise ValueError(f"Unknown memory unit: {memory_unit}")
 
 
 def unit_conversion_memory(memory: float, memory_unit: str, steps: list[str]) -> float:
     """
     @brief Convert memory based on the unit provided.
+    Memoized per (memory, unit), see cache_stats().
     @param memory: amount of memory.
     @param memory_unit: per MB, per GB.
     @return: The memory in GB.
     """
-    match memory_unit:
+    memory_in_gb, msg = _convert_memory(memory, memory_unit)
+    if msg is not None:
+        logger.debug(msg)
+        steps.append(msg)
+    return memory_in_gb
+
+
+@lru_cache(maxsize=CONVERSION_CACHE_SIZE, typed=True)
+def _convert_storage(
+    ephemeral_storage_mb: float, storage_unit: str
+) -> tuple[float, str | None]:
+    match storage_unit:
         case "MB":
-            msg = f"Amount of memory allocated: {memory} MB * 0.0009765625 GB in MB = {memory * 0.0009765625} GB"
-            logger.debug(msg)
-            steps.append(msg)
-            return memory * 0.0009765625
+            msg = f"Amount of ephemeral storage allocated: {ephemeral_storage_mb} MB * 0.0009765625 GB in MB = {ephemeral_storage_mb * 0.0009765625} GB"
+            return ephemeral_storage_mb * MB_TO_GB, msg
         case "GB":
-            return memory
+            return ephemeral_storage_mb, None
         case _:
-            raise ValueError(f"Unknown memory unit: {memory_unit}")
+            raise ValueError(f"Unknown storage unit: {storage_unit}")
 
 
 def unit_conversion_ephemeral_storage(
@@ -96,66 +148,90 @@ def unit_conversion_ephemeral_storage(
 ) -> float:
     """
     @brief Convert ephemeral storage based on the unit provided.
+    Memoized per (ephemeral storage, unit), see cache_stats().
     @param ephemeral_storage_mb: The ephemeral storage in MB.
     @param storage_unit: per MB, per GB.
     @return: The ephemeral storage in GB.
     """
-    match storage_unit:
-        case "MB":
-            msg = f"Amount of ephemeral storage allocated: {ephemeral_storage_mb} MB * 0.0009765625 GB in MB = {ephemeral_storage_mb * 0.0009765625} GB"
-            logger.debug(msg)
-            steps.append(msg)
-            return ephemeral_storage_mb * 0.0009765625
-        case "GB":
-            return ephemeral_storage_mb
-        case _:
-            raise ValueError(f"Unknown storage unit: {storage_unit}")
+    storage_in_gb, msg = _convert_storage(ephemeral_storage_mb, storage_unit)
+    if msg is not None:
+        logger.debug(msg)
+        steps.append(msg)
+    return storage_in_gb
+
+
+def cache_stats() -> dict[str, _CacheInfo]:
+    """Hits, misses and size of the unit conversion caches."""
+    return {
+        "requests": _convert_requests.cache_info(),
+        "memory": _convert_memory.cache_info(),
+        "ephemeral_storage": _convert_storage.cache_info(),
+    }
+
+
+def clear_caches() -> None:
+    """Empty the unit conversion caches."""
+    _convert_requests.cache_clear()
+    _convert_memory.cache_clear()
+    _convert_storage.cache_clear()
 
 
 def calculate_tiered_cost(
     total_compute_gb_sec: float,
-    tier_cost_factor: dict[str, float],
+    tier_cost_factor: dict[str, float] | TierSchedule,
     overflow_rate: float,
     steps: list[str],
+    tier_usage: list[TierUsage] | None = None,
 ) -> float:
     """
     total_compute_gb_sec: total usage in GB‑seconds
-    tier_cost_factor: maps breakpoint (as string) → rate
-    overflow_rate: per‑GB‑sec rate for usage beyond the highest breakpoint
+    tier_cost_factor: maps breakpoint (as string) → rate, or a TierSchedule built at load time
+    overflow_rate: per‑GB‑sec rate for usage beyond the highest breakpoint (a TierSchedule carries its own)
+    tier_usage: collects the usage and cost of each tier reached, when given
     """
-    # 1) parse & sort tiers by threshold (ascending)
-    tiers = sorted(
-        (int(thresh), float(rate)) for thresh, rate in tier_cost_factor.items()
+    # 1) a prebuilt schedule is used as is; a raw mapping is parsed & sorted here
+    schedule = (
+        tier_cost_factor
+        if isinstance(tier_cost_factor, TierSchedule)
+        else TierSchedule.from_cost_factor(tier_cost_factor, overflow_rate)
     )
+    total_cost = schedule.cost(total_compute_gb_sec)
+    tier = schedule.locate(total_compute_gb_sec)
 
-    total_cost = 0.0
+    # 2) render each tier up to the one holding the last unit of usage
     prev_threshold = 0.0
-
-    # 2) bill each tier up to its cap
-    for threshold, rate in tiers:
-        # how much usage falls into this slice?
+    for threshold, rate in schedule.tiers[: tier + 1]:
         usage_in_tier = min(total_compute_gb_sec, threshold) - prev_threshold
-        if usage_in_tier > 0:
-            total_cost += usage_in_tier * rate
-            prev_threshold += usage_in_tier
         msg = f"{usage_in_tier} GB-s x {rate:.8f} USD = {usage_in_tier * rate} USD"
         logger.debug(msg)
         steps.append(msg)
-
-        # once we've billed all the usage, early exit
-        if total_compute_gb_sec <= threshold:
-            msg = f"Total tier cost: {total_cost} USD (Monthly compute charges)"
+        if tier_usage is not None:
+            tier_usage.append(
+                TierUsage(
+                    up_to_gb_sec=threshold,
+                    rate=rate,
+                    usage_gb_sec=usage_in_tier,
+                    cost=usage_in_tier * rate,
+                )
+            )
+        prev_threshold = threshold
+
+    # 3) and any remaining usage above the highest threshold
+    if tier == len(schedule.thresholds):
+        remaining = total_compute_gb_sec - prev_threshold
+        if remaining > 0:
+            msg = f"{remaining} GB-s x {schedule.overflow_rate:.8f} USD = {remaining * schedule.overflow_rate} USD"
             logger.debug(msg)
             steps.append(msg)
-            return total_cost
-
-    # 3) bill any remaining usage above the highest threshold
-    remaining = total_compute_gb_sec - prev_threshold
-    if remaining > 0:
-        msg = f"{remaining} GB-s x {overflow_rate:.8f} USD = {remaining * overflow_rate} USD"
-        logger.debug(msg)
-        steps.append(msg)
-        total_cost += remaining * overflow_rate
+            if tier_usage is not None:
+                tier_usage.append(
+                    TierUsage(
+                        up_to_gb_sec=None,
+                        rate=schedule.overflow_rate,
+                        usage_gb_sec=remaining,
+                        cost=remaining * schedule.overflow_rate,
+                    )
+                )
 
     msg = f"Total tier cost: {total_cost} USD (Monthly compute charges)"
     logger.debug(msg)
@@ -167,15 +243,18 @@ def calc_monthly_compute_charges(
     requests_per_month: int,
     duration_of_each_request_in_ms: int,
     memory_in_gb: float,
-    tier_cost_factor: dict[str, float],
+    tier_cost_factor: dict[str, Any] | TierSchedule,
     include_free_tier: bool,
     steps: list[str],
+    tier_usage: list[TierUsage] | None = None,
 ) -> tuple[float, float, float]:
     """
     @brief Calculate the monthly compute charges based on requests per month, duration of each request in ms, and memory in GB.
     @param requests_per_month: The number of requests per month.
     @param duration_of_each_request_in_ms: The duration of each request in milliseconds.
     @param memory_in_gb: The amount of memory allocated in GB.
+    @param tier_cost_factor: The tier schedule, or the architecture's raw cost factors with its `Tier` and `OverflowRate`.
+    @param tier_usage: Collects the usage and cost of each tier reached, when given.
     @return: The monthly compute charges.
     """
     total_compute_sec = requests_per_month * (duration_of_each_request_in_ms * 0.001)
@@ -191,7 +270,7 @@ def calc_monthly_compute_charges(
     ## Apply free tier for compute if enabled
     billable_compute_gb_sec = total_compute_gb_sec
     if include_free_tier:
-        free_compute_gb_sec = 400_000  # 400,000 GB-seconds per month
+        free_compute_gb_sec = FREE_TIER_COMPUTE_GB_SEC
         billable_compute_gb_sec = max(0.0, total_compute_gb_sec - free_compute_gb_sec)
         msg = f"{total_compute_gb_sec:,.2f} GB-s - {free_compute_gb_sec:,} free tier GB-s = {billable_compute_gb_sec:,.2f} billable GB-s"
         steps.append(msg)
@@ -202,14 +281,45 @@ def calc_monthly_compute_charges(
     logger.debug(msg)
     steps.append(msg)
 
-    # anything above 15 B GB‑sec
-    overflow_rate = 0.0000133334
+    schedule = (
+        tier_cost_factor
+        if isinstance(tier_cost_factor, TierSchedule)
+        else TierSchedule.from_architecture(tier_cost_factor)
+    )
     monthly_compute_charges = calculate_tiered_cost(
-        billable_compute_gb_sec, tier_cost_factor, overflow_rate, steps
+        billable_compute_gb_sec, schedule, schedule.overflow_rate, steps, tier_usage
     )
     return total_compute_gb_sec, monthly_compute_charges, total_compute_sec
 
 
+def calc_monthly_edge_compute_charges(
+    requests_per_month: int,
+    duration_of_each_request_in_ms: int,
+    memory_in_gb: float,
+    edge_duration_cost_factor: float,
+    steps: list[str],
+) -> tuple[float, float, float]:
+    """
+    @brief Calculate the monthly compute charges of a Lambda@Edge function, billed at a flat rate without tiers or free tier.
+    @param edge_duration_cost_factor: The Lambda@Edge rate per GB-second.
+    @return: The total compute GB-seconds, the monthly compute charges and the total compute seconds.
+    """
+    total_compute_sec = requests_per_month * (duration_of_each_request_in_ms * 0.001)
+    msg = f"{requests_per_month} requests x {duration_of_each_request_in_ms} ms x 0.001 ms to sec conversion factor = {total_compute_sec} total compute (seconds)"
+    logger.debug(msg)
+    steps.append(msg)
+
+    total_compute_gb_sec = memory_in_gb * total_compute_sec
+    monthly_compute_charges = total_compute_gb_sec * edge_duration_cost_factor
+    msg = f"{memory_in_gb} GB x {total_compute_sec:,} seconds = {total_compute_gb_sec:,.2f} total compute (GB-s)"
+    logger.debug(msg)
+    steps.append(msg)
+    msg = f"{total_compute_gb_sec:,.2f} GB-s x {edge_duration_cost_factor:.8f} USD = {monthly_compute_charges} USD (Lambda@Edge compute charges)"
+    logger.debug(msg)
+    steps.append(msg)
+    return total_compute_gb_sec, monthly_compute_charges, total_compute_sec
+
+
 def calc_monthly_request_charges(
     requests_per_month: float,
     requests_cost_factor: float,
@@ -218,7 +328,7 @@ def calc_monthly_request_charges(
 ) -> float:
     billable_requests = requests_per_month
     if include_free_tier:
-        free_requests = 1_000_000  # 1 million free requests per month
+        free_requests = FREE_TIER_REQUESTS
         billable_requests = max(0, requests_per_month - free_requests)
         msg = f"{requests_per_month} requests - {free_requests} free tier requests = {billable_requests} monthly billable requests"
         steps.append(msg)
@@ -238,7 +348,7 @@ def calc_monthly_ephemeral_storage_charges(
     total_compute_sec: float,
     steps: list[str],
 ) -> float:
-    billable_storage = max(0.0, float(storage_in_gb) - 0.5)
+    billable_storage = max(0.0, float(storage_in_gb) - FREE_EPHEMERAL_STORAGE_GB)
     gb_s = billable_storage * total_compute_sec
     res = billable_storage * float(ephemeral_storage_cost_factor) * total_compute_sec
     msg = f"{storage_in_gb} GB - 0.5 GB (no additional charges) = {billable_storage} GB (billable ephemeral storage)"
@@ -254,6 +364,32 @@ def calc_monthly_ephemeral_storage_charges(
     return res
 
 
+def calc_monthly_streaming_charges(
+    requests_per_month: int,
+    response_size_in_mb: float,
+    streaming_cost_factor: float,
+    steps: list[str],
+) -> float:
+    """
+    @brief Calculate the monthly charges for the bytes streamed beyond the first 6 MB of each response.
+    @param response_size_in_mb: The average streamed response size per request in MB.
+    @param streaming_cost_factor: The rate per GB of streamed bytes.
+    @return: The monthly response streaming charges.
+    """
+    billable_mb = max(0.0, response_size_in_mb - FREE_STREAMED_RESPONSE_MB)
+    msg = f"{response_size_in_mb} MB - {FREE_STREAMED_RESPONSE_MB} MB (no additional charges) = {billable_mb} MB (billable streamed bytes per request)"
+    logger.debug(msg)
+    steps.append(msg)
+
+    streamed_gb = requests_per_month * billable_mb * MB_TO_GB
+    res = streamed_gb * streaming_cost_factor
+    if streamed_gb > 0.0:
+        msg = f"{requests_per_month} requests x {billable_mb} MB x 0.0009765625 GB in MB = {streamed_gb:,.2f} GB x {streaming_cost_factor:.8f} USD = {res} USD (monthly response streaming charges)"
+        logger.debug(msg)
+        steps.append(msg)
+    return res
+
+
 # Flow:
 #
 # 1. Detect the correct region
@@ -280,58 +416,84 @@ def calc_monthly_ephemeral_storage_charges(
 #  ## Monthly Ephemeral Storage Charges
 #   5.6 Calculate total storage GB-seconds based on ephemeral storage in GB and total duration seconds.
 #
+#  Lambda@Edge functions are billed at flat request and duration rates without free tier or
+#  ephemeral storage; streaming functions also pay for bytes streamed beyond 6 MB a response.
+#
 # 6. Calculate the total monthly cost by summing up the monthly compute charges, monthly request charges, and monthly ephemeral storage charges.
 def calculate(
     region: str = "us-east-1",
     architecture: Literal["x86", "arm64"] = "x86",
     number_of_requests: int = 1000000,
-    request_unit: Literal[
-        "per second",
-        "per minute",
-        "per hour",
-        "per day",
-        "per month",
-        "million per month",
-    ] = "per day",
+    request_unit: RequestUnit | int = "per day",
     duration_of_each_request_in_ms: int = 1500,
     memory: float = 128,
-    memory_unit: Literal["MB", "GB"] = "MB",
+    memory_unit: SizeUnit | int = "MB",
     ephemeral_storage: float = 512,
-    storage_unit: Literal["MB", "GB"] = "MB",
+    storage_unit: SizeUnit | int = "MB",
     include_free_tier: bool = True,
+    exact: bool = False,
+    workload_type: Literal["standard", "edge", "streaming"] = "standard",
+    response_size_in_mb: float = 0,
+    pricing_as_of: date | str | None = None,
 ) -> CalculationResult:
-    """Calculate the total cost of execution."""
+    """
+    Calculate the total cost of execution.
+    With exact=True the charges are computed in integer nano-dollars instead of floats.
+    workload_type prices a Lambda@Edge ("edge") or response-streaming ("streaming")
+    function, the latter streaming responses of response_size_in_mb on average.
+    pricing_as_of (a date or ISO date string) prices with the snapshot in effect on that
+    date, to reproduce past estimates.
+    Units may also be given as codes, their positions in REQUEST_UNITS and SIZE_UNITS.
+    """
+    timer = phase_timer()
 
-    # Validate inputs using pydantic
-    CalculationRequest(
+    if isinstance(pricing_as_of, str):
+        pricing_as_of = date.fromisoformat(pricing_as_of)
+
+    # Validate inputs using pydantic; limit checks are memoized per (value, unit)
+    request = CalculationRequest(
         region=region,
         architecture=architecture,
         number_of_requests=number_of_requests,
-        request_unit=request_unit,
+        request_unit=decode_unit(request_unit, REQUEST_UNITS, "request unit"),
         duration_of_each_request_in_ms=duration_of_each_request_in_ms,
         memory=memory,
-        memory_unit=memory_unit,
+        memory_unit=decode_unit(memory_unit, SIZE_UNITS, "memory unit"),
         ephemeral_storage=ephemeral_storage,
-        storage_unit=storage_unit,
+        storage_unit=decode_unit(storage_unit, SIZE_UNITS, "storage unit"),
         include_free_tier=include_free_tier,
+        workload_type=workload_type,
+        response_size_in_mb=response_size_in_mb,
+        pricing_as_of=pricing_as_of,
     )
+    request_unit = request.request_unit
+    memory_unit, storage_unit = request.memory_unit, request.storage_unit
+    if timer:
+        timer.lap("validation")
 
     steps: list[str] = []
 
     logger.info("Starting cost calculation...")
 
     # Step 2
-    cost_factors: dict = open_json_file(region)
+    pricing = region_pricing(region, request.pricing_as_of)
+    if request.pricing_as_of is not None:
+        msg = f"Pricing as of {request.pricing_as_of.isoformat()}"
+        logger.debug(msg)
+        steps.append(msg)
 
     # Step 3
-    requests_cost_factor = float(cost_factors.get("Requests", 0.0))
-    ephemeral_storage_cost_factor = float(cost_factors.get("EphemeralStorage", 0.0))
-    arch_config: dict = cost_factors.get(architecture, {})
-    if arch_config is None:
-        raise ValueError(f"Unknown architecture: {architecture}")
-
-    # memory_cost_factor = arch_config.get("Memory")
-    tier_cost_factor: dict = arch_config.get("Tier", {})
+    requests_cost_factor = pricing.requests_rate
+    ephemeral_storage_cost_factor = pricing.ephemeral_storage_rate
+    tier_schedule = pricing.schedule_for(architecture)
+    edge = workload_type == "edge"
+    if edge:
+        pricing.warn_fallback("EdgeRequests", "EdgeDuration")
+        requests_cost_factor = pricing.edge_requests_rate
+        ephemeral_storage_cost_factor = 0.0
+        include_free_tier = False
+    if timer:
+        timer.lap("pricing_load")
 
     # Step 4
     if request_unit != "per month" or memory_unit != "GB" or storage_unit != "GB":
@@ -344,47 +506,171 @@ def calculate(
     storage_in_gb = unit_conversion_ephemeral_storage(
         ephemeral_storage, storage_unit, steps
     )
+    if timer:
+        timer.lap("unit_conversion")
 
     # Step 5
     logger.debug("Pricing calculations:")
     steps.append("\nPricing calculations:")
-    total_compute_gb_sec, monthly_compute_charges, total_compute_sec = (
-        calc_monthly_compute_charges(
-            requests_per_month,
-            duration_of_each_request_in_ms,
-            memory_in_gb,
-            tier_cost_factor,
-            include_free_tier,
-            steps,
+    tier_usage: list[TierUsage] = []
+    if edge:
+        total_compute_gb_sec, monthly_compute_charges, total_compute_sec = (
+            calc_monthly_edge_compute_charges(
+                requests_per_month,
+                duration_of_each_request_in_ms,
+                memory_in_gb,
+                pricing.edge_duration_rate,
+                steps,
+            )
+        )
+        tier_usage.append(
+            TierUsage(
+                up_to_gb_sec=None,
+                rate=pricing.edge_duration_rate,
+                usage_gb_sec=total_compute_gb_sec,
+                cost=monthly_compute_charges,
+            )
+        )
+    else:
+        total_compute_gb_sec, monthly_compute_charges, total_compute_sec = (
+            calc_monthly_compute_charges(
+                requests_per_month,
+                duration_of_each_request_in_ms,
+                memory_in_gb,
+                tier_schedule,
+                include_free_tier,
+                steps,
+                tier_usage,
+            )
         )
-    )
     msg = f"Monthly compute charges: ${monthly_compute_charges:.4f} USD"
     logger.debug(msg)
     steps.append(f"{msg}\n")
+    if timer:
+        timer.lap("compute_charges")
     monthly_request_charges = calc_monthly_request_charges(
         requests_per_month, requests_cost_factor, include_free_tier, steps
     )
     msg = f"Monthly request charges: ${monthly_request_charges:.4f} USD"
     logger.debug(msg)
     steps.append(f"{msg}\n")
-    monthly_ephemeral_storage_charges = calc_monthly_ephemeral_storage_charges(
-        storage_in_gb, ephemeral_storage_cost_factor, total_compute_sec, steps
-    )
-    msg = f"Monthly ephemeral storage charges: ${monthly_ephemeral_storage_charges:.4f} USD"
-    logger.debug(msg)
-    steps.append(f"{msg}\n")
+    if timer:
+        timer.lap("request_charges")
+    if edge:
+        monthly_ephemeral_storage_charges = 0.0
+    else:
+        monthly_ephemeral_storage_charges = calc_monthly_ephemeral_storage_charges(
+            storage_in_gb, ephemeral_storage_cost_factor, total_compute_sec, steps
+        )
+        msg = f"Monthly ephemeral storage charges: ${monthly_ephemeral_storage_charges:.4f} USD"
+        logger.debug(msg)
+        steps.append(f"{msg}\n")
+    if timer:
+        timer.lap("storage_charges")
+    monthly_streaming_charges = 0.0
+    if workload_type == "streaming":
+        pricing.warn_fallback("ResponseStreaming")
+        monthly_streaming_charges = calc_monthly_streaming_charges(
+            requests_per_month,
+            response_size_in_mb,
+            pricing.response_streaming_rate,
+            steps,
+        )
+        msg = (
+            f"Monthly response streaming charges: ${monthly_streaming_charges:.4f} USD"
+        )
+        logger.debug(msg)
+        steps.append(f"{msg}\n")
+        if timer:
+            timer.lap("streaming_charges")
+    if exact:
+        charges_nanos: tuple[int, ...] = monthly_charges_nanos(
+            requests_per_month,
+            duration_of_each_request_in_ms,
+            memory,
+            memory_unit,
+            ephemeral_storage,
+            storage_unit,
+            # Lambda@Edge duration is one flat rate, i.e. all overflow
+            () if edge else tier_schedule.tiers,
+            pricing.edge_duration_rate if edge else tier_schedule.overflow_rate,
+            requests_cost_factor,
+            ephemeral_storage_cost_factor,
+            FREE_TIER_COMPUTE_GB_SEC if include_free_tier else 0,
+            FREE_TIER_REQUESTS if include_free_tier else 0,
+        )
+        if workload_type == "streaming":
+            charges_nanos += (
+                streaming_charges_nanos(
+                    requests_per_month,
+                    response_size_in_mb,
+                    pricing.response_streaming_rate,
+                ),
+            )
+        monthly_compute_charges = charges_nanos[0] / NANO_USD
+        monthly_request_charges = charges_nanos[1] / NANO_USD
+        monthly_ephemeral_storage_charges = charges_nanos[2] / NANO_USD
+        monthly_streaming_charges = sum(charges_nanos[3:]) / NANO_USD
+        msg = f"Exact charges: {' + '.join(f'{nanos:,}' for nanos in charges_nanos)} nano-USD"
+        logger.debug(msg)
+        steps.append(f"{msg}\n")
+        if timer:
+            timer.lap("exact_charges")
 
     # Step 6
     total = (
         monthly_compute_charges
         + monthly_request_charges
         + monthly_ephemeral_storage_charges
+        + monthly_streaming_charges
     )
-    msg = f"${monthly_compute_charges:.4f} USD + ${monthly_request_charges:.4f} USD + ${monthly_ephemeral_storage_charges:.4f} USD = ${total:.4f} USD"
+    if exact:
+        # one rounding instead of summing the float conversions
+        total = sum(charges_nanos) / NANO_USD
+    streaming_term = (
+        f" + ${monthly_streaming_charges:.4f} USD"
+        if workload_type == "streaming"
+        else ""
+    )
+    msg = f"${monthly_compute_charges:.4f} USD + ${monthly_request_charges:.4f} USD + ${monthly_ephemeral_storage_charges:.4f} USD{streaming_term} = ${total:.4f} USD"
     logger.debug(msg)
     steps.append(f"{msg}\n")
     msg = f"Lambda cost (monthly): ${total:.4f} USD"
     logger.debug(msg)
     steps.append(msg)
+    if timer:
+        timer.lap("step_rendering")
 
-    return CalculationResult(total_cost=total, calculation_steps=steps)
+    free_tier_compute_gb_sec = (
+        min(total_compute_gb_sec, FREE_TIER_COMPUTE_GB_SEC)
+        if include_free_tier
+        else 0.0
+    )
+    free_tier_requests = (
+        min(requests_per_month, FREE_TIER_REQUESTS) if include_free_tier else 0
+    )
+    result = CalculationResult(
+        total_cost=total,
+        total_cost_nano_usd=sum(charges_nanos) if exact else None,
+        calculation_steps=steps,
+        compute_charges=monthly_compute_charges,
+        request_charges=monthly_request_charges,
+        ephemeral_storage_charges=monthly_ephemeral_storage_charges,
+        response_streaming_charges=monthly_streaming_charges,
+        requests_per_month=requests_per_month,
+        memory_in_gb=memory_in_gb,
+        storage_in_gb=storage_in_gb,
+        total_compute_sec=total_compute_sec,
+        total_compute_gb_sec=total_compute_gb_sec,
+        free_tier_compute_gb_sec=free_tier_compute_gb_sec,
+        billable_compute_gb_sec=total_compute_gb_sec - free_tier_compute_gb_sec,
+        free_tier_requests=free_tier_requests,
+        billable_requests=requests_per_month - free_tier_requests,
+        billable_ephemeral_storage_gb=0.0
+        if edge
+        else max(0.0, storage_in_gb - FREE_EPHEMERAL_STORAGE_GB),
+        tiers=tier_usage,
+    )
+    if timer:
+        timer.lap("result_assembly")
+    return result
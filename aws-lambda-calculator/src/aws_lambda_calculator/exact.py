@@ -0,0 +1,132 @@
+from collections.abc import Sequence
+from decimal import Decimal
+
+from .pricing import FREE_STREAMED_RESPONSE_MB
+
+NANO_USD = 10**9  # nano-dollars per USD
+RATE_SCALE = 10**12  # rates are held as integer pico-dollars per unit
+
+UNIT_TO_GB_RATIO = {"MB": (1, 1024), "GB": (1, 1)}
+
+
+def ratio(value: float | str) -> tuple[int, int]:
+    """The value as written in decimal, as an exact (numerator, denominator) pair."""
+    return Decimal(str(value)).as_integer_ratio()
+
+
+def to_pico(rate: float | str) -> int:
+    """A per-unit rate in integer pico-dollars, rounded half up beyond 12 decimals."""
+    numerator, denominator = ratio(rate)
+    return round_half_up(numerator * RATE_SCALE, denominator)
+
+
+def round_half_up(numerator: int, denominator: int) -> int:
+    """Integer division of non-negative integers, rounding halves up."""
+    return (2 * numerator + denominator) // (2 * denominator)
+
+
+def tiered_cost_nanos(
+    usage: tuple[int, int],
+    tiers: Sequence[tuple[int, int]],
+    overflow_rate: int,
+) -> int:
+    """
+    @brief Exact calculate_tiered_cost in integer arithmetic.
+    @param usage: Billable GB-seconds as (numerator, denominator).
+    @param tiers: ((breakpoint GB-s, pico-dollars per GB-s), ...) sorted by breakpoint.
+    @param overflow_rate: Pico-dollars per GB-s beyond the highest breakpoint.
+    @return: The tiered cost in nano-dollars.
+    """
+    usage_numerator, usage_denominator = usage
+    total = 0  # pico-dollars x usage_denominator
+    billed = 0
+    for threshold, rate in tiers:
+        usage_in_tier = min(usage_numerator, threshold * usage_denominator) - billed
+        if usage_in_tier <= 0:
+            break
+        total += usage_in_tier * rate
+        billed += usage_in_tier
+    total += max(usage_numerator - billed, 0) * overflow_rate
+    return round_half_up(total * NANO_USD, usage_denominator * RATE_SCALE)
+
+
+def monthly_charges_nanos(
+    requests_per_month: int,
+    duration_of_each_request_in_ms: float,
+    memory: float,
+    memory_unit: str,
+    ephemeral_storage: float,
+    storage_unit: str,
+    tiers: Sequence[tuple[float, float]],
+    overflow_rate: float,
+    requests_cost_factor: float | str,
+    ephemeral_storage_cost_factor: float | str,
+    free_compute_gb_sec: int = 0,
+    free_requests: int = 0,
+) -> tuple[int, int, int]:
+    """
+    @brief Price a workload with scaled integers instead of binary floats.
+    Inputs and rates are taken at their exact decimal value; each charge is rounded once,
+    to the nearest nano-dollar.
+    @param free_compute_gb_sec, free_requests: The free tier to deduct, if any.
+    @return: Monthly compute, request and ephemeral storage charges in nano-dollars.
+    """
+    duration_numerator, duration_denominator = ratio(duration_of_each_request_in_ms)
+    # total compute seconds = requests x duration / 1000
+    seconds = (requests_per_month * duration_numerator, duration_denominator * 1000)
+
+    memory_numerator, memory_denominator = ratio(memory)
+    to_gb_numerator, to_gb_denominator = UNIT_TO_GB_RATIO[memory_unit]
+    gb_sec_numerator = seconds[0] * memory_numerator * to_gb_numerator
+    gb_sec_denominator = seconds[1] * memory_denominator * to_gb_denominator
+    gb_sec_numerator = max(
+        gb_sec_numerator - free_compute_gb_sec * gb_sec_denominator, 0
+    )
+    compute = tiered_cost_nanos(
+        (gb_sec_numerator, gb_sec_denominator),
+        sorted((int(threshold), to_pico(rate)) for threshold, rate in tiers),
+        to_pico(overflow_rate),
+    )
+
+    billable_requests = max(requests_per_month - free_requests, 0)
+    request = round_half_up(
+        billable_requests * to_pico(requests_cost_factor) * NANO_USD, RATE_SCALE
+    )
+
+    storage_numerator, storage_denominator = ratio(ephemeral_storage)
+    to_gb_numerator, to_gb_denominator = UNIT_TO_GB_RATIO[storage_unit]
+    storage_denominator *= to_gb_denominator
+    # billable GB = storage - 0.5 GB free
+    billable_numerator = max(
+        2 * storage_numerator * to_gb_numerator - storage_denominator, 0
+    )
+    storage = round_half_up(
+        billable_numerator
+        * seconds[0]
+        * to_pico(ephemeral_storage_cost_factor)
+        * NANO_USD,
+        2 * storage_denominator * seconds[1] * RATE_SCALE,
+    )
+    return compute, request, storage
+
+
+def streaming_charges_nanos(
+    requests_per_month: int,
+    response_size_in_mb: float,
+    streaming_cost_factor: float | str,
+) -> int:
+    """
+    @brief Exact response streaming charges for the bytes beyond the first 6 MB of each response.
+    @return: The monthly response streaming charges in nano-dollars.
+    """
+    size_numerator, size_denominator = ratio(response_size_in_mb)
+    billable_numerator = max(
+        size_numerator - FREE_STREAMED_RESPONSE_MB * size_denominator, 0
+    )
+    return round_half_up(
+        requests_per_month
+        * billable_numerator
+        * to_pico(streaming_cost_factor)
+        * NANO_USD,
+        size_denominator * 1024 * RATE_SCALE,
+    )
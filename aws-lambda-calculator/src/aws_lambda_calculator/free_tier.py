@@ -0,0 +1,195 @@
+import logging
+from collections.abc import Sequence
+from dataclasses import replace
+from typing import Literal
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from .batch import EDGE, Workloads, encode_workloads, pooled_tier_breakdown
+from .calculator import FREE_TIER_COMPUTE_GB_SEC, FREE_TIER_REQUESTS
+from .pricing import ARCHITECTURES
+from .results import BatchResult
+
+logger = logging.getLogger(__name__)
+
+FreeTierPolicy = Literal["pro-rata", "largest-first", "by-architecture"]
+FREE_TIER_POLICIES: tuple[FreeTierPolicy, ...] = (
+    "pro-rata",
+    "largest-first",
+    "by-architecture",
+)
+
+
+def _pro_rata(usage: np.ndarray, allowance: ArrayLike) -> np.ndarray:
+    """Each month's allowance, up to the usage, in proportion to each function's usage."""
+    total = usage.sum(axis=0)
+    granted = np.minimum(total, allowance)
+    return usage * np.divide(
+        granted, total, out=np.zeros_like(granted), where=total > 0
+    )
+
+
+def allocate_free_tier(
+    usage: ArrayLike,
+    allowance: float,
+    policy: FreeTierPolicy = "pro-rata",
+    architecture_index: ArrayLike | None = None,
+    architecture_order: Sequence[str] = ARCHITECTURES,
+) -> np.ndarray:
+    """
+    @brief Share one monthly free tier allowance between the functions of an account.
+    Every month gets the whole allowance; within a month it covers at most the usage of
+    the account, split by the policy:
+    - "pro-rata": in proportion to each function's usage.
+    - "largest-first": the functions with the most usage first, each in full; ties go
+      to the earlier function. The only policy that sorts.
+    - "by-architecture": the architectures in `architecture_order` first, pro-rata
+      within one. x86 goes first by default since its GB-s rate is the higher one.
+    @param usage: GB-seconds or requests per function, shape (functions,) or
+        (functions, months).
+    @param allowance: The free tier per month, e.g. FREE_TIER_COMPUTE_GB_SEC.
+    @param architecture_index: Index into ARCHITECTURES of each function, broadcast
+        against usage; required by "by-architecture".
+    @return: The free usage of each function, with the shape of usage. It never exceeds
+        the function's usage and each month sums to min(account usage, allowance).
+    """
+    usage = np.asarray(usage, dtype=float)
+    if np.any(usage < 0):
+        raise ValueError("Usage must not be negative")
+
+    if policy == "pro-rata":
+        return _pro_rata(usage, allowance)
+
+    if policy == "largest-first":
+        order = np.argsort(-usage, axis=0, kind="stable")
+        ranked = np.take_along_axis(usage, order, axis=0)
+        before = np.cumsum(ranked, axis=0) - ranked
+        free = np.empty_like(usage)
+        np.put_along_axis(free, order, np.clip(allowance - before, 0.0, ranked), axis=0)
+        return free
+
+    if policy == "by-architecture":
+        if architecture_index is None:
+            raise ValueError(
+                "The by-architecture policy needs each function's architecture"
+            )
+        architecture_index = np.broadcast_to(architecture_index, usage.shape)
+        free = np.zeros_like(usage)
+        remaining = np.full(usage.shape[1:], float(allowance))
+        for arch in architecture_order:
+            if arch not in ARCHITECTURES:
+                raise ValueError(f"Unknown architecture: {arch}")
+            selected = np.where(
+                architecture_index == ARCHITECTURES.index(arch), usage, 0.0
+            )
+            free += _pro_rata(selected, remaining)
+            remaining = remaining - np.minimum(selected.sum(axis=0), remaining)
+        return free
+
+    raise ValueError(f"Unknown free tier policy: {policy}")
+
+
+def calculate_account(
+    region: ArrayLike = "us-east-1",
+    architecture: ArrayLike = "x86",
+    number_of_requests: ArrayLike = 1000000,
+    request_unit: ArrayLike = "per day",
+    duration_of_each_request_in_ms: ArrayLike = 1500,
+    memory: ArrayLike = 128,
+    memory_unit: ArrayLike = "MB",
+    ephemeral_storage: ArrayLike = 512,
+    storage_unit: ArrayLike = "MB",
+    include_free_tier: ArrayLike = True,
+    workload_type: ArrayLike = "standard",
+    response_size_in_mb: ArrayLike = 0,
+    free_tier_policy: FreeTierPolicy = "pro-rata",
+) -> BatchResult:
+    """
+    @brief Price the functions of one account with a single free tier shared between them.
+    calculate_batch() grants every workload the whole free tier, so the sum over an
+    account counts it once per function. Here the first axis is the account's functions
+    and any further axis its months; each month's free GB-seconds and requests are
+    split by free_tier_policy, see allocate_free_tier(). Functions without the free
+    tier (include_free_tier=False, Lambda@Edge) draw nothing from it. As in aggregate(),
+    each month's billable GB-seconds are summed per (region, architecture) before the
+    tiers are applied, and each tier is attributed back in proportion to the functions'
+    billable GB-seconds.
+    Takes the same arguments as calculate_batch().
+    @return: The charges of each function and month, with the free tier each one got;
+        they sum to the account's bill.
+    """
+    workloads = encode_workloads(
+        region,
+        architecture,
+        number_of_requests,
+        request_unit,
+        duration_of_each_request_in_ms,
+        memory,
+        memory_unit,
+        ephemeral_storage,
+        storage_unit,
+        include_free_tier,
+        workload_type,
+        response_size_in_mb,
+    )
+    if workloads.region_index.ndim == 0:
+        raise ValueError("An account needs at least one array of functions")
+    return price_account(workloads, free_tier_policy)
+
+
+def price_account(
+    workloads: Workloads, free_tier_policy: FreeTierPolicy = "pro-rata"
+) -> BatchResult:
+    """
+    @brief The pricing engine of calculate_account() and aggregate(), on encoded workloads.
+    @param workloads: The account's functions along the first axis, months along any other.
+    @return: The charges of each function and month, see calculate_account().
+    """
+    logger.debug(
+        f"Sharing the free tier between {workloads.region_index.shape[0]:,} functions"
+    )
+
+    eligible = workloads.include_free_tier & (workloads.workload_type != EDGE)
+    requests_per_month = np.floor(
+        workloads.number_of_requests * workloads.requests_per_month_multiplier
+    )
+    total_compute_gb_sec = (
+        requests_per_month
+        * (workloads.duration_of_each_request_in_ms * 0.001)
+        * (workloads.memory * workloads.memory_to_gb)
+    )
+    free_gb_sec = allocate_free_tier(
+        np.where(eligible, total_compute_gb_sec, 0.0),
+        FREE_TIER_COMPUTE_GB_SEC,
+        free_tier_policy,
+        workloads.architecture_index,
+    )
+    free_requests = allocate_free_tier(
+        np.where(eligible, requests_per_month, 0.0),
+        FREE_TIER_REQUESTS,
+        free_tier_policy,
+        workloads.architecture_index,
+    )
+    result = workloads.result(free_gb_sec, free_requests)
+
+    # Lambda@Edge duration is one flat rate, priced the same with or without pooling
+    edge = workloads.workload_type == EDGE
+    tier_usage, tier_cost = pooled_tier_breakdown(
+        workloads.table,
+        workloads.tier_group(),
+        np.where(edge, 0.0, result.billable_compute_gb_sec),
+    )
+    tier_usage = np.where(edge[..., None], result.tier_usage_gb_sec, tier_usage)
+    tier_cost = np.where(edge[..., None], result.tier_cost, tier_cost)
+    compute = tier_cost.sum(axis=-1)
+    return replace(
+        result,
+        compute_charges=compute,
+        total_cost=compute
+        + result.request_charges
+        + result.ephemeral_storage_charges
+        + result.response_streaming_charges,
+        tier_usage_gb_sec=tier_usage,
+        tier_cost=tier_cost,
+    )
@@ -0,0 +1,135 @@
+import bisect
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Protocol
+
+# Phases timed by calculate(), in the order they run
+PHASES = (
+    "validation",
+    "pricing_load",
+    "unit_conversion",
+    "compute_charges",
+    "request_charges",
+    "storage_charges",
+    "streaming_charges",  # response-streaming workloads only
+    "exact_charges",  # exact=True only
+    "step_rendering",
+    "result_assembly",
+)
+
+# Upper bounds of the histogram buckets, in seconds: 1 µs doubling up to ~8.4 s
+DEFAULT_BUCKETS = tuple(1e-6 * 2**k for k in range(24))
+
+
+class MetricsSink(Protocol):
+    """Receives the duration of each timed phase."""
+
+    def record(self, phase: str, seconds: float) -> None: ...
+
+
+class CallbackSink:
+    """Adapts a plain `callback(phase, seconds)` function to a metrics sink."""
+
+    __slots__ = ("callback",)
+
+    def __init__(self, callback: Callable[[str, float], None]) -> None:
+        self.callback = callback
+
+    def record(self, phase: str, seconds: float) -> None:
+        self.callback(phase, seconds)
+
+
+class HistogramSink:
+    """In-memory aggregator keeping a latency histogram per phase."""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.buckets = buckets
+        # phase -> counts per bucket, the last one counting values above every bound
+        self.counts: dict[str, list[int]] = {}
+        self.totals: dict[str, float] = {}
+        self.maximums: dict[str, float] = {}
+
+    def record(self, phase: str, seconds: float) -> None:
+        counts = self.counts.get(phase)
+        if counts is None:
+            counts = self.counts[phase] = [0] * (len(self.buckets) + 1)
+            self.totals[phase] = 0.0
+            self.maximums[phase] = 0.0
+        counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.totals[phase] += seconds
+        self.maximums[phase] = max(self.maximums[phase], seconds)
+
+    def quantile(self, phase: str, q: float) -> float:
+        """Upper bound of the bucket holding the q-quantile of a phase's durations."""
+        counts = self.counts[phase]
+        rank = q * sum(counts)
+        seen = 0
+        for bound, count in zip(self.buckets, counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return self.maximums[phase]
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Count, total, mean, p50, p99 and max of every recorded phase, in seconds."""
+        summary = {}
+        for phase, counts in self.counts.items():
+            count = sum(counts)
+            summary[phase] = {
+                "count": count,
+                "total": self.totals[phase],
+                "mean": self.totals[phase] / count,
+                "p50": self.quantile(phase, 0.5),
+                "p99": self.quantile(phase, 0.99),
+                "max": self.maximums[phase],
+            }
+        return summary
+
+
+_sink: ContextVar[MetricsSink | None] = ContextVar("metrics_sink", default=None)
+
+
+@contextmanager
+def instrument(
+    sink: MetricsSink | Callable[[str, float], None] | None = None,
+) -> Iterator[MetricsSink]:
+    """
+    @brief Time the phases of every calculate() call made inside the block.
+    @param sink: A metrics sink or a `callback(phase, seconds)`; defaults to a new HistogramSink.
+    @return: The active sink.
+    """
+    active: MetricsSink
+    if sink is None:
+        active = HistogramSink()
+    elif hasattr(sink, "record"):
+        active = sink
+    else:
+        active = CallbackSink(sink)
+    token = _sink.set(active)
+    try:
+        yield active
+    finally:
+        _sink.reset(token)
+
+
+class PhaseTimer:
+    """Reports the time elapsed since the previous lap to the sink."""
+
+    __slots__ = ("last", "sink")
+
+    def __init__(self, sink: MetricsSink) -> None:
+        self.sink = sink
+        self.last = time.perf_counter()
+
+    def lap(self, phase: str) -> None:
+        now = time.perf_counter()
+        self.sink.record(phase, now - self.last)
+        self.last = now
+
+
+def phase_timer() -> PhaseTimer | None:
+    """A timer bound to the active sink, or None when instrumentation is off."""
+    sink = _sink.get()
+    return None if sink is None else PhaseTimer(sink)
@@ -0,0 +1,154 @@
+import logging
+from dataclasses import dataclass
+from functools import cache
+from typing import Literal
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from .batch import encode_workloads
+from .pricing import ARCHITECTURES, load_pricing
+
+logger = logging.getLogger(__name__)
+
+MAX_MEMORY_MB = 10240
+MemoryRounding = Literal["snap", "interpolate"]
+
+
+@cache
+def memory_price_lookup(
+    regions: tuple[str, ...], rounding: MemoryRounding = "interpolate"
+) -> np.ndarray:
+    """
+    @brief Expand the Memory tables of several regions into dense per-MB price arrays.
+    @param regions: The AWS region codes, in the order of the pricing table.
+    @param rounding: "interpolate" prices a size linearly between the listed sizes, close
+        to its exact per-MB price; "snap" opts into the next listed size up.
+    @return: USD per ms, shape (regions, architectures, MAX_MEMORY_MB + 1), indexed by whole MB.
+    """
+    if rounding not in ("snap", "interpolate"):
+        raise ValueError(f"Unknown memory rounding: {rounding}")
+
+    megabytes = np.arange(MAX_MEMORY_MB + 1)
+    lookup = np.zeros((len(regions), len(ARCHITECTURES), MAX_MEMORY_MB + 1))
+    for r, region in enumerate(regions):
+        pricing = load_pricing(region)
+        for a, arch in enumerate(ARCHITECTURES):
+            listed = pricing.memory_prices_for(arch)
+            if not listed:
+                continue
+            sizes, prices = (np.array(column) for column in zip(*listed))
+            if rounding == "snap":
+                index = np.searchsorted(sizes, megabytes, side="left")
+                lookup[r, a] = prices[np.minimum(index, len(sizes) - 1)]
+            else:
+                lookup[r, a] = np.interp(megabytes, sizes, prices)
+    return lookup
+
+
+@dataclass(frozen=True, slots=True)
+class MemoryPricingResult:
+    """Costs from the Memory table, next to the GB-s tier engine's for the same workloads."""
+
+    total_cost: np.ndarray
+    tier_total_cost: np.ndarray
+
+    @property
+    def discrepancy(self) -> np.ndarray:
+        """Relative difference of the Memory table cost from the tier engine cost."""
+        return np.divide(
+            self.total_cost - self.tier_total_cost,
+            self.tier_total_cost,
+            out=np.zeros_like(self.total_cost),
+            where=self.tier_total_cost != 0,
+        )
+
+
+def calculate_by_memory(
+    region: ArrayLike = "us-east-1",
+    architecture: ArrayLike = "x86",
+    number_of_requests: ArrayLike = 1000000,
+    request_unit: ArrayLike = "per day",
+    duration_of_each_request_in_ms: ArrayLike = 1500,
+    memory: ArrayLike = 128,
+    memory_unit: ArrayLike = "MB",
+    ephemeral_storage: ArrayLike = 512,
+    storage_unit: ArrayLike = "MB",
+    include_free_tier: ArrayLike = True,
+    rounding: MemoryRounding = "interpolate",
+) -> MemoryPricingResult:
+    """
+    @brief Price workloads by the per-ms Memory table instead of the GB-s tiers.
+    The Memory table lists first-tier prices, so the two engines agree up to the rounding
+    of the listed prices for usage within the first tier and diverge beyond it.
+    Takes the same arguments as calculate_batch().
+    @param rounding: How memory sizes between the listed ones are priced, see memory_price_lookup().
+    @return: The total monthly cost of each workload under both engines.
+    """
+    workloads = encode_workloads(
+        region,
+        architecture,
+        number_of_requests,
+        request_unit,
+        duration_of_each_request_in_ms,
+        memory,
+        memory_unit,
+        ephemeral_storage,
+        storage_unit,
+        include_free_tier,
+    )
+    lookup = memory_price_lookup(workloads.table.regions, rounding)
+    compute, request, storage = workloads.charges(lookup)
+    tier_compute = workloads.charges()[0]
+
+    result = MemoryPricingResult(
+        total_cost=compute + request + storage,
+        tier_total_cost=tier_compute + request + storage,
+    )
+    logger.debug(
+        f"Memory table vs tier engine: max discrepancy {np.abs(result.discrepancy).max(initial=0.0):.4%}"
+    )
+    return result
+
+
+@dataclass(frozen=True, slots=True)
+class MemoryPriceDiscrepancy:
+    """A listed per-ms price that differs from the first GB-s tier rate."""
+
+    region: str
+    architecture: str
+    memory_mb: float
+    listed_price_per_ms: float
+    tier_price_per_ms: float
+
+    @property
+    def relative_difference(self) -> float:
+        return (
+            self.listed_price_per_ms - self.tier_price_per_ms
+        ) / self.tier_price_per_ms
+
+
+def cross_check(
+    regions: tuple[str, ...], tolerance: float = 0.01
+) -> list[MemoryPriceDiscrepancy]:
+    """
+    @brief Compare every listed Memory price with the first GB-s tier rate at that size.
+    @param regions: The AWS region codes to check.
+    @param tolerance: The largest relative difference that is not reported.
+    @return: The listed prices off by more than the tolerance, largest difference first.
+    """
+    discrepancies = []
+    for region in regions:
+        pricing = load_pricing(region)
+        for arch in ARCHITECTURES:
+            tiers = pricing.tiers_for(arch)
+            if not tiers:
+                continue
+            first_rate = tiers[0][1]
+            for size, price in pricing.memory_prices_for(arch):
+                expected = first_rate * size / 1024 / 1000
+                if expected and abs(price - expected) > tolerance * expected:
+                    discrepancies.append(
+                        MemoryPriceDiscrepancy(region, arch, size, price, expected)
+                    )
+    return sorted(discrepancies, key=lambda d: -abs(d.relative_difference))
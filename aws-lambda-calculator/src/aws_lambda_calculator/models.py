@@ -1,5 +1,35 @@
-from pydantic import BaseModel, Field, model_validator
-from typing import Literal
+from datetime import date
+from pydantic import (
+    BaseModel,
+    Field,
+    ValidationInfo,
+    field_validator,
+    model_validator,
+)
+from typing import Any, Literal, get_args
+
+RequestUnit = Literal[
+    "per second",
+    "per minute",
+    "per hour",
+    "per day",
+    "per month",
+    "million per month",
+]
+SizeUnit = Literal["MB", "GB"]
+
+# Units in code order: a pre-encoded unit is its position in these tuples
+REQUEST_UNITS: tuple[str, ...] = get_args(RequestUnit)
+SIZE_UNITS: tuple[str, ...] = get_args(SizeUnit)
+
+
+def decode_unit(value: Any, units: tuple[str, ...], name: str) -> Any:
+    """Turn a unit code into the unit's name; names and other values pass through."""
+    if isinstance(value, int) and not isinstance(value, bool):
+        if not 0 <= value < len(units):
+            raise ValueError(f"Unknown {name} code: {value}")
+        return units[value]
+    return value
 
 
 class CalculationRequest(BaseModel):
@@ -15,14 +45,10 @@ class CalculationRequest(BaseModel):
         default=1000000, gt=0, description="Number of Lambda requests"
     )
 
-    request_unit: Literal[
-        "per second",
-        "per minute",
-        "per hour",
-        "per day",
-        "per month",
-        "million per month",
-    ] = Field(default="per day", description="Unit for number of requests")
+    request_unit: RequestUnit = Field(
+        default="per day",
+        description="Unit for number of requests, or its code (position in REQUEST_UNITS)",
+    )
 
     duration_of_each_request_in_ms: int = Field(
         default=1500, gt=0, description="Duration of each request in milliseconds"
@@ -32,53 +58,194 @@ class CalculationRequest(BaseModel):
         default=128, gt=0, description="Memory allocated to Lambda function"
     )
 
-    memory_unit: Literal["MB", "GB"] = Field(
-        default="MB", description="Unit for memory allocation"
+    memory_unit: SizeUnit = Field(
+        default="MB",
+        description="Unit for memory allocation, or its code (position in SIZE_UNITS)",
     )
 
     ephemeral_storage: float = Field(
         default=512, gt=0, description="Ephemeral storage allocated to Lambda function"
     )
 
-    storage_unit: Literal["MB", "GB"] = Field(
-        default="MB", description="Unit for ephemeral storage"
+    storage_unit: SizeUnit = Field(
+        default="MB",
+        description="Unit for ephemeral storage, or its code (position in SIZE_UNITS)",
     )
 
     include_free_tier: bool = Field(
         default=True, description="Whether to include AWS Lambda free tier benefits"
     )
 
+    workload_type: Literal["standard", "edge", "streaming"] = Field(
+        default="standard",
+        description="Regular function, Lambda@Edge function or response-streaming function",
+    )
+
+    response_size_in_mb: float = Field(
+        default=0,
+        ge=0,
+        description="Average streamed response size per request, for streaming workloads",
+    )
+
+    pricing_as_of: date | None = Field(
+        default=None,
+        description="Price with the snapshot in effect on this date instead of the current pricing",
+    )
+
+    @field_validator("request_unit", mode="before")
+    @classmethod
+    def decode_request_unit(cls, value: Any) -> Any:
+        """Accept pre-encoded request units."""
+        return decode_unit(value, REQUEST_UNITS, "request unit")
+
+    @field_validator("memory_unit", "storage_unit", mode="before")
+    @classmethod
+    def decode_size_unit(cls, value: Any, info: ValidationInfo) -> Any:
+        """Accept pre-encoded memory and storage units."""
+        return decode_unit(value, SIZE_UNITS, str(info.field_name).replace("_", " "))
+
     @model_validator(mode="after")
     def validate_aws_lambda_limits(self) -> "CalculationRequest":
         """Validate memory and ephemeral storage are within AWS Lambda limits."""
         # Validate memory
-        if self.memory_unit == "MB":
-            if self.memory < 128 or self.memory > 10240:
-                raise ValueError("Memory must be between 128 MB and 10,240 MB")
-        elif self.memory_unit == "GB":
-            if self.memory < 0.125 or self.memory > 10.24:
-                raise ValueError("Memory must be between 0.125 GB and 10.24 GB")
+        if self.memory_unit == "MB" and not 128 <= self.memory <= 10240:
+            raise ValueError("Memory must be between 128 MB and 10,240 MB")
+        if self.memory_unit == "GB" and not 0.125 <= self.memory <= 10.24:
+            raise ValueError("Memory must be between 0.125 GB and 10.24 GB")
 
         # Validate ephemeral storage
-        if self.storage_unit == "MB":
-            if self.ephemeral_storage < 512 or self.ephemeral_storage > 10240:
-                raise ValueError(
-                    "Ephemeral storage must be between 512 MB and 10,240 MB"
-                )
-        elif self.storage_unit == "GB":
-            if self.ephemeral_storage < 0.5 or self.ephemeral_storage > 10.24:
-                raise ValueError(
-                    "Ephemeral storage must be between 0.5 GB and 10.24 GB"
-                )
+        if self.storage_unit == "MB" and not 512 <= self.ephemeral_storage <= 10240:
+            raise ValueError("Ephemeral storage must be between 512 MB and 10,240 MB")
+        if self.storage_unit == "GB" and not 0.5 <= self.ephemeral_storage <= 10.24:
+            raise ValueError("Ephemeral storage must be between 0.5 GB and 10.24 GB")
+
+        # Validate Lambda@Edge architecture
+        if self.workload_type == "edge" and self.architecture != "x86":
+            raise ValueError("Lambda@Edge only supports the x86 architecture")
 
         return self
 
 
+class TierUsage(BaseModel):
+    """Pydantic model for the usage and cost of one compute pricing tier."""
+
+    up_to_gb_sec: float | None = Field(
+        description="Upper breakpoint of the tier in GB-s, None beyond the last breakpoint"
+    )
+
+    rate: float = Field(description="Price per GB-s in USD")
+
+    usage_gb_sec: float = Field(description="Billable GB-s priced in this tier")
+
+    cost: float = Field(description="Cost of the usage in this tier in USD")
+
+
 class CalculationResult(BaseModel):
     """Pydantic model for AWS Lambda cost calculation result."""
 
     total_cost: float = Field(description="Total monthly cost in USD")
 
+    compute_charges: float | None = Field(
+        default=None, description="Monthly compute charges in USD"
+    )
+
+    request_charges: float | None = Field(
+        default=None, description="Monthly request charges in USD"
+    )
+
+    ephemeral_storage_charges: float | None = Field(
+        default=None, description="Monthly ephemeral storage charges in USD"
+    )
+
+    response_streaming_charges: float | None = Field(
+        default=None, description="Monthly response streaming charges in USD"
+    )
+
+    requests_per_month: int | None = Field(
+        default=None, description="Number of requests per month"
+    )
+
+    memory_in_gb: float | None = Field(default=None, description="Memory in GB")
+
+    storage_in_gb: float | None = Field(
+        default=None, description="Ephemeral storage in GB"
+    )
+
+    total_compute_sec: float | None = Field(
+        default=None, description="Total compute time per month in seconds"
+    )
+
+    total_compute_gb_sec: float | None = Field(
+        default=None, description="Total compute per month in GB-s"
+    )
+
+    free_tier_compute_gb_sec: float | None = Field(
+        default=None, description="GB-s deducted by the free tier"
+    )
+
+    billable_compute_gb_sec: float | None = Field(
+        default=None, description="GB-s left to bill after the free tier"
+    )
+
+    free_tier_requests: int | None = Field(
+        default=None, description="Requests deducted by the free tier"
+    )
+
+    billable_requests: int | None = Field(
+        default=None, description="Requests left to bill after the free tier"
+    )
+
+    billable_ephemeral_storage_gb: float | None = Field(
+        default=None, description="Ephemeral storage billed beyond the free 0.5 GB"
+    )
+
+    tiers: list[TierUsage] | None = Field(
+        default=None, description="Usage and cost of each compute pricing tier reached"
+    )
+
+    total_cost_nano_usd: int | None = Field(
+        default=None,
+        description="Exact total monthly cost in nano-USD, when calculated with exact=True",
+    )
+
     calculation_steps: list[str] = Field(
         description="Step-by-step calculation breakdown"
     )
+
+
+class SolveResult(BaseModel):
+    """Pydantic model for the result of inverting the cost for a given budget."""
+
+    unknown: Literal["requests", "duration", "memory"] = Field(
+        description="The input that was solved for"
+    )
+
+    value: float = Field(
+        description="Largest value of the unknown whose monthly cost stays within the budget"
+    )
+
+    unit: str = Field(
+        description="Unit of the solved value (request unit, ms or memory unit)"
+    )
+
+    budget: float = Field(description="Monthly budget in USD")
+
+
+class SimulationResult(BaseModel):
+    """Pydantic model for a Monte Carlo distribution of the monthly cost."""
+
+    samples: int = Field(description="Number of simulated months")
+
+    seed: int = Field(description="Seed that reproduces this simulation")
+
+    mean: float = Field(description="Mean monthly cost in USD")
+
+    percentiles: dict[str, float] = Field(
+        description="Monthly cost in USD at each requested percentile, e.g. p50"
+    )
+
+    histogram_edges: list[float] = Field(
+        description="Bin edges of the monthly cost histogram in USD"
+    )
+
+    histogram_counts: list[int] = Field(description="Number of samples in each bin")
@@ -0,0 +1,294 @@
+import os
+import json
+import logging
+from bisect import bisect_left
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from datetime import date
+from functools import cache
+from typing import Any
+
+from .regions import load_region_index
+from .snapshots import content_digest, load_index, load_snapshot
+
+logger = logging.getLogger(__name__)
+
+JSONS_DIR = os.path.join(os.path.dirname(__file__), "jsons")
+ARCHITECTURES = ("x86", "arm64")
+
+# Per-GB-second rate beyond the highest tier breakpoint, for cost factors without an
+# `OverflowRate` (the x86 us-east-1 rate)
+OVERFLOW_RATE = 0.0000133334
+
+# Provisioned concurrency and SnapStart rates for cost factors scraped before these SKUs
+# were extracted (the us-east-1 rates)
+PROVISIONED_CONCURRENCY_RATES = {"x86": 0.0000041667, "arm64": 0.0000033334}  # per GB-s
+PROVISIONED_DURATION_RATES = {"x86": 0.0000097222, "arm64": 0.0000077778}  # per GB-s
+SNAPSTART_CACHE_RATE = 0.0000015046  # per GB-s of cached snapshot
+SNAPSTART_RESTORE_RATE = 0.0001397998  # per GB restored
+
+# Lambda@Edge and response streaming rates for cost factors scraped before these SKUs
+# were extracted
+EDGE_REQUESTS_RATE = 0.0000006  # per request
+EDGE_DURATION_RATE = 0.00005001  # per GB-s
+RESPONSE_STREAMING_RATE = 0.008  # per GB streamed beyond the first 6 MB of a response
+FREE_STREAMED_RESPONSE_MB = 6
+
+# The region the fallback rates above were read from; other regions missing a rate are
+# priced at them, with a warning when a quote bills one, until their cost factors are
+# scraped again
+FALLBACK_REGION = "us-east-1"
+ARCHITECTURE_RATES = ("ProvisionedConcurrency", "ProvisionedDuration")
+REGION_RATES = (
+    "SnapStartCache",
+    "SnapStartRestore",
+    "EdgeRequests",
+    "EdgeDuration",
+    "ResponseStreaming",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class TierSchedule:
+    """
+    A tier schedule prepared for O(log n) lookups: sorted breakpoints, the rate of each
+    tier and the cumulative cost at each breakpoint.
+    """
+
+    thresholds: tuple[float, ...]  # ascending breakpoints in GB-s
+    rates: tuple[float, ...]  # rate of the tier ending at each breakpoint
+    cumulative: tuple[float, ...]  # cost of all usage up to each breakpoint
+    overflow_rate: float
+
+    @classmethod
+    def from_tiers(
+        cls, tiers: Iterable[tuple[float, float]], overflow_rate: float
+    ) -> "TierSchedule":
+        """Build the schedule from (breakpoint, rate) pairs in any order."""
+        thresholds, rates, cumulative = [], [], []
+        total = lower = 0.0
+        for threshold, rate in sorted(tiers):
+            total += (threshold - lower) * rate
+            thresholds.append(threshold)
+            rates.append(rate)
+            cumulative.append(total)
+            lower = threshold
+        return cls(tuple(thresholds), tuple(rates), tuple(cumulative), overflow_rate)
+
+    @classmethod
+    def from_cost_factor(
+        cls, tier_cost_factor: Mapping[str, Any], overflow_rate: float
+    ) -> "TierSchedule":
+        """Build the schedule from a `Tier` mapping of breakpoint strings to rates."""
+        return cls.from_tiers(
+            (
+                (float(int(threshold)), float(rate))
+                for threshold, rate in tier_cost_factor.items()
+            ),
+            overflow_rate,
+        )
+
+    @classmethod
+    def from_architecture(cls, cost_factors: Mapping[str, Any]) -> "TierSchedule":
+        """Build the schedule from an architecture's `Tier` and `OverflowRate` factors."""
+        return cls.from_cost_factor(
+            cost_factors.get("Tier", {}),
+            float(cost_factors.get("OverflowRate", OVERFLOW_RATE)),
+        )
+
+    @property
+    def tiers(self) -> tuple[tuple[float, float], ...]:
+        """The (breakpoint, rate) pairs, sorted by breakpoint."""
+        return tuple(zip(self.thresholds, self.rates))
+
+    def locate(self, usage: float) -> int:
+        """Index of the tier billing the last unit of usage; len(thresholds) is the overflow."""
+        return bisect_left(self.thresholds, usage)
+
+    def cost(self, usage: float) -> float:
+        """Tiered cost of a usage in GB-s: one binary search plus one multiply-add."""
+        if usage <= 0:
+            return 0.0
+        i = self.locate(usage)
+        lower = self.thresholds[i - 1] if i else 0.0
+        base = self.cumulative[i - 1] if i else 0.0
+        rate = self.rates[i] if i < len(self.rates) else self.overflow_rate
+        return base + (usage - lower) * rate
+
+    def usage_for(self, cost: float) -> float:
+        """The usage in GB-s whose tiered cost is `cost`, the inverse of cost()."""
+        if cost <= 0:
+            return 0.0
+        i = bisect_left(self.cumulative, cost)
+        lower = self.thresholds[i - 1] if i else 0.0
+        base = self.cumulative[i - 1] if i else 0.0
+        rate = self.rates[i] if i < len(self.rates) else self.overflow_rate
+        if rate <= 0:
+            return float("inf")
+        return lower + (cost - base) / rate
+
+
+@dataclass(frozen=True, slots=True)
+class RegionPricing:
+    """Parsed cost factors for a single region, ready for repeated use."""
+
+    region: str
+    requests_rate: float
+    ephemeral_storage_rate: float
+    # architecture -> tier schedule, built once when the region is loaded
+    schedules: dict[str, TierSchedule]
+    # architecture -> ((memory size MB, USD per ms), ...) sorted by size
+    memory_prices: dict[str, tuple[tuple[float, float], ...]]
+    # architecture -> USD per GB-s of configured provisioned concurrency
+    provisioned_concurrency_rates: dict[str, float]
+    # architecture -> USD per GB-s of duration served by provisioned concurrency
+    provisioned_duration_rates: dict[str, float]
+    snapstart_cache_rate: float
+    snapstart_restore_rate: float
+    edge_requests_rate: float
+    edge_duration_rate: float
+    response_streaming_rate: float
+    # cost factors missing from the region's JSON, priced at the us-east-1 rates
+    fallback_rates: tuple[str, ...] = ()
+
+    @classmethod
+    def from_cost_factors(cls, region: str, data: Mapping[str, Any]) -> "RegionPricing":
+        """Build the pricing model from the raw contents of `jsons/<region>.json`."""
+        schedules = {
+            arch: TierSchedule.from_architecture(data.get(arch, {}))
+            for arch in ARCHITECTURES
+        }
+        memory_prices = {
+            arch: tuple(
+                sorted(
+                    (float(size), float(price))
+                    for size, price in data.get(arch, {}).get("Memory", {}).items()
+                )
+            )
+            for arch in ARCHITECTURES
+        }
+        provisioned_concurrency_rates = {
+            arch: float(
+                data.get(arch, {}).get(
+                    "ProvisionedConcurrency", PROVISIONED_CONCURRENCY_RATES[arch]
+                )
+            )
+            for arch in ARCHITECTURES
+        }
+        provisioned_duration_rates = {
+            arch: float(
+                data.get(arch, {}).get(
+                    "ProvisionedDuration", PROVISIONED_DURATION_RATES[arch]
+                )
+            )
+            for arch in ARCHITECTURES
+        }
+        fallback_rates: tuple[str, ...] = ()
+        if region != FALLBACK_REGION:
+            fallback_rates = tuple(
+                f"{arch}.{key}"
+                for arch in ARCHITECTURES
+                for key in ARCHITECTURE_RATES
+                if key not in data.get(arch, {})
+            ) + tuple(key for key in REGION_RATES if key not in data)
+        return cls(
+            region=region,
+            requests_rate=float(data.get("Requests", 0.0)),
+            ephemeral_storage_rate=float(data.get("EphemeralStorage", 0.0)),
+            schedules=schedules,
+            memory_prices=memory_prices,
+            provisioned_concurrency_rates=provisioned_concurrency_rates,
+            provisioned_duration_rates=provisioned_duration_rates,
+            snapstart_cache_rate=float(
+                data.get("SnapStartCache", SNAPSTART_CACHE_RATE)
+            ),
+            snapstart_restore_rate=float(
+                data.get("SnapStartRestore", SNAPSTART_RESTORE_RATE)
+            ),
+            edge_requests_rate=float(data.get("EdgeRequests", EDGE_REQUESTS_RATE)),
+            edge_duration_rate=float(data.get("EdgeDuration", EDGE_DURATION_RATE)),
+            response_streaming_rate=float(
+                data.get("ResponseStreaming", RESPONSE_STREAMING_RATE)
+            ),
+            fallback_rates=fallback_rates,
+        )
+
+    def warn_fallback(self, *rates: str) -> None:
+        """Warn about those of `rates` priced at the fallback rates, before billing them."""
+        missing = tuple(rate for rate in rates if rate in self.fallback_rates)
+        if missing:
+            warn_fallback_rates(self.region, missing)
+
+    def schedule_for(self, architecture: str) -> TierSchedule:
+        """Return the tier schedule of an architecture."""
+        if architecture not in self.schedules:
+            raise ValueError(f"Unknown architecture: {architecture}")
+        return self.schedules[architecture]
+
+    def tiers_for(self, architecture: str) -> tuple[tuple[float, float], ...]:
+        """Return the sorted (breakpoint, rate) pairs of an architecture."""
+        return self.schedule_for(architecture).tiers
+
+    def memory_prices_for(self, architecture: str) -> tuple[tuple[float, float], ...]:
+        """Return the sorted (memory size MB, USD per ms) pairs of an architecture."""
+        if architecture not in self.memory_prices:
+            raise ValueError(f"Unknown architecture: {architecture}")
+        return self.memory_prices[architecture]
+
+
+@cache
+def warn_fallback_rates(region: str, rates: tuple[str, ...]) -> None:
+    """
+    @brief Warn once per process that a region's quotes bill rates it was not scraped with.
+    @param region: The AWS region code, e.g. eu-west-1.
+    @param rates: The missing cost factors, e.g. EdgeRequests or x86.ProvisionedDuration.
+    """
+    logger.warning(
+        f"No {', '.join(rates)} rates scraped for region '{region}', "
+        f"pricing them at the {FALLBACK_REGION} rates"
+    )
+
+
+@cache
+def load_pricing(region: str) -> RegionPricing:
+    """
+    @brief Load and parse the cost factors of a region once per process.
+    @param region: The AWS region code, e.g. us-east-1.
+    @return: The cached pricing model of the region.
+    """
+    info = load_region_index().get(region)
+    with open(os.path.join(os.path.dirname(JSONS_DIR), info.file), "r") as file:
+        data = json.load(file)
+    logger.debug(f"Loaded pricing model for region '{region}'")
+    return RegionPricing.from_cost_factors(region, data)
+
+
+@cache
+def pricing_version(region: str) -> str:
+    """
+    @brief Identify the current cost factors of a region, e.g. to tag cached quotes.
+    @param region: The AWS region code, e.g. us-east-1.
+    @return: The content digest of its cost factors, as filed in the snapshot store.
+    """
+    info = load_region_index().get(region)
+    with open(os.path.join(os.path.dirname(JSONS_DIR), info.file), "r") as file:
+        return content_digest(json.load(file))
+
+
+@cache
+def load_pricing_as_of(region: str, as_of: date) -> RegionPricing:
+    """
+    @brief Load the cost factors of a region in effect on a past date.
+    Dates resolve to a content digest through the cached snapshot index, and every
+    digest is parsed once, so a historical lookup costs the same as load_pricing().
+    @param region: The AWS region code, e.g. us-east-1.
+    @param as_of: The date to price at.
+    @return: The cached pricing model of the region's snapshot.
+    """
+    return _load_snapshot_pricing(region, load_index().digest_for(region, as_of))
+
+
+@cache
+def _load_snapshot_pricing(region: str, digest: str) -> RegionPricing:
+    logger.debug(f"Loaded pricing snapshot {digest[:12]} for region '{region}'")
+    return RegionPricing.from_cost_factors(region, load_snapshot(digest))
@@ -0,0 +1,332 @@
+import argparse
+import csv
+import json
+import logging
+import os
+import sys
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, replace
+from datetime import date
+from typing import Any, TextIO
+
+import numpy as np
+
+from .batch import WORKLOAD_COLUMNS, Workloads, encode_workloads
+from .pricing import JSONS_DIR, RegionPricing
+from .pricing_table import build_pricing_table
+from .regions import load_region_index
+from .snapshots import SNAPSHOTS_DIR, load_index, load_snapshot
+
+logger = logging.getLogger(__name__)
+
+# Region code -> raw cost factors, as in `jsons/<region>.json`
+PricingSource = Mapping[str, Mapping[str, Any]]
+
+NUMERIC_COLUMNS = {
+    "number_of_requests",
+    "duration_of_each_request_in_ms",
+    "memory",
+    "ephemeral_storage",
+    "response_size_in_mb",
+}
+
+
+def jsons_source(directory: str = JSONS_DIR) -> dict[str, dict[str, Any]]:
+    """The cost factors of every region in a directory of region JSONs, e.g. a fresh scrape."""
+    source = {}
+    for name in sorted(os.listdir(directory)):
+        if name.endswith(".json"):
+            with open(os.path.join(directory, name), "r") as file:
+                source[name.removesuffix(".json")] = json.load(file)
+    return source
+
+
+def current_source() -> dict[str, dict[str, Any]]:
+    """The committed cost factors of every region in the region index."""
+    source = {}
+    for info in load_region_index():
+        with open(os.path.join(os.path.dirname(JSONS_DIR), info.file), "r") as file:
+            source[info.code] = json.load(file)
+    return source
+
+
+def snapshot_source(
+    as_of: date, directory: str = SNAPSHOTS_DIR
+) -> dict[str, dict[str, Any]]:
+    """The cost factors of every region in effect on a date, from the snapshot store."""
+    index = load_index(directory)
+    source = {}
+    for region, (dates, _) in index.histories.items():
+        if dates[0] <= as_of.isoformat():
+            source[region] = load_snapshot(index.digest_for(region, as_of), directory)
+    return source
+
+
+def load_source(spec: str) -> dict[str, dict[str, Any]]:
+    """A pricing source from the command line: an ISO date, a directory or `current`."""
+    if spec == "current":
+        return current_source()
+    if os.path.isdir(spec):
+        return jsons_source(spec)
+    try:
+        as_of = date.fromisoformat(spec)
+    except ValueError:
+        raise ValueError(
+            f"Unknown pricing source: {spec} (expected a date, a directory or 'current')"
+        ) from None
+    return snapshot_source(as_of)
+
+
+@dataclass(frozen=True, slots=True)
+class FieldChange:
+    """One cost factor that differs between two pricing sources."""
+
+    region: str
+    field: str  # dotted path, e.g. x86.Tier.6000000000
+    old: str | None  # None when the field was added
+    new: str | None  # None when the field was removed
+
+    @property
+    def relative_change(self) -> float | None:
+        """(new - old) / old for numeric fields present in both sources."""
+        if self.old is None or self.new is None:
+            return None
+        try:
+            old, new = float(self.old), float(self.new)
+        except ValueError:
+            return None
+        return (new - old) / old if old else None
+
+
+def region_code(region: str, *sources: PricingSource) -> str:
+    """
+    The code of a region given by code, location name or alias; codes the index does not
+    know yet, e.g. in a fresh scrape, are accepted when a source has them.
+    """
+    try:
+        return load_region_index().resolve(region).code
+    except ValueError:
+        if any(region in source for source in sources):
+            return region
+        raise
+
+
+def _flatten(data: Mapping[str, Any], prefix: str = "") -> dict[str, str]:
+    fields = {}
+    for key, value in data.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, Mapping):
+            fields.update(_flatten(value, f"{path}."))
+        else:
+            fields[path] = str(value)
+    return fields
+
+
+def diff_fields(
+    old: PricingSource, new: PricingSource, regions: Iterable[str] | None = None
+) -> list[FieldChange]:
+    """
+    @brief List the cost factors that differ between two pricing sources.
+    In a full-table diff, regions only in one source are reported field by field as
+    added or removed.
+    @param regions: The regions to compare, which both sources must have; defaults to
+        every region of either source.
+    @return: The changed fields, sorted by region and field.
+    """
+    full_table = regions is None
+    if regions is None:
+        regions = set(old) | set(new)
+    changes = []
+    for region in sorted(regions):
+        if not full_table and (region not in old or region not in new):
+            raise ValueError(f"Unknown region: {region}")
+        old_fields = _flatten(old.get(region, {}))
+        new_fields = _flatten(new.get(region, {}))
+        for field in sorted(set(old_fields) | set(new_fields)):
+            if old_fields.get(field) != new_fields.get(field):
+                changes.append(
+                    FieldChange(
+                        region, field, old_fields.get(field), new_fields.get(field)
+                    )
+                )
+    return changes
+
+
+def read_workloads(lines: Iterable[str]) -> tuple[list[str], dict[str, np.ndarray]]:
+    """
+    @brief Read a workload file: one CSV row per function, named in a `function` column.
+    Other columns take calculate() argument names; missing ones take its defaults.
+    @param lines: An open file or any iterable of CSV lines.
+    @return: The function names and the calculate_batch() arguments as arrays.
+    """
+    reader = csv.DictReader(lines)
+    fieldnames = list(reader.fieldnames or ())
+    if "function" not in fieldnames:
+        raise ValueError("Missing CSV columns: function")
+    unknown = set(fieldnames) - set(WORKLOAD_COLUMNS) - {"function"}
+    if unknown:
+        raise ValueError(f"Unknown CSV columns: {', '.join(sorted(unknown))}")
+
+    rows = list(reader)
+    if not rows:
+        raise ValueError("The workload file is empty")
+    columns = {}
+    for column, default in WORKLOAD_COLUMNS.items():
+        if column not in fieldnames:
+            columns[column] = np.asarray(default)
+        elif column in NUMERIC_COLUMNS:
+            columns[column] = np.array([row[column] for row in rows], dtype=float)
+        elif column == "include_free_tier":
+            columns[column] = np.array(
+                [row[column].strip().lower() == "true" for row in rows]
+            )
+        else:
+            columns[column] = np.array([row[column] for row in rows])
+    return [row["function"] for row in rows], columns
+
+
+def reprice(workloads: Workloads, source: PricingSource) -> np.ndarray:
+    """
+    @brief Price encoded workloads with the cost factors of another pricing source.
+    @return: The total monthly cost of each workload under that source.
+    """
+    models = []
+    for region in workloads.table.regions:
+        if region not in source:
+            raise ValueError(f"Unknown region: {region}")
+        models.append(RegionPricing.from_cost_factors(region, source[region]))
+    repriced = replace(workloads, table=build_pricing_table(models))
+    compute, request, storage = repriced.charges()
+    return compute + request + storage + repriced.streaming_charges()
+
+
+@dataclass(frozen=True, slots=True)
+class RepricingResult:
+    """Per-workload costs under two pricing sources, ordered by the size of the change."""
+
+    functions: list[str]
+    old_cost: np.ndarray
+    new_cost: np.ndarray
+
+    @property
+    def delta(self) -> np.ndarray:
+        return self.new_cost - self.old_cost
+
+    @property
+    def relative_delta(self) -> np.ndarray:
+        return np.divide(
+            self.delta,
+            self.old_cost,
+            out=np.zeros_like(self.delta),
+            where=self.old_cost != 0,
+        )
+
+
+def reprice_workloads(
+    functions: list[str],
+    columns: Mapping[str, Any],
+    old: PricingSource,
+    new: PricingSource,
+) -> RepricingResult:
+    """
+    @brief Price the same workloads under two pricing sources through the batch path.
+    @param functions, columns: A workload file, see read_workloads().
+    @return: Both costs of each workload, largest absolute change first.
+    """
+    workloads = encode_workloads(**columns)
+    logger.debug(f"Repricing {workloads.region_index.size:,} workloads")
+    old_cost = np.broadcast_to(reprice(workloads, old), (len(functions),))
+    new_cost = np.broadcast_to(reprice(workloads, new), (len(functions),))
+
+    order = np.argsort(-np.abs(new_cost - old_cost), kind="stable")
+    return RepricingResult(
+        functions=[functions[i] for i in order],
+        old_cost=old_cost[order],
+        new_cost=new_cost[order],
+    )
+
+
+def write_deltas(result: RepricingResult, file: TextIO) -> None:
+    """Write the per-workload costs and changes as CSV, in the order of the result."""
+    writer = csv.writer(file)
+    writer.writerow(["function", "old_cost", "new_cost", "delta", "relative_delta"])
+    for row in zip(
+        result.functions,
+        result.old_cost,
+        result.new_cost,
+        result.delta,
+        result.relative_delta,
+    ):
+        writer.writerow([row[0], *(f"{value:.6f}" for value in row[1:])])
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Compare AWS Lambda pricing between two snapshots, regions or scrapes"
+    )
+    parser.add_argument(
+        "old", help="Old pricing: an ISO date, a directory of region JSONs or 'current'"
+    )
+    parser.add_argument("new", help="New pricing, in the same forms")
+    parser.add_argument(
+        "--regions",
+        nargs=2,
+        metavar=("OLD_REGION", "NEW_REGION"),
+        help="Compare two regions instead, pricing every workload in each",
+    )
+    parser.add_argument(
+        "--workloads", type=argparse.FileType("r"), help="Workload CSV to reprice"
+    )
+    parser.add_argument(
+        "--output",
+        type=argparse.FileType("w"),
+        default=sys.stdout,
+        help="Where to write the workload deltas (default: stdout)",
+    )
+    args = parser.parse_args(argv)
+
+    old, new = load_source(args.old), load_source(args.new)
+    functions, columns = read_workloads(args.workloads) if args.workloads else ([], {})
+    if args.regions:
+        old_region, new_region = (
+            region_code(region, old, new) for region in args.regions
+        )
+        for region, source, spec in (
+            (old_region, old, args.old),
+            (new_region, new, args.new),
+        ):
+            if region not in source:
+                raise ValueError(f"Unknown region: {region} (not in {spec})")
+        changes = [
+            replace(change, region=f"{old_region} -> {new_region}")
+            for change in diff_fields(
+                {"": old[old_region]}, {"": new[new_region]}, [""]
+            )
+        ]
+        if functions:
+            # every workload runs in the compared region under each source
+            old = {old_region: old[old_region]}
+            new = {old_region: new[new_region]}
+            columns = {**columns, "region": np.asarray(old_region)}
+    else:
+        changes = diff_fields(old, new)
+
+    # keep the field report out of the deltas when both would go to stdout
+    report = sys.stderr if functions and args.output is sys.stdout else sys.stdout
+    for change in changes:
+        relative = change.relative_change
+        suffix = f" ({relative:+.2%})" if relative is not None else ""
+        print(
+            f"{change.region} {change.field}: {change.old} -> {change.new}{suffix}",
+            file=report,
+        )
+    if not changes:
+        print("No pricing changes", file=report)
+
+    if functions:
+        write_deltas(reprice_workloads(functions, columns, old, new), args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
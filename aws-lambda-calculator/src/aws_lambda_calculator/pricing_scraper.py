@@ -2,6 +2,7 @@ import argparse
 import json
 import requests
 from os import path as os_path
+from regions import write_region_index
 from screenshotter import scrape_memory_prices as get_memory_prices
 
 URL = "https://pricing.us-east-1.amazonaws.com/offers/v1.0/aws/AWSLambda/current/index.json"
@@ -74,6 +75,68 @@ def get_tier_and_overflow(region_data: dict, arch: str) -> tuple[dict, str]:
     return tier, overflow
 
 
+def get_flat_rate(region_data: dict, usage_type: str) -> str | None:
+    """
+    Return the price of a single-rate SKU by the suffix of its usagetype,
+    e.g. Lambda-Provisioned-Concurrency or Lambda-Provisioned-GB-Second-ARM.
+    """
+    for sku, prod in region_data["products"].items():
+        if prod["attributes"].get("usagetype", "").endswith(usage_type):
+            for term in region_data["terms"].get(sku, {}).values():
+                for dim in term["priceDimensions"].values():
+                    return dim["pricePerUnit"]["USD"]
+    return None
+
+
+def get_provisioned_rates(region_data: dict, arch: str) -> dict[str, str]:
+    """
+    Build the ProvisionedConcurrency and ProvisionedDuration rates (USD per GB-second)
+    for x86 or arm64, leaving out the ones the region does not offer.
+    """
+    suffix = "-ARM" if arch == "arm64" else ""
+    rates = {
+        "ProvisionedConcurrency": get_flat_rate(
+            region_data, "Lambda-Provisioned-Concurrency" + suffix
+        ),
+        "ProvisionedDuration": get_flat_rate(
+            region_data, "Lambda-Provisioned-GB-Second" + suffix
+        ),
+    }
+    return {key: rate for key, rate in rates.items() if rate is not None}
+
+
+def get_snapstart_rates(region_data: dict) -> dict[str, str]:
+    """
+    Build the SnapStartCache (USD per GB-second) and SnapStartRestore (USD per GB)
+    rates, leaving out the ones the region does not offer.
+    """
+    rates = {}
+    for sku, prod in region_data["products"].items():
+        usg = prod["attributes"].get("usagetype", "")
+        if "SnapStart" not in usg:
+            continue
+        key = "SnapStartCache" if "Cache" in usg else "SnapStartRestore"
+        for term in region_data["terms"].get(sku, {}).values():
+            for dim in term["priceDimensions"].values():
+                rates[key] = dim["pricePerUnit"]["USD"]
+    return rates
+
+
+def get_edge_and_streaming_rates(region_data: dict) -> dict[str, str]:
+    """
+    Build the EdgeRequests (USD per request), EdgeDuration (USD per GB-second) and
+    ResponseStreaming (USD per GB) rates, leaving out the ones the region does not offer.
+    """
+    rates = {
+        "EdgeRequests": get_flat_rate(region_data, "Lambda-Edge-Request"),
+        "EdgeDuration": get_flat_rate(region_data, "Lambda-Edge-GB-Second"),
+        "ResponseStreaming": get_flat_rate(
+            region_data, "Lambda-Streaming-Response-Processed-Bytes"
+        ),
+    }
+    return {key: rate for key, rate in rates.items() if rate is not None}
+
+
 def build_region_dict(region_name: str, region_code: str) -> None:
     """
     Fetch and write the AWS Lambda pricing data for a specific region.
@@ -87,9 +150,11 @@ def build_region_dict(region_name: str, region_code: str) -> None:
         "arm64": {"Memory": {}, "Tier": {}},
     }
 
-    # grab Requests + EphemeralStorage exactly as before
+    # grab Requests + EphemeralStorage; Lambda@Edge requests are priced separately
     for sku, prod in region_data["products"].items():
         usg = prod["attributes"].get("usagetype", "")
+        if "Edge" in usg:
+            continue
         for term in region_data["terms"].get(sku, {}).values():
             for dim in term["priceDimensions"].values():
                 if "Request" in dim["unit"]:
@@ -127,6 +192,10 @@ def build_region_dict(region_name: str, region_code: str) -> None:
 
         region_dict[arch]["Tier"] = tier_map
         region_dict[arch]["OverflowRate"] = overflow_rate
+        region_dict[arch].update(get_provisioned_rates(region_data, arch))
+
+    region_dict.update(get_snapstart_rates(region_data))
+    region_dict.update(get_edge_and_streaming_rates(region_data))
 
     write_region_data(region_name, region_code, region_dict)
 
@@ -149,8 +218,11 @@ def write_region_data(region_name: str, region_code: str, data: dict) -> None:
 #  2.1 Use the pricing api to get Requests + EphemeralStorage
 #  2.2 Use screenshot-based scraping to get Memory pricing for x86 and arm64
 #  2.3 Build the Tier map and OverflowRate from the pricing api
-#  2.4 Write the JSON file for that region
-#  2.5 Report success or failure
+#  2.4 Add the provisioned concurrency, SnapStart, Lambda@Edge and response streaming
+#      rates the region offers
+#  2.5 Write the JSON file for that region
+#  2.6 Report success or failure
+# 3. Index the scraped regions under their names
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="AWS Lambda Pricing Scraper")
     parser.add_argument(
@@ -168,6 +240,7 @@ if __name__ == "__main__":
             f"[DEBUG] Processing single region: {args.region_name} ({args.region_code})"
         )
         build_region_dict(args.region_name, args.region_code)
+        scraped = {args.region_code: args.region_name}
     else:
         # Original behavior - process all regions
         print("[DEBUG] Starting pricing scraper...")
@@ -176,9 +249,14 @@ if __name__ == "__main__":
         counter, total = 1, len(regions)
         print(f"[DEBUG] Found {total} regions.")
 
+        scraped = {}
         for region_code, region_name in regions.items():
             print(
                 f"[DEBUG] [{counter}/{total}] Processing region: {region_name} ({region_code})"
             )
             counter += 1
             build_region_dict(region_name, region_code)
+            scraped[region_code] = region_name
+
+    index = write_region_index(scraped)
+    print(f"✔ Indexed {len(index)} regions.")
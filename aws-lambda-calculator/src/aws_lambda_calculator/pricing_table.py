@@ -0,0 +1,116 @@
+from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import cache
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from .pricing import ARCHITECTURES, RegionPricing, load_pricing, warn_fallback_rates
+
+
+@dataclass(frozen=True, slots=True)
+class PricingTable:
+    """Cost factors of several regions as arrays, indexed by region and architecture."""
+
+    regions: tuple[str, ...]
+    requests_rate: np.ndarray  # (regions,)
+    ephemeral_storage_rate: np.ndarray  # (regions,)
+    # (regions, architectures, tiers); shorter schedules are padded with empty tiers
+    tier_thresholds: np.ndarray
+    tier_rates: np.ndarray  # (regions, architectures, tiers)
+    overflow_rate: np.ndarray  # (regions, architectures)
+    provisioned_concurrency_rate: np.ndarray  # (regions, architectures)
+    provisioned_duration_rate: np.ndarray  # (regions, architectures)
+    snapstart_cache_rate: np.ndarray  # (regions,)
+    snapstart_restore_rate: np.ndarray  # (regions,)
+    edge_requests_rate: np.ndarray  # (regions,)
+    edge_duration_rate: np.ndarray  # (regions,)
+    response_streaming_rate: np.ndarray  # (regions,)
+    # cost factors of each region priced at the us-east-1 rates
+    fallback_rates: tuple[tuple[str, ...], ...]
+
+    def region_index(self, region: str) -> int:
+        """Return the position of a region in the table."""
+        try:
+            return self.regions.index(region)
+        except ValueError:
+            raise ValueError(f"Unknown region: {region}") from None
+
+    def warn_fallback(self, region_index: ArrayLike, *rates: str) -> None:
+        """Warn about those of `rates` priced at the fallback rates in the given regions."""
+        for r in np.unique(region_index):
+            missing = tuple(rate for rate in rates if rate in self.fallback_rates[r])
+            if missing:
+                warn_fallback_rates(self.regions[r], missing)
+
+
+@cache
+def load_pricing_table(regions: tuple[str, ...]) -> PricingTable:
+    """
+    @brief Stack the pricing models of several regions into arrays for vectorized pricing.
+    @param regions: The AWS region codes, in the order of the table.
+    @return: The cached pricing table.
+    """
+    return build_pricing_table([load_pricing(region) for region in regions])
+
+
+def build_pricing_table(models: Sequence[RegionPricing]) -> PricingTable:
+    """
+    @brief Stack pricing models from any source, e.g. snapshots, into a pricing table.
+    @param models: The pricing models, in the order of the table.
+    @return: The pricing table.
+    """
+    tier_count = max(
+        (len(model.tiers_for(arch)) for model in models for arch in ARCHITECTURES),
+        default=0,
+    )
+    shape = (len(models), len(ARCHITECTURES), tier_count)
+    tier_thresholds = np.zeros(shape)
+    tier_rates = np.zeros(shape)
+    for r, model in enumerate(models):
+        for a, arch in enumerate(ARCHITECTURES):
+            tiers = model.tiers_for(arch)
+            for t, (threshold, rate) in enumerate(tiers):
+                tier_thresholds[r, a, t] = threshold
+                tier_rates[r, a, t] = rate
+            if tiers:
+                # zero-width tiers keep the overflow starting at the last breakpoint
+                tier_thresholds[r, a, len(tiers) :] = tiers[-1][0]
+
+    return PricingTable(
+        regions=tuple(model.region for model in models),
+        requests_rate=np.array([model.requests_rate for model in models]),
+        ephemeral_storage_rate=np.array(
+            [model.ephemeral_storage_rate for model in models]
+        ),
+        tier_thresholds=tier_thresholds,
+        tier_rates=tier_rates,
+        overflow_rate=np.array(
+            [
+                [model.schedule_for(arch).overflow_rate for arch in ARCHITECTURES]
+                for model in models
+            ]
+        ),
+        provisioned_concurrency_rate=np.array(
+            [
+                [model.provisioned_concurrency_rates[arch] for arch in ARCHITECTURES]
+                for model in models
+            ]
+        ),
+        provisioned_duration_rate=np.array(
+            [
+                [model.provisioned_duration_rates[arch] for arch in ARCHITECTURES]
+                for model in models
+            ]
+        ),
+        snapstart_cache_rate=np.array([model.snapstart_cache_rate for model in models]),
+        snapstart_restore_rate=np.array(
+            [model.snapstart_restore_rate for model in models]
+        ),
+        edge_requests_rate=np.array([model.edge_requests_rate for model in models]),
+        edge_duration_rate=np.array([model.edge_duration_rate for model in models]),
+        response_streaming_rate=np.array(
+            [model.response_streaming_rate for model in models]
+        ),
+        fallback_rates=tuple(model.fallback_rates for model in models),
+    )
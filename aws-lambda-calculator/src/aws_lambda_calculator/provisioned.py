@@ -0,0 +1,193 @@
+import logging
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from .batch import encode, tiered_cost, unit_to_gb, validate_limits
+from .calculator import (
+    FREE_EPHEMERAL_STORAGE_GB,
+    FREE_TIER_COMPUTE_GB_SEC,
+    FREE_TIER_REQUESTS,
+)
+from .pricing import ARCHITECTURES
+from .pricing_table import load_pricing_table
+
+logger = logging.getLogger(__name__)
+
+# SnapStart bills the snapshot cache for at least three hours
+SNAPSTART_MINIMUM_CACHE_SEC = 3 * 3600
+
+
+@dataclass(frozen=True, slots=True)
+class ProvisionedResult:
+    """Monthly charges of a traffic curve at each provisioned concurrency level."""
+
+    provisioned_concurrency: np.ndarray  # (levels,)
+    provisioned_concurrency_charges: np.ndarray  # the allocation, used or not
+    provisioned_duration_charges: np.ndarray  # duration served by the allocation
+    on_demand_compute_charges: np.ndarray  # duration spilling over the allocation
+    request_charges: np.ndarray
+    ephemeral_storage_charges: np.ndarray
+    total_cost: np.ndarray
+
+    @property
+    def cheapest_level(self) -> float:
+        """The provisioned concurrency level with the lowest total cost."""
+        return float(self.provisioned_concurrency[np.argmin(self.total_cost)])
+
+
+def price_provisioned(
+    invocations: ArrayLike,
+    duration_ms: ArrayLike,
+    provisioned_concurrency: ArrayLike | None = None,
+    period_seconds: float = 3600,
+    region: str = "us-east-1",
+    architecture: str = "x86",
+    memory: float = 128,
+    memory_unit: str = "MB",
+    ephemeral_storage: float = 512,
+    storage_unit: str = "MB",
+    include_free_tier: bool = True,
+) -> ProvisionedResult:
+    """
+    @brief Price a month of traffic served by a provisioned allocation plus on-demand spillover.
+    The concurrency each period needs is its average, invocations x duration / period
+    length. Up to the provisioned level it is served by provisioned instances at the
+    provisioned duration rate; the rest spills over to on-demand instances priced by the
+    GB-s tiers. The allocation itself is billed for the whole curve. As on AWS, the
+    compute and request free tier only applies to the level without provisioned
+    concurrency. Every level is priced in one pass over the sorted demand.
+    @param invocations: Invocations per period, shape (periods,), covering one billing month.
+    @param duration_ms: Average duration per period, broadcast against invocations.
+    @param provisioned_concurrency: The levels to price; defaults to every level from 0
+        up to the peak demand.
+    @param period_seconds: The length of each period.
+    @return: The charges at each provisioned concurrency level.
+    """
+    invocations = np.asarray(invocations, dtype=float)
+    if invocations.ndim != 1 or invocations.size == 0:
+        raise ValueError("Invocations must be a non-empty 1-D series")
+    duration_ms = np.broadcast_to(
+        np.asarray(duration_ms, dtype=float), invocations.shape
+    )
+    if np.any(invocations < 0) or np.any(duration_ms < 0):
+        raise ValueError("Invocations and durations must not be negative")
+    if period_seconds <= 0:
+        raise ValueError("The period length must be greater than 0")
+
+    memory_to_gb = unit_to_gb(memory_unit, "memory unit")
+    storage_to_gb = unit_to_gb(storage_unit, "storage unit")
+    validate_limits(
+        np.ones(1),
+        np.ones(1),
+        np.asarray(memory, dtype=float),
+        memory_to_gb,
+        np.asarray(ephemeral_storage, dtype=float),
+        storage_to_gb,
+    )
+    a = int(
+        encode(
+            architecture,
+            {arch: i for i, arch in enumerate(ARCHITECTURES)},
+            "architecture",
+        )
+    )
+    table = load_pricing_table((region,))
+    table.warn_fallback(
+        0,
+        f"{ARCHITECTURES[a]}.ProvisionedConcurrency",
+        f"{ARCHITECTURES[a]}.ProvisionedDuration",
+    )
+    memory_gb = memory * float(memory_to_gb)
+    storage_gb = ephemeral_storage * float(storage_to_gb)
+
+    compute_sec = invocations * duration_ms * 0.001
+    demand = np.sort(compute_sec / period_seconds)
+    if provisioned_concurrency is None:
+        levels = np.arange(np.ceil(demand[-1]) + 1)
+    else:
+        levels = np.asarray(provisioned_concurrency, dtype=float)
+    if np.any(levels < 0) or np.any(levels != np.floor(levels)):
+        raise ValueError("Provisioned concurrency must be a whole number of at least 0")
+    logger.debug(
+        f"Pricing {levels.size:,} provisioned concurrency levels over {demand.size:,} periods"
+    )
+
+    # concurrency-periods served by each level: the periods below it in full, the
+    # ones above it up to the level
+    below = np.searchsorted(demand, levels, side="right")
+    served = np.concatenate([[0.0], np.cumsum(demand)])[below] + levels * (
+        demand.size - below
+    )
+    provisioned_gb_sec = served * period_seconds * memory_gb
+    total_compute_sec = compute_sec.sum()
+    spillover_gb_sec = total_compute_sec * memory_gb - provisioned_gb_sec
+
+    on_demand_only = include_free_tier & (levels == 0)
+    free_gb_sec = np.where(on_demand_only, FREE_TIER_COMPUTE_GB_SEC, 0.0)
+    free_requests = np.where(on_demand_only, FREE_TIER_REQUESTS, 0.0)
+
+    allocation = (
+        levels
+        * memory_gb
+        * (demand.size * period_seconds)
+        * table.provisioned_concurrency_rate[0, a]
+    )
+    provisioned_duration = provisioned_gb_sec * table.provisioned_duration_rate[0, a]
+    on_demand = tiered_cost(
+        np.maximum(spillover_gb_sec - free_gb_sec, 0.0),
+        table.tier_thresholds[0, a],
+        table.tier_rates[0, a],
+        table.overflow_rate[0, a],
+    )
+    request = (
+        np.maximum(np.floor(invocations.sum()) - free_requests, 0.0)
+        * table.requests_rate[0]
+    )
+    storage = np.full(
+        levels.shape,
+        max(storage_gb - FREE_EPHEMERAL_STORAGE_GB, 0.0)
+        * table.ephemeral_storage_rate[0]
+        * total_compute_sec,
+    )
+    return ProvisionedResult(
+        provisioned_concurrency=levels,
+        provisioned_concurrency_charges=allocation,
+        provisioned_duration_charges=provisioned_duration,
+        on_demand_compute_charges=on_demand,
+        request_charges=request,
+        ephemeral_storage_charges=storage,
+        total_cost=allocation + provisioned_duration + on_demand + request + storage,
+    )
+
+
+def snapstart_charges(
+    restores: ArrayLike,
+    cached_seconds: ArrayLike,
+    region: str = "us-east-1",
+    memory: ArrayLike = 128,
+    memory_unit: str = "MB",
+) -> np.ndarray:
+    """
+    @brief SnapStart charges on top of the on-demand charges of a function.
+    The snapshot cache is billed per GB-s of the function's memory for as long as the
+    version is active, three hours at least, and each restore per GB of memory.
+    SnapStart cannot be combined with provisioned concurrency.
+    @param restores: Snapshot restores (cold starts) per month.
+    @param cached_seconds: How long the published version keeps its snapshot cached.
+    @return: The monthly cache and restore charges.
+    """
+    restores = np.asarray(restores, dtype=float)
+    cached_seconds = np.asarray(cached_seconds, dtype=float)
+    if np.any(restores < 0) or np.any(cached_seconds < 0):
+        raise ValueError("Restores and cached seconds must not be negative")
+    table = load_pricing_table((region,))
+    table.warn_fallback(0, "SnapStartCache", "SnapStartRestore")
+    memory_gb = np.asarray(memory, dtype=float) * unit_to_gb(memory_unit, "memory unit")
+    cache = (
+        np.maximum(cached_seconds, SNAPSTART_MINIMUM_CACHE_SEC)
+        * memory_gb
+        * table.snapstart_cache_rate[0]
+    )
+    return cache + restores * memory_gb * table.snapstart_restore_rate[0]
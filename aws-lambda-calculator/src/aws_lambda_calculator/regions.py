@@ -0,0 +1,260 @@
+import argparse
+import json
+import os
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from difflib import get_close_matches
+from fnmatch import fnmatchcase
+from functools import cache
+from typing import Any
+
+# Kept free of package imports so the pricing workflow can run it as a script
+
+JSONS_DIR = os.path.join(os.path.dirname(__file__), "jsons")
+REGIONS_FILE = os.path.join(os.path.dirname(__file__), "regions.json")
+SCHEMA_VERSION = 1
+ARCHITECTURES = ("x86", "arm64")
+
+# Region code prefix -> partition; every other region is in the commercial partition
+PARTITIONS = {"us-gov-": "aws-us-gov", "cn-": "aws-cn", "us-iso": "aws-iso"}
+
+
+@dataclass(frozen=True, slots=True)
+class RegionInfo:
+    """What the calculator knows about a region without opening its cost factors."""
+
+    code: str  # e.g. us-east-1
+    name: str  # location in the AWS pricing API, e.g. US East (N. Virginia)
+    partition: str  # e.g. aws, aws-us-gov
+    architectures: tuple[str, ...]  # the architectures with tiered GB-s rates
+    file: str  # cost factors, relative to the package, e.g. jsons/us-east-1.json
+    # position in the index, i.e. the row of the region in a pricing table of them all
+    offset: int
+    aliases: tuple[str, ...] = ()  # other names of the location, e.g. Europe (Paris)
+
+
+@dataclass(frozen=True, slots=True)
+class RegionIndex:
+    """Every region with cost factors, in code order, with O(1) lookups by code or name."""
+
+    schema_version: int
+    regions: dict[str, RegionInfo]  # code -> region
+    names: dict[str, str]  # casefolded code, name or alias -> code
+    # casefolded architecture or partition -> codes of its regions, for selectors
+    groups: dict[str, tuple[str, ...]]
+
+    def __contains__(self, region: object) -> bool:
+        return region in self.regions
+
+    def __iter__(self) -> Iterator[RegionInfo]:
+        return iter(self.regions.values())
+
+    def __len__(self) -> int:
+        return len(self.regions)
+
+    @property
+    def codes(self) -> tuple[str, ...]:
+        return tuple(self.regions)
+
+    def get(self, code: str) -> RegionInfo:
+        """The region with a code."""
+        if code not in self.regions:
+            raise ValueError(f"Unknown region: {code}")
+        return self.regions[code]
+
+    def resolve(self, region: str) -> RegionInfo:
+        """The region with a code, location name or alias, ignoring case."""
+        code = self.names.get(str(region).strip().casefold())
+        if code is None:
+            raise ValueError(f"Unknown region: {region}")
+        return self.regions[code]
+
+    def _match(self, condition: str) -> set[str]:
+        key = condition.strip().casefold()
+        if key in ("*", "all"):
+            return set(self.regions)
+        if key in self.groups:
+            return set(self.groups[key])
+        if any(char in key for char in "*?["):
+            return {
+                info.code
+                for info in self
+                if any(
+                    fnmatchcase(name.casefold(), key)
+                    for name in (info.code, info.name, *info.aliases)
+                )
+            }
+        if key in self.names:
+            return {self.names[key]}
+        suggestions = get_close_matches(key, self.names, n=1)
+        hint = f" (did you mean {self.names[suggestions[0]]}?)" if suggestions else ""
+        raise ValueError(f"Unknown region: {condition.strip()}{hint}")
+
+    def select(self, selector: str | Sequence[str]) -> tuple[str, ...]:
+        """
+        @brief The codes of the regions a selector picks, in index order.
+        A selector is a comma-separated list of terms, picking the regions of any term; a
+        term joins conditions with `&`, picking the regions meeting all of them. Each
+        condition, ignoring case, is one of:
+        - `*` or `all`: every region;
+        - an architecture or partition, e.g. `arm64`, `aws-us-gov`: its regions;
+        - a glob over codes, location names and aliases, e.g. `eu-*`, `*(Frankfurt)`;
+        - a region code, location name or alias.
+        e.g. `eu-*&arm64,us-gov-*` is the European regions with arm64 and GovCloud.
+        @param selector: A selector, or a sequence of terms.
+        @return: The selected codes; a selector picking no region is an error.
+        """
+        terms = selector.split(",") if isinstance(selector, str) else list(selector)
+        selected: set[str] = set()
+        for term in terms:
+            conditions = [self._match(condition) for condition in term.split("&")]
+            selected |= set.intersection(*conditions)
+        if not selected:
+            raise ValueError(f"No regions match: {selector}")
+        return tuple(code for code in self.regions if code in selected)
+
+
+def partition_of(code: str) -> str:
+    """The AWS partition of a region code."""
+    for prefix, partition in PARTITIONS.items():
+        if code.startswith(prefix):
+            return partition
+    return "aws"
+
+
+def location_aliases(name: str) -> tuple[str, ...]:
+    """Other spellings of a location: the pricing API and the console disagree on EU/Europe."""
+    if name.startswith("EU ("):
+        return (name.replace("EU", "Europe", 1),)
+    if name.startswith("Europe ("):
+        return (name.replace("Europe", "EU", 1),)
+    return ()
+
+
+def read_region_index(path: str = REGIONS_FILE) -> RegionIndex:
+    """
+    @brief Read a region index.
+    @param path: The index file; a missing index is empty.
+    @return: The parsed index.
+    """
+    if not os.path.exists(path):
+        return RegionIndex(SCHEMA_VERSION, {}, {}, {})
+
+    with open(path, "r") as file:
+        data = json.load(file)
+    if data.get("schema_version") != SCHEMA_VERSION:
+        raise ValueError(
+            f"Unsupported region index schema: {data.get('schema_version')}"
+        )
+    regions = {
+        entry["code"]: RegionInfo(
+            code=entry["code"],
+            name=entry["name"],
+            partition=entry["partition"],
+            architectures=tuple(entry["architectures"]),
+            file=entry["file"],
+            offset=entry["offset"],
+            aliases=tuple(entry.get("aliases", ())),
+        )
+        for entry in data["regions"]
+    }
+    names = {}
+    groups: dict[str, list[str]] = {}
+    for info in regions.values():
+        for name in (*info.aliases, info.name, info.code):
+            names[name.casefold()] = info.code
+        for group in (*info.architectures, info.partition):
+            groups.setdefault(group.casefold(), []).append(info.code)
+    return RegionIndex(
+        data["schema_version"],
+        regions,
+        names,
+        {group: tuple(codes) for group, codes in groups.items()},
+    )
+
+
+@cache
+def load_region_index(path: str = REGIONS_FILE) -> RegionIndex:
+    """The region index shipped with the pricing data, read once per process."""
+    return read_region_index(path)
+
+
+def select_regions(selector: str | Sequence[str]) -> tuple[str, ...]:
+    """
+    @brief The codes of the regions a selector picks from the shipped region index.
+    @param selector: e.g. `eu-*`, `us-gov-*`, `arm64` or `eu-*&arm64,us-east-1`, see
+        RegionIndex.select().
+    @return: The selected codes, in index order.
+    """
+    return load_region_index().select(selector)
+
+
+def build_region_index(
+    names: Mapping[str, str], directory: str = JSONS_DIR
+) -> dict[str, Any]:
+    """
+    @brief Index the cost factors of a directory of region JSONs.
+    @param names: Region code to its location name; regions without one are named by
+        their code.
+    @param directory: The region JSONs, e.g. a fresh scrape.
+    @return: The index as written to regions.json, regions in code order.
+    """
+    regions: list[dict[str, Any]] = []
+    for file_name in sorted(os.listdir(directory)):
+        if not file_name.endswith(".json"):
+            continue
+        code = file_name.removesuffix(".json")
+        with open(os.path.join(directory, file_name), "r") as file:
+            data = json.load(file)
+        name = names.get(code, code)
+        regions.append(
+            {
+                "code": code,
+                "name": name,
+                "partition": partition_of(code),
+                "architectures": [
+                    arch for arch in ARCHITECTURES if data.get(arch, {}).get("Tier")
+                ],
+                "file": f"{os.path.basename(directory)}/{file_name}",
+                "offset": len(regions),
+                "aliases": list(location_aliases(name)),
+            }
+        )
+    return {"schema_version": SCHEMA_VERSION, "regions": regions}
+
+
+def write_region_index(
+    names: Mapping[str, str] | None = None,
+    directory: str = JSONS_DIR,
+    path: str = REGIONS_FILE,
+) -> RegionIndex:
+    """
+    @brief Regenerate the region index after the region JSONs changed.
+    @param names: Location names of new or renamed regions; the others keep the name
+        they have in the current index.
+    @return: The new index.
+    """
+    known = {info.code: info.name for info in read_region_index(path)}
+    index = build_region_index({**known, **(names or {})}, directory)
+    with open(f"{path}.tmp", "w") as file:
+        json.dump(index, file, indent=2)
+        file.write("\n")
+    os.replace(f"{path}.tmp", path)
+    load_region_index.cache_clear()
+    return load_region_index(path)
+
+
+# Run after the scraper has refreshed jsons/ to index new regions
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="AWS Lambda region index")
+    parser.add_argument(
+        "--name",
+        action="append",
+        default=[],
+        metavar="CODE=NAME",
+        help="Location name of a region, e.g. 'us-east-1=US East (N. Virginia)'",
+    )
+    args = parser.parse_args()
+
+    regions = write_region_index(dict(name.split("=", 1) for name in args.name))
+    print(f"✔ Indexed {len(regions)} regions in {REGIONS_FILE}")
@@ -0,0 +1,157 @@
+from collections.abc import Iterator
+from dataclasses import dataclass, fields
+
+import numpy as np
+
+from .models import CalculationResult, TierUsage
+
+
+@dataclass(frozen=True, slots=True)
+class CompactResult:
+    """
+    The charges of one workload without calculation steps: five floats instead of a
+    pydantic model, a list and its step strings.
+    """
+
+    compute_charges: float
+    request_charges: float
+    ephemeral_storage_charges: float
+    response_streaming_charges: float
+    total_cost: float
+
+    def to_calculation_result(self) -> CalculationResult:
+        """The same result as a CalculationResult, with no calculation steps."""
+        return CalculationResult(
+            total_cost=self.total_cost,
+            calculation_steps=[],
+            compute_charges=self.compute_charges,
+            request_charges=self.request_charges,
+            ephemeral_storage_charges=self.ephemeral_storage_charges,
+            response_streaming_charges=self.response_streaming_charges,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class BatchResult:
+    """
+    The charges of many workloads and every intermediate value calculate() reports, as
+    columns, materializing rows only on demand.
+    """
+
+    compute_charges: np.ndarray
+    request_charges: np.ndarray
+    ephemeral_storage_charges: np.ndarray
+    response_streaming_charges: np.ndarray
+    total_cost: np.ndarray
+    requests_per_month: np.ndarray
+    memory_in_gb: np.ndarray
+    storage_in_gb: np.ndarray
+    total_compute_sec: np.ndarray
+    total_compute_gb_sec: np.ndarray
+    free_tier_compute_gb_sec: np.ndarray
+    billable_compute_gb_sec: np.ndarray
+    free_tier_requests: np.ndarray
+    billable_requests: np.ndarray
+    billable_ephemeral_storage_gb: np.ndarray
+    tier_thresholds: np.ndarray  # (..., tiers) upper breakpoint of each tier
+    # (..., tiers + 1), the last tier being the usage beyond the highest breakpoint
+    tier_rates: np.ndarray
+    tier_usage_gb_sec: np.ndarray
+    tier_cost: np.ndarray
+
+    def __len__(self) -> int:
+        return self.total_cost.size
+
+    def __getitem__(self, index: int) -> CompactResult:
+        """The charges of one workload, by its flat position in the batch."""
+        return CompactResult(
+            float(self.compute_charges.flat[index]),
+            float(self.request_charges.flat[index]),
+            float(self.ephemeral_storage_charges.flat[index]),
+            float(self.response_streaming_charges.flat[index]),
+            float(self.total_cost.flat[index]),
+        )
+
+    def __iter__(self) -> Iterator[CompactResult]:
+        columns = (
+            self.compute_charges.ravel().tolist(),
+            self.request_charges.ravel().tolist(),
+            self.ephemeral_storage_charges.ravel().tolist(),
+            self.response_streaming_charges.ravel().tolist(),
+            self.total_cost.ravel().tolist(),
+        )
+        return (CompactResult(*row) for row in zip(*columns))
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the columns."""
+        return sum(getattr(self, field.name).nbytes for field in fields(self))
+
+    def tiers(self, index: int) -> list[TierUsage]:
+        """
+        The tiers of one workload the way calculate() lists them: every tier up to the
+        one billing the last unit of usage, then any usage beyond the last breakpoint.
+        """
+        thresholds = self.tier_thresholds.reshape(len(self), -1)[index]
+        rates = self.tier_rates.reshape(len(self), -1)[index]
+        usage = self.tier_usage_gb_sec.reshape(len(self), -1)[index]
+        cost = self.tier_cost.reshape(len(self), -1)[index]
+
+        # usage only beyond the breakpoints is a flat rate (Lambda@Edge) or a region
+        # without tiers; otherwise every tier up to the one holding the last unit
+        reached = -1
+        if usage[:-1].any() or not usage[-1]:
+            billable = self.billable_compute_gb_sec.flat[index]
+            reached = int(np.searchsorted(thresholds, billable, side="left"))
+        tiers = []
+        for t in range(min(reached + 1, len(thresholds))):
+            if t and thresholds[t] == thresholds[t - 1]:
+                continue  # zero-width padding of a shorter schedule
+            tiers.append(
+                TierUsage(
+                    up_to_gb_sec=float(thresholds[t]),
+                    rate=float(rates[t]),
+                    usage_gb_sec=float(usage[t]),
+                    cost=float(cost[t]),
+                )
+            )
+        if usage[-1] > 0:
+            tiers.append(
+                TierUsage(
+                    up_to_gb_sec=None,
+                    rate=float(rates[-1]),
+                    usage_gb_sec=float(usage[-1]),
+                    cost=float(cost[-1]),
+                )
+            )
+        return tiers
+
+    def to_calculation_result(self, index: int) -> CalculationResult:
+        """One workload as a CalculationResult with every breakdown field, but no steps."""
+        return CalculationResult(
+            total_cost=float(self.total_cost.flat[index]),
+            calculation_steps=[],
+            compute_charges=float(self.compute_charges.flat[index]),
+            request_charges=float(self.request_charges.flat[index]),
+            ephemeral_storage_charges=float(self.ephemeral_storage_charges.flat[index]),
+            response_streaming_charges=float(
+                self.response_streaming_charges.flat[index]
+            ),
+            requests_per_month=int(self.requests_per_month.flat[index]),
+            memory_in_gb=float(self.memory_in_gb.flat[index]),
+            storage_in_gb=float(self.storage_in_gb.flat[index]),
+            total_compute_sec=float(self.total_compute_sec.flat[index]),
+            total_compute_gb_sec=float(self.total_compute_gb_sec.flat[index]),
+            free_tier_compute_gb_sec=float(self.free_tier_compute_gb_sec.flat[index]),
+            billable_compute_gb_sec=float(self.billable_compute_gb_sec.flat[index]),
+            free_tier_requests=int(self.free_tier_requests.flat[index]),
+            billable_requests=int(self.billable_requests.flat[index]),
+            billable_ephemeral_storage_gb=float(
+                self.billable_ephemeral_storage_gb.flat[index]
+            ),
+            tiers=self.tiers(index),
+        )
+
+    def to_calculation_results(self) -> list[CalculationResult]:
+        """Every workload as a CalculationResult; allocates one model per workload."""
+        return [self.to_calculation_result(i) for i in range(len(self))]
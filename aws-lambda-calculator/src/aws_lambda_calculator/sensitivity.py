@@ -0,0 +1,178 @@
+import logging
+from dataclasses import dataclass, fields
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from .batch import EDGE, STREAMING, encode_workloads
+from .calculator import (
+    FREE_EPHEMERAL_STORAGE_GB,
+    FREE_TIER_COMPUTE_GB_SEC,
+    FREE_TIER_REQUESTS,
+    MB_TO_GB,
+)
+from .pricing import FREE_STREAMED_RESPONSE_MB
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class SensitivityResult:
+    """
+    Partial derivatives of the total monthly cost of each workload with respect to each
+    input, in USD per unit of the input as given (e.g. per request in its request unit,
+    per MB of memory when the memory is in MB).
+    """
+
+    total_cost: np.ndarray
+    number_of_requests: np.ndarray
+    duration_of_each_request_in_ms: np.ndarray
+    memory: np.ndarray
+    ephemeral_storage: np.ndarray
+    response_size_in_mb: np.ndarray
+
+    def row(self, index: int = 0) -> dict[str, float]:
+        """The cost and its derivatives of one workload, by its flat position in the batch."""
+        return {
+            field.name: float(getattr(self, field.name).flat[index])
+            for field in fields(self)
+        }
+
+
+def marginal_rate(
+    usage: np.ndarray,
+    tier_thresholds: np.ndarray,
+    tier_rates: np.ndarray,
+    overflow_rate: np.ndarray,
+) -> np.ndarray:
+    """
+    @brief The rate billing the next unit of usage, i.e. the slope of tiered_cost().
+    At a breakpoint this is the rate of the tier above it. Padded empty tiers are never
+    selected since their breakpoint equals the last real one.
+    @return: USD per GB-s of each usage.
+    """
+    rates = np.concatenate(
+        [
+            np.broadcast_to(tier_rates, usage.shape + tier_rates.shape[-1:]),
+            np.broadcast_to(overflow_rate, usage.shape)[..., None],
+        ],
+        axis=-1,
+    )
+    tier = (tier_thresholds <= usage[..., None]).sum(axis=-1)
+    return np.take_along_axis(rates, tier[..., None], axis=-1)[..., 0]
+
+
+def sensitivity(
+    region: ArrayLike = "us-east-1",
+    architecture: ArrayLike = "x86",
+    number_of_requests: ArrayLike = 1000000,
+    request_unit: ArrayLike = "per day",
+    duration_of_each_request_in_ms: ArrayLike = 1500,
+    memory: ArrayLike = 128,
+    memory_unit: ArrayLike = "MB",
+    ephemeral_storage: ArrayLike = 512,
+    storage_unit: ArrayLike = "MB",
+    include_free_tier: ArrayLike = True,
+    workload_type: ArrayLike = "standard",
+    response_size_in_mb: ArrayLike = 0,
+) -> SensitivityResult:
+    """
+    @brief Exact partial derivatives of the total monthly cost with respect to each input.
+    The cost is piecewise linear in every input, so each derivative is the rate billing
+    the next unit: the GB-s tier holding the last billable unit, zero inside a free tier
+    allowance and the flat rates of Lambda@Edge. Derivatives are taken from the right,
+    so at a breakpoint (e.g. exactly the free tier) they give the cost of one more unit.
+    Requests per month are treated as continuous, ignoring their rounding down.
+    Takes the same arguments as calculate_batch().
+    @return: The total cost and its derivatives for each workload.
+    """
+    workloads = encode_workloads(
+        region,
+        architecture,
+        number_of_requests,
+        request_unit,
+        duration_of_each_request_in_ms,
+        memory,
+        memory_unit,
+        ephemeral_storage,
+        storage_unit,
+        include_free_tier,
+        workload_type,
+        response_size_in_mb,
+    )
+    logger.debug(f"Sensitivity of {workloads.region_index.size:,} workloads")
+    compute, request, storage = workloads.charges()
+
+    table, r, a = workloads.table, workloads.region_index, workloads.architecture_index
+    edge = workloads.workload_type == EDGE
+    free = workloads.include_free_tier & ~edge
+    multiplier = workloads.requests_per_month_multiplier
+    requests_per_month = np.floor(workloads.number_of_requests * multiplier)
+    compute_sec_per_request = workloads.duration_of_each_request_in_ms * 0.001
+    total_compute_sec = requests_per_month * compute_sec_per_request
+    memory_in_gb = workloads.memory * workloads.memory_to_gb
+    total_compute_gb_sec = memory_in_gb * total_compute_sec
+
+    # USD per extra GB-s, extra request, and extra second of billable storage
+    billable_gb_sec = total_compute_gb_sec - np.where(free, FREE_TIER_COMPUTE_GB_SEC, 0)
+    gb_sec_rate = np.where(
+        edge,
+        table.edge_duration_rate[r],
+        np.where(
+            billable_gb_sec >= 0,
+            marginal_rate(
+                np.maximum(billable_gb_sec, 0.0),
+                table.tier_thresholds[r, a],
+                table.tier_rates[r, a],
+                table.overflow_rate[r, a],
+            ),
+            0.0,
+        ),
+    )
+    request_rate = np.where(
+        edge,
+        table.edge_requests_rate[r],
+        np.where(
+            ~free | (requests_per_month >= FREE_TIER_REQUESTS),
+            table.requests_rate[r],
+            0.0,
+        ),
+    )
+    storage_in_gb = workloads.ephemeral_storage * workloads.storage_to_gb
+    storage_gb_rate = np.where(
+        edge | (storage_in_gb < FREE_EPHEMERAL_STORAGE_GB),
+        0.0,
+        table.ephemeral_storage_rate[r],
+    )
+    storage_sec_rate = np.where(
+        edge,
+        0.0,
+        np.maximum(storage_in_gb - FREE_EPHEMERAL_STORAGE_GB, 0.0)
+        * table.ephemeral_storage_rate[r],
+    )
+    streaming = workloads.workload_type == STREAMING
+    streamed_gb_rate = np.where(streaming, table.response_streaming_rate[r], 0.0)
+    billable_streamed_gb = (
+        np.maximum(workloads.response_size_in_mb - FREE_STREAMED_RESPONSE_MB, 0.0)
+        * MB_TO_GB
+    )
+
+    per_request = (
+        request_rate
+        + gb_sec_rate * memory_in_gb * compute_sec_per_request
+        + storage_sec_rate * compute_sec_per_request
+        + streamed_gb_rate * billable_streamed_gb
+    )
+    per_compute_sec = gb_sec_rate * memory_in_gb + storage_sec_rate
+    return SensitivityResult(
+        total_cost=compute + request + storage + workloads.streaming_charges(),
+        number_of_requests=per_request * multiplier,
+        duration_of_each_request_in_ms=per_compute_sec * requests_per_month * 0.001,
+        memory=gb_sec_rate * total_compute_sec * workloads.memory_to_gb,
+        ephemeral_storage=storage_gb_rate * total_compute_sec * workloads.storage_to_gb,
+        response_size_in_mb=np.where(
+            workloads.response_size_in_mb >= FREE_STREAMED_RESPONSE_MB,
+            streamed_gb_rate * requests_per_month * MB_TO_GB,
+            0.0,
+        ),
+    )
@@ -0,0 +1,217 @@
+import logging
+import math
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from statistics import NormalDist
+from typing import Literal, Protocol
+
+import numpy as np
+
+from .batch import UNIT_TO_GB, monthly_charges
+from .calculator import REQUESTS_PER_MONTH
+from .models import CalculationRequest, SimulationResult
+from .pricing import ARCHITECTURES
+from .pricing_table import load_pricing_table
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 1_000_000
+# Resolution of the streaming histogram the percentiles are read from
+PERCENTILE_BINS = 1 << 16
+
+
+class Distribution(Protocol):
+    """Anything that can draw a batch of samples from a seeded generator."""
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray: ...
+
+
+@dataclass(frozen=True, slots=True)
+class Fixed:
+    """A constant value."""
+
+    value: float
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        return np.full(size, float(self.value))
+
+
+@dataclass(frozen=True, slots=True)
+class LogNormal:
+    """A log-normal distribution, e.g. for request durations."""
+
+    median: float
+    sigma: float
+
+    @classmethod
+    def from_percentiles(cls, p50: float, p99: float) -> "LogNormal":
+        """Fit the distribution to a median and a 99th percentile."""
+        if not 0 < p50 <= p99:
+            raise ValueError("Percentiles must satisfy 0 < p50 <= p99")
+        return cls(median=p50, sigma=math.log(p99 / p50) / NormalDist().inv_cdf(0.99))
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        return rng.lognormal(math.log(self.median), self.sigma, size)
+
+
+@dataclass(frozen=True, slots=True)
+class Poisson:
+    """A Poisson-distributed count, e.g. requests in the chosen request unit."""
+
+    mean: float
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        return rng.poisson(self.mean, size).astype(float)
+
+
+@dataclass(frozen=True, slots=True)
+class Seasonal:
+    """
+    Monthly requests of a Poisson process following an hourly traffic profile, e.g. 24
+    rates for a day or 168 for a week. The profile is repeated over the 730 hours of a
+    month, each hour a Poisson draw at its rate, scaled per sample by a log-normal factor
+    of spread `sigma`. Samples are requests per month, so simulate() only takes them with
+    request_unit="per month".
+    """
+
+    hourly_rates: Sequence[float]
+    sigma: float = 0.0
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        rates = np.asarray(self.hourly_rates, dtype=float)
+        if rates.ndim != 1 or not rates.size or np.any(rates < 0):
+            raise ValueError(
+                "Hourly rates must be a non-empty sequence of non-negative numbers"
+            )
+        # the hours of a month follow the profile from its first hour; the sum of their
+        # Poisson draws is a single draw at the sum of their rates
+        monthly_mean = np.resize(rates, 730).sum()
+        scale = rng.lognormal(0.0, self.sigma, size) if self.sigma else 1.0
+        return rng.poisson(monthly_mean * scale, size).astype(float)
+
+
+@dataclass(frozen=True, slots=True)
+class Percentiles:
+    """An empirical distribution given by percentile points, e.g. {50: 120, 99: 900}."""
+
+    points: dict[float, float]
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        levels = sorted(self.points)
+        values = [self.points[level] for level in levels]
+        return np.interp(rng.uniform(0, 100, size), levels, values)
+
+
+def _as_distribution(value: "Distribution | float") -> Distribution:
+    return Fixed(value) if isinstance(value, (int, float)) else value
+
+
+def simulate(
+    region: str = "us-east-1",
+    architecture: Literal["x86", "arm64"] = "x86",
+    number_of_requests: Distribution | float = 1000000,
+    request_unit: Literal[
+        "per second",
+        "per minute",
+        "per hour",
+        "per day",
+        "per month",
+        "million per month",
+    ] = "per day",
+    duration_of_each_request_in_ms: Distribution | float = 1500,
+    memory: float = 128,
+    memory_unit: Literal["MB", "GB"] = "MB",
+    ephemeral_storage: float = 512,
+    storage_unit: Literal["MB", "GB"] = "MB",
+    include_free_tier: bool = True,
+    samples: int = 1_000_000,
+    seed: int | None = None,
+    percentiles: Sequence[float] = (50, 90, 99),
+    bins: int = 50,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> SimulationResult:
+    """
+    @brief Monte Carlo distribution of the monthly cost under uncertain traffic.
+    @param number_of_requests: A distribution (or constant) of the number of requests in request_unit.
+    @param duration_of_each_request_in_ms: A distribution (or constant) of the request duration.
+    @param samples: Number of simulated months.
+    @param seed: Seed of the random generator; the same seed reproduces the same result.
+    @param percentiles: Cost percentiles to report.
+    @param bins: Number of bins of the reported histogram.
+    @param chunk_size: Number of samples drawn at once, bounding the working memory.
+    @return: Cost percentiles, mean and histogram.
+    """
+    CalculationRequest(
+        region=region,
+        architecture=architecture,
+        request_unit=request_unit,
+        memory=memory,
+        memory_unit=memory_unit,
+        ephemeral_storage=ephemeral_storage,
+        storage_unit=storage_unit,
+        include_free_tier=include_free_tier,
+    )
+    if samples <= 0:
+        raise ValueError("Number of samples must be greater than 0")
+    if isinstance(number_of_requests, Seasonal) and request_unit != "per month":
+        raise ValueError(
+            "Seasonal requests are monthly totals: use request_unit='per month'"
+        )
+
+    table = load_pricing_table((region,))
+    requests_distribution = _as_distribution(number_of_requests)
+    duration_distribution = _as_distribution(duration_of_each_request_in_ms)
+    if seed is None:
+        seed = int(np.random.default_rng().integers(1 << 63))
+
+    def costs() -> Iterator[np.ndarray]:
+        # Re-seeding makes every pass over the samples draw the exact same values
+        rng = np.random.default_rng(seed)
+        for start in range(0, samples, chunk_size):
+            size = min(chunk_size, samples - start)
+            compute, request, storage = monthly_charges(
+                table,
+                np.asarray(0),
+                np.asarray(ARCHITECTURES.index(architecture)),
+                np.maximum(requests_distribution.sample(rng, size), 0.0),
+                np.asarray(REQUESTS_PER_MONTH[request_unit]),
+                np.maximum(duration_distribution.sample(rng, size), 0.0),
+                np.asarray(memory, dtype=float),
+                np.asarray(UNIT_TO_GB[memory_unit]),
+                np.asarray(ephemeral_storage, dtype=float),
+                np.asarray(UNIT_TO_GB[storage_unit]),
+                np.asarray(include_free_tier),
+            )
+            yield compute + request + storage
+
+    # Pass 1: range and mean. Pass 2: a fine histogram for the percentiles, so that
+    # memory stays bounded by the chunk size whatever the number of samples.
+    low, high, total = math.inf, -math.inf, 0.0
+    for chunk in costs():
+        low, high = min(low, chunk.min()), max(high, chunk.max())
+        total += chunk.sum()
+    degenerate = high <= low
+    if degenerate:
+        high = low + 1.0
+
+    fine_counts = np.zeros(PERCENTILE_BINS, dtype=np.int64)
+    counts = np.zeros(bins, dtype=np.int64)
+    for chunk in costs():
+        fine_counts += np.histogram(chunk, PERCENTILE_BINS, (low, high))[0]
+        counts += np.histogram(chunk, bins, (low, high))[0]
+
+    fine_edges = np.linspace(low, high, PERCENTILE_BINS + 1)
+    cumulative = np.concatenate([[0], np.cumsum(fine_counts)]) / samples
+    values = np.interp(np.asarray(percentiles) / 100, cumulative, fine_edges)
+    if degenerate:
+        values[:] = low
+
+    logger.debug(f"Simulated {samples:,} months with seed {seed}")
+    return SimulationResult(
+        samples=samples,
+        seed=seed,
+        mean=total / samples,
+        percentiles={f"p{level:g}": float(v) for level, v in zip(percentiles, values)},
+        histogram_edges=np.linspace(low, high, bins + 1).tolist(),
+        histogram_counts=counts.tolist(),
+    )
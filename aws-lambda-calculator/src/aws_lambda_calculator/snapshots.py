@@ -0,0 +1,159 @@
+import argparse
+import hashlib
+import json
+import os
+from bisect import bisect_right
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import date
+from functools import cache
+from typing import Any
+
+# Kept free of package imports so the pricing workflow can run it as a script
+
+JSONS_DIR = os.path.join(os.path.dirname(__file__), "jsons")
+SNAPSHOTS_DIR = os.path.join(os.path.dirname(__file__), "snapshots")
+SCHEMA_VERSION = 1
+
+
+def content_digest(data: Mapping[str, Any]) -> str:
+    """SHA-256 of the canonical JSON encoding of a region's cost factors."""
+    canonical = json.dumps(data, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
+class SnapshotIndex:
+    """Pricing history of every region: the dates its cost factors changed on."""
+
+    schema_version: int
+    # region -> (ascending ISO dates, digest of the cost factors from each date on)
+    histories: dict[str, tuple[tuple[str, ...], tuple[str, ...]]]
+
+    def digest_for(self, region: str, as_of: date) -> str:
+        """Digest of the cost factors of a region in effect on a date."""
+        if region not in self.histories:
+            raise ValueError(f"Unknown region: {region}")
+        dates, digests = self.histories[region]
+        i = bisect_right(dates, as_of.isoformat())
+        if not i:
+            raise ValueError(f"No pricing snapshot of {region} on or before {as_of}")
+        return digests[i - 1]
+
+
+def read_index(directory: str = SNAPSHOTS_DIR) -> SnapshotIndex:
+    """
+    @brief Read the snapshot index of a store.
+    @param directory: The snapshot store; a store without an index is empty.
+    @return: The parsed index.
+    """
+    file_path = os.path.join(directory, "index.json")
+    if not os.path.exists(file_path):
+        return SnapshotIndex(SCHEMA_VERSION, {})
+
+    with open(file_path, "r") as file:
+        data = json.load(file)
+    if data.get("schema_version") != SCHEMA_VERSION:
+        raise ValueError(
+            f"Unsupported pricing snapshot schema: {data.get('schema_version')}"
+        )
+    histories = {
+        region: (
+            tuple(entry["date"] for entry in entries),
+            tuple(entry["digest"] for entry in entries),
+        )
+        for region, entries in data["regions"].items()
+    }
+    return SnapshotIndex(data["schema_version"], histories)
+
+
+@cache
+def load_index(directory: str = SNAPSHOTS_DIR) -> SnapshotIndex:
+    """The snapshot index of a store, read once per process."""
+    return read_index(directory)
+
+
+def load_snapshot(digest: str, directory: str = SNAPSHOTS_DIR) -> dict[str, Any]:
+    """Read the cost factors stored under a digest."""
+    file_path = os.path.join(directory, "objects", f"{digest}.json")
+    if not os.path.exists(file_path):
+        raise ValueError(f"Unknown pricing snapshot: {digest}")
+    with open(file_path, "r") as file:
+        return json.load(file)
+
+
+def record_snapshots(
+    cost_factors: Mapping[str, Mapping[str, Any]],
+    as_of: date,
+    directory: str = SNAPSHOTS_DIR,
+) -> dict[str, str]:
+    """
+    @brief Append the cost factors of several regions to a store as of a date.
+    Each distinct content is stored once under its digest; a region's history only
+    grows when its cost factors changed. Snapshots are never rewritten, so a date
+    before a region's latest snapshot is rejected.
+    @param cost_factors: Region code to the contents of `jsons/<region>.json`.
+    @param as_of: The date the cost factors took effect.
+    @param directory: The snapshot store.
+    @return: Region code to the digest of its cost factors.
+    """
+    index = read_index(directory)
+    histories = {
+        region: [list(entry) for entry in zip(*history)]
+        for region, history in index.histories.items()
+    }
+    os.makedirs(os.path.join(directory, "objects"), exist_ok=True)
+
+    digests = {}
+    for region, data in sorted(cost_factors.items()):
+        digest = digests[region] = content_digest(data)
+        object_path = os.path.join(directory, "objects", f"{digest}.json")
+        if not os.path.exists(object_path):
+            with open(object_path, "w") as file:
+                json.dump(data, file, indent=2, sort_keys=True)
+
+        history = histories.setdefault(region, [])
+        if history and as_of.isoformat() < history[-1][0]:
+            raise ValueError(
+                f"Snapshots are append-only: {region} already has one from {history[-1][0]}"
+            )
+        if not history or history[-1][1] != digest:
+            history.append([as_of.isoformat(), digest])
+
+    index_path = os.path.join(directory, "index.json")
+    with open(f"{index_path}.tmp", "w") as file:
+        json.dump(
+            {
+                "schema_version": SCHEMA_VERSION,
+                "regions": {
+                    region: [{"date": day, "digest": digest} for day, digest in entries]
+                    for region, entries in sorted(histories.items())
+                },
+            },
+            file,
+            indent=2,
+        )
+        file.write("\n")
+    os.replace(f"{index_path}.tmp", index_path)
+    load_index.cache_clear()
+    return digests
+
+
+# Run after the scraper has refreshed jsons/ to append the new pricing to the store
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="AWS Lambda pricing snapshots")
+    parser.add_argument(
+        "--as-of",
+        type=date.fromisoformat,
+        default=date.today(),
+        help="Date the pricing took effect (default: today)",
+    )
+    args = parser.parse_args()
+
+    regions = {}
+    for name in sorted(os.listdir(JSONS_DIR)):
+        if name.endswith(".json"):
+            with open(os.path.join(JSONS_DIR, name), "r") as f:
+                regions[name.removesuffix(".json")] = json.load(f)
+    digests = record_snapshots(regions, args.as_of)
+    print(f"✔ Recorded {len(digests)} regions as of {args.as_of} in {SNAPSHOTS_DIR}")
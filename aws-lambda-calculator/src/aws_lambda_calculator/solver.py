@@ -0,0 +1,208 @@
+import logging
+import math
+from bisect import bisect_right
+from typing import Literal
+
+from .calculator import (
+    FREE_EPHEMERAL_STORAGE_GB,
+    FREE_TIER_COMPUTE_GB_SEC,
+    FREE_TIER_REQUESTS,
+    MB_TO_GB,
+    REQUESTS_PER_MONTH,
+)
+from .models import CalculationRequest, SolveResult
+from .pricing import load_pricing
+
+logger = logging.getLogger(__name__)
+
+MIN_MEMORY_GB = 128 * MB_TO_GB
+MAX_MEMORY_GB = 10240 * MB_TO_GB
+
+# A piecewise linear cost curve: ((start of segment, slope in USD per unit), ...).
+# The first segment always starts at 0 and the last one extends to infinity.
+Segments = list[tuple[float, float]]
+
+
+def _tiered_segments(
+    tiers: tuple[tuple[float, float], ...], overflow_rate: float, free_usage: float
+) -> Segments:
+    """Segments of the tiered compute price over total (not billable) GB-seconds."""
+    segments: Segments = [(0.0, 0.0)] if free_usage > 0 else []
+    start = 0.0
+    for threshold, rate in tiers:
+        segments.append((free_usage + start, rate))
+        start = threshold
+    segments.append((free_usage + start, overflow_rate))
+    return segments
+
+
+def _scale(segments: Segments, usage_per_unit: float) -> Segments:
+    """Re-express segments defined over usage as segments over the unknown."""
+    if usage_per_unit <= 0:
+        return [(0.0, 0.0)]
+    return [
+        (start / usage_per_unit, slope * usage_per_unit) for start, slope in segments
+    ]
+
+
+def _merge(*curves: Segments) -> Segments:
+    """Sum several piecewise linear curves into one."""
+    breakpoints = sorted({start for curve in curves for start, _ in curve})
+    merged: Segments = []
+    for point in breakpoints:
+        slope = 0.0
+        for curve in curves:
+            index = bisect_right([start for start, _ in curve], point) - 1
+            if index >= 0:
+                slope += curve[index][1]
+        merged.append((point, slope))
+    return merged
+
+
+def _invert(segments: Segments, fixed_cost: float, budget: float) -> float:
+    """
+    @brief Find the largest x such that fixed_cost + integral of the curve up to x <= budget.
+    @param segments: The piecewise linear, non-decreasing cost curve.
+    @param fixed_cost: Cost that does not depend on the unknown.
+    @param budget: The monthly budget in USD.
+    @return: The largest value of the unknown within the budget (may be infinite).
+    """
+    cost = fixed_cost
+    if budget < cost:
+        raise ValueError(
+            f"Budget of ${budget:.4f} USD is below the fixed monthly cost of ${cost:.4f} USD"
+        )
+
+    for index, (start, slope) in enumerate(segments):
+        end = segments[index + 1][0] if index + 1 < len(segments) else math.inf
+        if slope > 0:
+            cost_at_end = cost + slope * (end - start)
+            if budget < cost_at_end:
+                return start + (budget - cost) / slope
+            cost = cost_at_end
+        elif end == math.inf:
+            return math.inf
+    return math.inf
+
+
+def _evaluate(segments: Segments, amount: float) -> float:
+    """Evaluate a piecewise linear curve at a known amount."""
+    cost = 0.0
+    for index, (start, slope) in enumerate(segments):
+        end = segments[index + 1][0] if index + 1 < len(segments) else math.inf
+        if amount <= start:
+            break
+        cost += slope * (min(amount, end) - start)
+    return cost
+
+
+def solve_for(
+    budget: float,
+    unknown: Literal["requests", "duration", "memory"] = "requests",
+    region: str = "us-east-1",
+    architecture: Literal["x86", "arm64"] = "x86",
+    number_of_requests: int = 1000000,
+    request_unit: Literal[
+        "per second",
+        "per minute",
+        "per hour",
+        "per day",
+        "per month",
+        "million per month",
+    ] = "per day",
+    duration_of_each_request_in_ms: int = 1500,
+    memory: float = 128,
+    memory_unit: Literal["MB", "GB"] = "MB",
+    ephemeral_storage: float = 512,
+    storage_unit: Literal["MB", "GB"] = "MB",
+    include_free_tier: bool = True,
+) -> SolveResult:
+    """
+    @brief Invert the monthly cost: find the largest value of one input that stays within a budget.
+    @param budget: The monthly budget in USD.
+    @param unknown: The input to solve for: requests, duration or memory. The value passed for it is ignored.
+    @return: The solved value, expressed in request_unit, milliseconds or memory_unit respectively.
+    """
+    if budget < 0:
+        raise ValueError("Budget must be a non-negative amount of USD")
+
+    # Validate the known inputs; the unknown keeps a valid placeholder value
+    CalculationRequest(
+        region=region,
+        architecture=architecture,
+        number_of_requests=number_of_requests if unknown != "requests" else 1,
+        request_unit=request_unit,
+        duration_of_each_request_in_ms=(
+            duration_of_each_request_in_ms if unknown != "duration" else 1
+        ),
+        memory=memory if unknown != "memory" else 128,
+        memory_unit=memory_unit if unknown != "memory" else "MB",
+        ephemeral_storage=ephemeral_storage,
+        storage_unit=storage_unit,
+        include_free_tier=include_free_tier,
+    )
+
+    pricing = load_pricing(region)
+    schedule = pricing.schedule_for(architecture)
+
+    free_usage = FREE_TIER_COMPUTE_GB_SEC if include_free_tier else 0
+    free_requests = FREE_TIER_REQUESTS if include_free_tier else 0
+    compute = _tiered_segments(schedule.tiers, schedule.overflow_rate, free_usage)
+    billed_requests: Segments = [(0.0, 0.0)] if free_requests else []
+    billed_requests.append((float(free_requests), pricing.requests_rate))
+
+    requests_per_month = int(number_of_requests * REQUESTS_PER_MONTH[request_unit])
+    memory_in_gb = memory * MB_TO_GB if memory_unit == "MB" else memory
+    storage_in_gb = (
+        ephemeral_storage * MB_TO_GB if storage_unit == "MB" else ephemeral_storage
+    )
+    # USD per compute second for ephemeral storage above the free 0.5 GB
+    storage_rate = (
+        max(0.0, storage_in_gb - FREE_EPHEMERAL_STORAGE_GB)
+        * pricing.ephemeral_storage_rate
+    )
+    duration_in_sec = duration_of_each_request_in_ms * 0.001
+
+    # Every cost component is a piecewise linear function of the unknown, so the
+    # total is too, and can be inverted exactly segment by segment.
+    unit: str
+    match unknown:
+        case "requests":
+            # x = requests per month
+            curve = _merge(
+                _scale(compute, memory_in_gb * duration_in_sec),
+                billed_requests,
+                [(0.0, storage_rate * duration_in_sec)],
+            )
+            solved = _invert(curve, 0.0, budget)
+            value = solved / REQUESTS_PER_MONTH[request_unit]
+            unit = request_unit
+        case "duration":
+            # x = duration of each request in ms
+            fixed = _evaluate(billed_requests, requests_per_month)
+            curve = _merge(
+                _scale(compute, memory_in_gb * requests_per_month * 0.001),
+                [(0.0, storage_rate * requests_per_month * 0.001)],
+            )
+            value = _invert(curve, fixed, budget)
+            unit = "ms"
+        case "memory":
+            # x = memory in GB
+            total_compute_sec = requests_per_month * duration_in_sec
+            fixed = _evaluate(billed_requests, requests_per_month) + (
+                storage_rate * total_compute_sec
+            )
+            curve = _scale(compute, total_compute_sec)
+            solved = _invert(curve, fixed, budget)
+            if solved < MIN_MEMORY_GB:
+                raise ValueError(
+                    f"Budget of ${budget:.4f} USD does not cover the minimum memory of 128 MB"
+                )
+            solved = min(solved, MAX_MEMORY_GB)
+            value = solved / MB_TO_GB if memory_unit == "MB" else solved
+            unit = memory_unit
+        case _:
+            raise ValueError(f"Unknown variable to solve for: {unknown}")
+
+    logger.debug(f"Solved {unknown} for a budget of ${budget} USD: {value} {unit}")
+    return SolveResult(unknown=unknown, value=value, unit=unit, budget=budget)
@@ -0,0 +1,290 @@
+import logging
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from functools import partial
+from typing import Any
+
+import numpy as np
+from numpy.typing import ArrayLike, DTypeLike
+
+from .batch import (
+    encode,
+    monthly_charges,
+    requests_per_month_multiplier,
+    unit_to_gb,
+    validate_limits,
+)
+from .memory_pricing import MemoryRounding, memory_price_lookup
+from .pricing import ARCHITECTURES
+from .pricing_table import PricingTable, load_pricing_table
+from .regions import select_regions
+
+logger = logging.getLogger(__name__)
+
+# Parameters of calculate(), in the order their axes appear in a sweep
+PARAMETERS = (
+    "region",
+    "architecture",
+    "number_of_requests",
+    "request_unit",
+    "duration_of_each_request_in_ms",
+    "memory",
+    "memory_unit",
+    "ephemeral_storage",
+    "storage_unit",
+    "include_free_tier",
+)
+
+DEFAULT_CHUNK_SIZE = 1_000_000
+
+
+@dataclass(frozen=True, slots=True)
+class SweepResult:
+    """Dense cost cube of a parameter sweep, with one dimension per swept parameter."""
+
+    axes: dict[str, np.ndarray]
+    total_cost: np.ndarray
+
+    def to_long(self) -> dict[str, np.ndarray]:
+        """Flatten the cube into a long-format table: one column per axis plus total_cost."""
+        grids = np.meshgrid(*self.axes.values(), indexing="ij")
+        columns = {name: grid.ravel() for name, grid in zip(self.axes, grids)}
+        columns["total_cost"] = self.total_cost.ravel()
+        return columns
+
+    def to_records(self) -> list[dict[str, Any]]:
+        """Flatten the cube into JSON-serializable rows, e.g. for the site or plotting."""
+        columns = {name: column.tolist() for name, column in self.to_long().items()}
+        return [dict(zip(columns, row)) for row in zip(*columns.values())]
+
+
+@dataclass(frozen=True, slots=True)
+class _SweepPlan:
+    """Encoded sweep inputs: swept parameters hold one entry per axis value."""
+
+    table: PricingTable
+    axes: dict[str, np.ndarray]
+    encoded: dict[str, np.ndarray]
+    memory_lookup: np.ndarray | None = None
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return tuple(len(values) for values in self.axes.values())
+
+    def positions(self, start: int, stop: int) -> tuple[np.ndarray, ...]:
+        """Per-axis positions of the cells with flat (C-order) indices in [start, stop)."""
+        if not self.axes:
+            return ()
+        return np.unravel_index(np.arange(start, stop), self.shape)
+
+    def charges(self, positions: tuple[np.ndarray, ...]) -> tuple[np.ndarray, ...]:
+        """Price the cells at the given per-axis positions."""
+        by_axis = dict(zip(self.axes, positions))
+        gathered = {
+            name: values[by_axis[name]] if name in by_axis else values
+            for name, values in self.encoded.items()
+        }
+        # encoded parameters are in the positional order of monthly_charges
+        charges = partial(monthly_charges, memory_lookup=self.memory_lookup)
+        return charges(self.table, *gathered.values())
+
+
+def _is_axis(value: Any) -> bool:
+    return isinstance(value, (list, tuple, range, np.ndarray))
+
+
+def _plan(
+    params: dict[str, Any], memory_rounding: MemoryRounding | None = None
+) -> _SweepPlan:
+    """Split parameters into axes and constants, encode them and validate the limits."""
+    axes = {
+        name: np.asarray(params[name]) for name in PARAMETERS if _is_axis(params[name])
+    }
+    for name, values in axes.items():
+        if values.ndim != 1 or values.size == 0:
+            raise ValueError(f"Sweep axis '{name}' must be a non-empty 1-D sequence")
+
+    regions = params["region"] if _is_axis(params["region"]) else [params["region"]]
+    table = load_pricing_table(tuple(str(code) for code in regions))
+
+    encoders = {
+        "region": lambda v: encode(
+            v, {c: i for i, c in enumerate(table.regions)}, "region"
+        ),
+        "architecture": lambda v: encode(
+            v, {a: i for i, a in enumerate(ARCHITECTURES)}, "architecture"
+        ),
+        "number_of_requests": lambda v: np.asarray(v, dtype=float),
+        "request_unit": requests_per_month_multiplier,
+        "duration_of_each_request_in_ms": lambda v: np.asarray(v, dtype=float),
+        "memory": lambda v: np.asarray(v, dtype=float),
+        "memory_unit": lambda v: unit_to_gb(v, "memory unit"),
+        "ephemeral_storage": lambda v: np.asarray(v, dtype=float),
+        "storage_unit": lambda v: unit_to_gb(v, "storage unit"),
+        "include_free_tier": lambda v: np.asarray(v, dtype=bool),
+    }
+    encoded = {name: encoders[name](params[name]) for name in PARAMETERS}
+
+    # Each axis lives on its own dimension, so validation only broadcasts the axes
+    # that interact (e.g. memory x memory_unit), never the whole cube.
+    dims = {name: i for i, name in enumerate(axes)}
+
+    def placed(name: str) -> np.ndarray:
+        if name not in dims:
+            return encoded[name]
+        shape = [1] * len(dims)
+        shape[dims[name]] = -1
+        return encoded[name].reshape(shape)
+
+    validate_limits(
+        placed("number_of_requests"),
+        placed("duration_of_each_request_in_ms"),
+        placed("memory"),
+        placed("memory_unit"),
+        placed("ephemeral_storage"),
+        placed("storage_unit"),
+    )
+    memory_lookup = (
+        memory_price_lookup(table.regions, memory_rounding) if memory_rounding else None
+    )
+    return _SweepPlan(
+        table=table, axes=axes, encoded=encoded, memory_lookup=memory_lookup
+    )
+
+
+def sweep_chunks(
+    region: str | Sequence[str] = "us-east-1",
+    architecture: str | Sequence[str] = "x86",
+    number_of_requests: ArrayLike = 1000000,
+    request_unit: str | Sequence[str] = "per day",
+    duration_of_each_request_in_ms: ArrayLike = 1500,
+    memory: ArrayLike = 128,
+    memory_unit: str | Sequence[str] = "MB",
+    ephemeral_storage: ArrayLike = 512,
+    storage_unit: str | Sequence[str] = "MB",
+    include_free_tier: bool | Sequence[bool] = True,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    memory_rounding: MemoryRounding | None = None,
+) -> Iterator[dict[str, np.ndarray]]:
+    """
+    @brief Stream a parameter sweep as long-format chunks, without materializing the cube.
+    Takes the same arguments as sweep().
+    @return: An iterator of {axis name: values, ..., "total_cost": costs} chunks in C order.
+    """
+    plan = _plan(
+        {
+            "region": region,
+            "architecture": architecture,
+            "number_of_requests": number_of_requests,
+            "request_unit": request_unit,
+            "duration_of_each_request_in_ms": duration_of_each_request_in_ms,
+            "memory": memory,
+            "memory_unit": memory_unit,
+            "ephemeral_storage": ephemeral_storage,
+            "storage_unit": storage_unit,
+            "include_free_tier": include_free_tier,
+        },
+        memory_rounding,
+    )
+    size = int(np.prod(plan.shape))
+    for start in range(0, size, chunk_size):
+        stop = min(start + chunk_size, size)
+        positions = plan.positions(start, stop)
+        compute, request, storage = plan.charges(positions)
+        chunk = {
+            name: values[position]
+            for (name, values), position in zip(plan.axes.items(), positions)
+        }
+        chunk["total_cost"] = np.broadcast_to(
+            compute + request + storage, (stop - start,)
+        )
+        yield chunk
+
+
+def sweep(
+    region: str | Sequence[str] = "us-east-1",
+    architecture: str | Sequence[str] = "x86",
+    number_of_requests: ArrayLike = 1000000,
+    request_unit: str | Sequence[str] = "per day",
+    duration_of_each_request_in_ms: ArrayLike = 1500,
+    memory: ArrayLike = 128,
+    memory_unit: str | Sequence[str] = "MB",
+    ephemeral_storage: ArrayLike = 512,
+    storage_unit: str | Sequence[str] = "MB",
+    include_free_tier: bool | Sequence[bool] = True,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    dtype: DTypeLike = np.float64,
+    memory_rounding: MemoryRounding | None = None,
+) -> SweepResult:
+    """
+    @brief Evaluate the monthly cost over a grid of parameters.
+    Every argument of calculate() accepts either a single value or a sequence of values;
+    each sequence becomes an axis of the result, in the order of calculate()'s parameters.
+    @param chunk_size: Number of cells priced at once, bounding the working memory.
+    @param dtype: The dtype of the result cube (float32 halves its memory).
+    @param memory_rounding: Price the duration from the per-ms Memory table, interpolating
+        or snapping between listed sizes, instead of the GB-s tiers.
+    @return: The cost cube along with the values of each axis.
+    """
+    plan = _plan(
+        {
+            "region": region,
+            "architecture": architecture,
+            "number_of_requests": number_of_requests,
+            "request_unit": request_unit,
+            "duration_of_each_request_in_ms": duration_of_each_request_in_ms,
+            "memory": memory,
+            "memory_unit": memory_unit,
+            "ephemeral_storage": ephemeral_storage,
+            "storage_unit": storage_unit,
+            "include_free_tier": include_free_tier,
+        },
+        memory_rounding,
+    )
+    total_cost = np.empty(plan.shape, dtype=dtype)
+    flat = total_cost.reshape(-1)
+    logger.debug(f"Sweeping {flat.size:,} cells over {plan.shape}")
+
+    for start in range(0, flat.size, chunk_size):
+        stop = min(start + chunk_size, flat.size)
+        compute, request, storage = plan.charges(plan.positions(start, stop))
+        flat[start:stop] = compute + request + storage
+
+    return SweepResult(axes=plan.axes, total_cost=total_cost)
+
+
+def compare_regions(
+    regions: str | Sequence[str] = "*",
+    architecture: str | Sequence[str] = "x86",
+    number_of_requests: ArrayLike = 1000000,
+    request_unit: str | Sequence[str] = "per day",
+    duration_of_each_request_in_ms: ArrayLike = 1500,
+    memory: ArrayLike = 128,
+    memory_unit: str | Sequence[str] = "MB",
+    ephemeral_storage: ArrayLike = 512,
+    storage_unit: str | Sequence[str] = "MB",
+    include_free_tier: bool | Sequence[bool] = True,
+    memory_rounding: MemoryRounding | None = None,
+) -> SweepResult:
+    """
+    @brief Price the same workload in every region a selector picks, in one sweep.
+    The selected regions share one pricing table, loaded once, instead of a calculate()
+    per region each opening its cost factors.
+    @param regions: A region selector, e.g. `eu-*`, `us-gov-*` or `arm64`, see
+        RegionIndex.select().
+    Takes the other arguments of sweep().
+    @return: The sweep with the selected regions as its first axis.
+    """
+    return sweep(
+        list(select_regions(regions)),
+        architecture,
+        number_of_requests,
+        request_unit,
+        duration_of_each_request_in_ms,
+        memory,
+        memory_unit,
+        ephemeral_storage,
+        storage_unit,
+        include_free_tier,
+        memory_rounding=memory_rounding,
+    )
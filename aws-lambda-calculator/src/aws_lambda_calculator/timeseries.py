@@ -0,0 +1,228 @@
+import csv
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from .batch import encode, tiered_cost, unit_to_gb, validate_limits
+from .calculator import (
+    FREE_EPHEMERAL_STORAGE_GB,
+    FREE_TIER_COMPUTE_GB_SEC,
+    FREE_TIER_REQUESTS,
+)
+from .pricing import ARCHITECTURES
+from .pricing_table import load_pricing_table
+
+logger = logging.getLogger(__name__)
+
+# Number of (function, period) cells priced at once, bounding the working memory
+DEFAULT_CHUNK_SIZE = 4_000_000
+
+CSV_COLUMNS = ("timestamp", "function", "invocations", "duration_ms")
+
+
+@dataclass(frozen=True, slots=True)
+class UsageSeries:
+    """Per-period usage of several functions, e.g. from a CloudWatch export."""
+
+    functions: tuple[str, ...]
+    timestamps: np.ndarray  # (periods,) datetime64
+    invocations: np.ndarray  # (functions, periods)
+    duration_ms: np.ndarray  # (functions, periods), average duration of the period
+
+
+@dataclass(frozen=True, slots=True)
+class SeriesResult:
+    """Cumulative cost curves of a usage series."""
+
+    # (functions, periods): cost accrued from the start of the series to each period
+    cumulative_cost: np.ndarray
+    months: np.ndarray  # (months,) datetime64[M], or empty for a single undated month
+    monthly_cost: np.ndarray  # (functions, months)
+
+    @property
+    def total_cost(self) -> np.ndarray:
+        """Cost of each function over the whole series."""
+        return self.cumulative_cost[..., -1]
+
+
+def read_csv(lines: Iterable[str]) -> UsageSeries:
+    """
+    @brief Read a usage series from long-format CSV rows.
+    The header must name the columns timestamp, function, invocations and duration_ms;
+    periods without a row for a function count as idle.
+    @param lines: An open file or any iterable of CSV lines.
+    @return: The usage series, with periods sorted by timestamp.
+    """
+    reader = csv.DictReader(lines)
+    missing = set(CSV_COLUMNS) - set(reader.fieldnames or ())
+    if missing:
+        raise ValueError(f"Missing CSV columns: {', '.join(sorted(missing))}")
+
+    rows = [tuple(row[column] for column in CSV_COLUMNS) for row in reader]
+    if not rows:
+        raise ValueError("The usage series is empty")
+    timestamps, functions, invocations, duration_ms = zip(*rows)
+
+    periods, period_index = np.unique(
+        np.asarray(timestamps, dtype="datetime64[s]"), return_inverse=True
+    )
+    names, function_index = np.unique(np.asarray(functions), return_inverse=True)
+    shape = (len(names), len(periods))
+    series = UsageSeries(
+        functions=tuple(str(name) for name in names),
+        timestamps=periods,
+        invocations=np.zeros(shape),
+        duration_ms=np.zeros(shape),
+    )
+    series.invocations[function_index, period_index] = np.asarray(
+        invocations, dtype=float
+    )
+    series.duration_ms[function_index, period_index] = np.asarray(
+        duration_ms, dtype=float
+    )
+    return series
+
+
+def _month_starts(timestamps: ArrayLike | None, periods: int) -> tuple[np.ndarray, ...]:
+    """Billing months of the periods, the index of each period's month and month starts."""
+    if timestamps is None:
+        return (
+            np.array([], dtype="datetime64[M]"),
+            np.zeros(periods, int),
+            np.zeros(1, int),
+        )
+
+    stamps = np.asarray(timestamps, dtype="datetime64[s]")
+    if stamps.shape != (periods,):
+        raise ValueError("There must be one timestamp per period")
+    if np.any(stamps[1:] < stamps[:-1]):
+        raise ValueError("Timestamps must be in ascending order")
+    months, month_index = np.unique(stamps.astype("datetime64[M]"), return_inverse=True)
+    starts = np.concatenate([[0], np.flatnonzero(np.diff(month_index)) + 1])
+    return months, month_index, starts
+
+
+def _within_month(values: np.ndarray, month_index: np.ndarray, starts: np.ndarray):
+    """Running sum of each row along the periods, restarting at every month."""
+    running = np.cumsum(values, axis=-1)
+    before = np.zeros((len(values), len(starts)))
+    before[:, 1:] = running[:, starts[1:] - 1]
+    return running - before[:, month_index]
+
+
+def price_series(
+    invocations: ArrayLike,
+    duration_ms: ArrayLike,
+    timestamps: ArrayLike | None = None,
+    region: ArrayLike = "us-east-1",
+    architecture: ArrayLike = "x86",
+    memory: ArrayLike = 128,
+    memory_unit: ArrayLike = "MB",
+    ephemeral_storage: ArrayLike = 512,
+    storage_unit: ArrayLike = "MB",
+    include_free_tier: bool = True,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> SeriesResult:
+    """
+    @brief Price a usage series in order, crossing tier boundaries when the usage does.
+    GB-seconds and requests accumulate period by period from the start of each calendar
+    month, so the free tier is used up first and each tier's rate applies from the
+    period in which it is reached.
+    @param invocations: Invocations per period, shape (periods,) or (functions, periods).
+    @param duration_ms: Average duration per period, broadcast against invocations.
+    @param timestamps: Start of each period; None treats the series as one billing month.
+    @param region, architecture, memory, memory_unit, ephemeral_storage, storage_unit:
+        As in calculate(), either one value or one value per function.
+    @param chunk_size: Number of cells priced at once, bounding the working memory.
+    @return: The cumulative cost curve of each function along with its monthly costs.
+    """
+    invocations = np.asarray(invocations, dtype=float)
+    one_function = invocations.ndim == 1
+    invocations = np.atleast_2d(invocations)
+    if invocations.ndim != 2 or invocations.shape[1] == 0:
+        raise ValueError("Invocations must be a non-empty 1-D or 2-D series")
+    duration_ms = np.broadcast_to(
+        np.asarray(duration_ms, dtype=float), invocations.shape
+    )
+    if np.any(invocations < 0) or np.any(duration_ms < 0):
+        raise ValueError("Invocations and durations must not be negative")
+
+    functions, periods = invocations.shape
+    months, month_index, starts = _month_starts(timestamps, periods)
+
+    region = np.asarray(region)
+    regions = tuple(str(code) for code in np.unique(region))
+    table = load_pricing_table(regions)
+    memory = np.asarray(memory, dtype=float)
+    memory_to_gb = unit_to_gb(memory_unit, "memory unit")
+    ephemeral_storage = np.asarray(ephemeral_storage, dtype=float)
+    storage_to_gb = unit_to_gb(storage_unit, "storage unit")
+    # idle periods are allowed, so only the configuration limits are checked
+    validate_limits(
+        np.ones(1),
+        np.ones(1),
+        memory,
+        memory_to_gb,
+        ephemeral_storage,
+        storage_to_gb,
+    )
+    region_index, architecture_index, memory_gb, storage_gb = (
+        np.broadcast_to(values, (functions,))
+        for values in (
+            encode(region, {code: i for i, code in enumerate(regions)}, "region"),
+            encode(
+                architecture,
+                {arch: i for i, arch in enumerate(ARCHITECTURES)},
+                "architecture",
+            ),
+            memory * memory_to_gb,
+            ephemeral_storage * storage_to_gb,
+        )
+    )
+    free_gb_sec = FREE_TIER_COMPUTE_GB_SEC if include_free_tier else 0
+    free_requests = FREE_TIER_REQUESTS if include_free_tier else 0
+    logger.debug(f"Pricing {functions:,} functions over {periods:,} periods")
+
+    cumulative_cost = np.empty((functions, periods))
+    rows = max(1, chunk_size // periods)
+    for start in range(0, functions, rows):
+        rows_slice = slice(start, start + rows)
+        r, a = region_index[rows_slice], architecture_index[rows_slice]
+        compute_sec = invocations[rows_slice] * duration_ms[rows_slice] * 0.001
+
+        gb_sec = _within_month(
+            compute_sec * memory_gb[rows_slice, None], month_index, starts
+        )
+        compute = tiered_cost(
+            np.maximum(gb_sec - free_gb_sec, 0.0),
+            table.tier_thresholds[r, a][:, None],
+            table.tier_rates[r, a][:, None],
+            table.overflow_rate[r, a][:, None],
+        )
+        requests = _within_month(invocations[rows_slice], month_index, starts)
+        request = (
+            np.maximum(requests - free_requests, 0.0) * table.requests_rate[r, None]
+        )
+        storage = _within_month(
+            compute_sec
+            * (
+                np.maximum(storage_gb[rows_slice] - FREE_EPHEMERAL_STORAGE_GB, 0.0)
+                * table.ephemeral_storage_rate[r]
+            )[:, None],
+            month_index,
+            starts,
+        )
+        cumulative_cost[rows_slice] = compute + request + storage
+
+    # Months restart from zero; carry the totals of the months already billed
+    ends = np.concatenate([starts[1:], [periods]]) - 1
+    monthly_cost = cumulative_cost[:, ends]
+    carried = np.cumsum(monthly_cost, axis=-1) - monthly_cost
+    cumulative_cost += carried[:, month_index]
+
+    if one_function:
+        return SeriesResult(cumulative_cost[0], months, monthly_cost[0])
+    return SeriesResult(cumulative_cost, months, monthly_cost)
@@ -0,0 +1,141 @@
+import numpy as np
+import pytest
+from pytest import approx
+from aws_lambda_calculator.aggregate import aggregate
+from aws_lambda_calculator.calculator import calculate
+from aws_lambda_calculator.free_tier import calculate_account
+
+FUNCTION = {
+    "region": "us-east-1",
+    "architecture": "x86",
+    "number_of_requests": 1_000_000,
+    "request_unit": "per day",
+    "duration_of_each_request_in_ms": 200,
+    "memory": 1024,
+    "memory_unit": "MB",
+    "ephemeral_storage": 1024,
+    "storage_unit": "MB",
+}
+
+
+class TestAggregate:
+    """Tests for account-level aggregation across functions."""
+
+    def test_single_function_matches_calculate(self):
+        """An account with one function is billed exactly like calculate()."""
+        for include_free_tier in (True, False):
+            result = aggregate(**FUNCTION, include_free_tier=include_free_tier)
+            expected = calculate(**FUNCTION, include_free_tier=include_free_tier)
+            assert result.total_cost[()] == approx(expected.total_cost)
+
+    def test_free_tier_applied_once(self):
+        """Identical functions share one free tier instead of getting one each."""
+        fleet = aggregate(**{**FUNCTION, "number_of_requests": [1_000_000] * 3})
+        merged = calculate(**{**FUNCTION, "number_of_requests": 3_000_000})
+        isolated = calculate(**FUNCTION).total_cost * 3
+        assert fleet.account_total == approx(merged.total_cost)
+        assert fleet.account_total > isolated
+
+    def test_tiers_crossed_by_the_fleet(self):
+        """Functions that each stay in the first tier push the account into the next."""
+        # 2 x 4.1B GB-s: each alone is in tier 1, together they cross 6B GB-s
+        heavy = {
+            **FUNCTION,
+            "request_unit": "per month",
+            "number_of_requests": 4_100_000_000,
+            "duration_of_each_request_in_ms": 1000,
+            "memory": 1,
+            "memory_unit": "GB",
+            "ephemeral_storage": 512,
+        }
+        fleet = aggregate(**{**heavy, "number_of_requests": [4_100_000_000] * 2})
+        group = fleet.groups[0]
+        assert group.total_compute_gb_sec == approx(8.2e9)
+        isolated = calculate(**heavy, include_free_tier=True).total_cost
+        assert fleet.account_total < 2 * isolated
+        assert fleet.compute_charges[0] == approx(fleet.compute_charges[1])
+
+    def test_groups_are_priced_separately(self):
+        """Each (region, architecture) pair has its own tiers."""
+        result = aggregate(
+            **{
+                **FUNCTION,
+                "region": ["us-east-1", "eu-west-1", "us-east-1"],
+                "architecture": ["x86", "x86", "arm64"],
+            },
+            include_free_tier=False,
+        )
+        assert [(g.region, g.architecture) for g in result.groups] == [
+            ("eu-west-1", "x86"),
+            ("us-east-1", "x86"),
+            ("us-east-1", "arm64"),
+        ]
+        for i, region in enumerate(["us-east-1", "eu-west-1"]):
+            expected = calculate(
+                **{**FUNCTION, "region": region}, include_free_tier=False
+            )
+            assert result.total_cost[i] == approx(expected.total_cost)
+
+    def test_attribution_sums_to_groups(self):
+        """Attributed charges add up to the group totals."""
+        rng = np.random.default_rng(0)
+        result = aggregate(
+            **{
+                **FUNCTION,
+                "number_of_requests": rng.integers(1, 10_000_000, 500),
+                "memory": rng.integers(128, 10240, 500),
+                "architecture": rng.choice(["x86", "arm64"], 500),
+            }
+        )
+        assert result.compute_charges.sum() == approx(
+            sum(g.compute_charges for g in result.groups)
+        )
+        assert result.request_charges.sum() == approx(
+            sum(g.request_charges for g in result.groups)
+        )
+        assert sum(g.functions for g in result.groups) == 500
+
+    def test_within_free_tier(self):
+        """A small fleet within the free tier pays only for storage."""
+        result = aggregate(
+            **{
+                **FUNCTION,
+                "request_unit": "per month",
+                "number_of_requests": [1000, 2000],
+                "ephemeral_storage": 512,
+            }
+        )
+        assert result.account_total == 0.0
+
+    def test_large_fleet(self):
+        """100k functions are aggregated into one bill per group."""
+        rng = np.random.default_rng(1)
+        n = 100_000
+        result = aggregate(
+            **{
+                **FUNCTION,
+                "region": rng.choice(["us-east-1", "eu-west-1", "ap-south-1"], n),
+                "number_of_requests": rng.integers(1, 1_000_000, n),
+                "memory": rng.integers(128, 10240, n),
+            }
+        )
+        assert result.total_cost.shape == (n,)
+        assert result.total_cost.sum() == approx(result.account_total)
+
+    @pytest.mark.parametrize("policy", ["pro-rata", "largest-first", "by-architecture"])
+    def test_matches_calculate_account(self, policy):
+        """The account engine prices the fleet, under any free tier policy."""
+        fleet = {
+            **FUNCTION,
+            "request_unit": "per month",
+            "number_of_requests": [300_000, 600_000, 900_000],
+            "architecture": ["arm64", "x86", "arm64"],
+        }
+        result = aggregate(**fleet, free_tier_policy=policy)
+        expected = calculate_account(**fleet, free_tier_policy=policy)
+        assert result.total_cost == approx(expected.total_cost)
+
+    def test_invalid_input(self):
+        """Inputs are validated like calculate_batch()."""
+        with pytest.raises(ValueError, match="Unknown region"):
+            aggregate(**{**FUNCTION, "region": ["us-east-1", "invalid-region"]})
@@ -0,0 +1,124 @@
+import numpy as np
+import pytest
+from pytest import approx
+from aws_lambda_calculator.batch import calculate_batch, calculate_batch_result
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+from aws_lambda_calculator.arrow_io import (
+    COST_COLUMNS,
+    calculate_parquet,
+    calculate_table,
+    dictionary_codes,
+    encode_table,
+)
+
+WORKLOADS = {
+    "region": ["eu-west-1", "us-east-1", "eu-west-1", "ap-south-1"],
+    "architecture": ["x86", "arm64", "x86", "arm64"],
+    "number_of_requests": [1000.0, 50.0, 2.5, 1e6],
+    "request_unit": ["per day", "per second", "per minute", "per month"],
+    "duration_of_each_request_in_ms": [100.0, 1500.0, 20.0, 900.0],
+    "memory": [128.0, 1.0, 2048.0, 4096.0],
+    "memory_unit": ["MB", "GB", "MB", "MB"],
+    "ephemeral_storage": [512.0, 2.0, 1024.0, 10240.0],
+    "storage_unit": ["MB", "GB", "MB", "MB"],
+    "include_free_tier": [True, False, True, False],
+}
+
+
+def _table(columns, dictionary=()):
+    return pa.table(
+        {
+            name: pa.array(values).dictionary_encode()
+            if name in dictionary
+            else pa.array(values)
+            for name, values in columns.items()
+        }
+    )
+
+
+class TestEncodeTable:
+    """Tests for reading workloads from Arrow columns."""
+
+    @pytest.mark.parametrize(
+        "dictionary", [(), ("region", "architecture", "request_unit", "memory_unit")]
+    )
+    def test_matches_calculate_batch(self, dictionary):
+        """Plain and dictionary-encoded columns price like calculate_batch()."""
+        result = calculate_table(_table(WORKLOADS, dictionary))
+        expected = calculate_batch_result(**WORKLOADS)
+        for name in COST_COLUMNS:
+            assert result.column(name).to_numpy() == approx(getattr(expected, name))
+
+    def test_defaults(self):
+        """Missing columns take the calculate() defaults."""
+        table = pa.table({"memory": [128.0, 1024.0]})
+        result = calculate_table(table).column("total_cost").to_numpy()
+        assert result == approx(calculate_batch(memory=[128, 1024]))
+
+    def test_chunked_dictionaries(self):
+        """Chunks with different dictionaries map to the same pricing indexes."""
+        region = pa.chunked_array(
+            [
+                pa.array(["us-east-1", "eu-west-1"]).dictionary_encode(),
+                pa.array(["eu-west-1", "sa-east-1"]).dictionary_encode(),
+            ]
+        )
+        workloads = encode_table(pa.table({"region": region}))
+        assert workloads.table.regions == ("eu-west-1", "sa-east-1", "us-east-1")
+        assert workloads.region_index.tolist() == [2, 0, 0, 1]
+
+    def test_unused_dictionary_values(self):
+        """Dictionary entries no row refers to are never looked up."""
+        region = pa.DictionaryArray.from_arrays(
+            pa.array([1, 1], pa.int32()), ["nowhere-1", "us-east-1"]
+        )
+        values, codes = dictionary_codes(pa.table({"region": region}), "region")
+        assert values == ["us-east-1"]
+        assert codes.tolist() == [0, 0]
+
+    def test_zero_copy(self):
+        """Float64 columns without nulls are used in place."""
+        memory = np.array([128.0, 256.0])
+        workloads = encode_table(pa.table({"memory": memory}))
+        assert np.shares_memory(workloads.memory, memory)
+
+    @pytest.mark.parametrize(
+        "columns, message",
+        [
+            ({"architecture": ["x86", "sparc"]}, "Unknown architecture: sparc"),
+            ({"memory_unit": ["MB", "KB"]}, "Unknown memory unit: KB"),
+            ({"memory": [128.0, None]}, "Missing values in column: memory"),
+            ({"memory": [64.0, 128.0]}, "Memory must be between"),
+        ],
+    )
+    def test_invalid(self, columns, message):
+        """Invalid columns raise the same errors as the batch path."""
+        with pytest.raises(ValueError, match=message):
+            encode_table(pa.table(columns))
+
+
+class TestCalculateParquet:
+    """Tests for pricing Parquet files."""
+
+    def test_round_trip(self, tmp_path):
+        """The priced file keeps the input columns and appends the charges."""
+        source, destination = tmp_path / "fleet.parquet", tmp_path / "priced.parquet"
+        table = _table({"function": ["a", "b", "c", "d"], **WORKLOADS}, ("region",))
+        pq.write_table(table, source)
+
+        calculate_parquet(str(source), str(destination))
+        priced = pq.read_table(destination)
+        assert priced.column_names == [*table.column_names, *COST_COLUMNS]
+        assert priced.column("function").to_pylist() == ["a", "b", "c", "d"]
+        assert priced.column("total_cost").to_numpy() == approx(
+            calculate_batch(**WORKLOADS)
+        )
+
+    def test_existing_column(self, tmp_path):
+        """Cost columns never overwrite input columns."""
+        source = tmp_path / "fleet.parquet"
+        pq.write_table(pa.table({"total_cost": [1.0]}), source)
+        with pytest.raises(ValueError, match="Column already exists: total_cost"):
+            calculate_parquet(str(source), str(tmp_path / "priced.parquet"))
@@ -0,0 +1,167 @@
+import itertools
+
+import numpy as np
+import pytest
+from pytest import approx
+from aws_lambda_calculator.batch import (
+    calculate_batch,
+    encode,
+    encode_unit,
+    tiered_cost,
+)
+from aws_lambda_calculator.calculator import calculate, calculate_tiered_cost
+from aws_lambda_calculator.models import REQUEST_UNITS, SIZE_UNITS
+
+WORKLOADS = [
+    {
+        "region": region,
+        "architecture": architecture,
+        "number_of_requests": number_of_requests,
+        "request_unit": request_unit,
+        "duration_of_each_request_in_ms": 250,
+        "memory": memory,
+        "memory_unit": "MB",
+        "ephemeral_storage": 2,
+        "storage_unit": "GB",
+        "include_free_tier": include_free_tier,
+    }
+    for region, architecture, number_of_requests, request_unit, memory, include_free_tier in itertools.product(
+        ["us-east-1", "eu-central-2", "af-south-1"],
+        ["x86", "arm64"],
+        [1, 5_000, 2_000_000],
+        ["per second", "per day", "million per month"],
+        [128, 10240],
+        [True, False],
+    )
+]
+
+
+def _columns(rows):
+    return {name: np.array([row[name] for row in rows]) for name in rows[0]}
+
+
+class TestCalculateBatch:
+    """Tests for the vectorized batch pricing path."""
+
+    def test_matches_calculate(self):
+        """Every workload in a batch costs the same as through calculate()."""
+        expected = [calculate(**row).total_cost for row in WORKLOADS]
+        assert calculate_batch(**_columns(WORKLOADS)) == approx(expected, rel=1e-12)
+
+    def test_scalars_broadcast(self):
+        """Scalar arguments are broadcast against array arguments."""
+        costs = calculate_batch(memory=[128, 256, 512])
+        assert costs.shape == (3,)
+        assert costs[1] == approx(calculate(memory=256).total_cost)
+
+    def test_scalar_input(self):
+        """A batch of scalars returns a 0-d array."""
+        assert float(calculate_batch()) == approx(calculate().total_cost)
+
+    def test_unknown_region(self):
+        """An unknown region is rejected."""
+        with pytest.raises(ValueError, match="Unknown region"):
+            calculate_batch(region=["us-east-1", "invalid-region"])
+
+    def test_unknown_unit(self):
+        """An unknown unit is rejected."""
+        with pytest.raises(ValueError, match="Unknown request unit"):
+            calculate_batch(request_unit=["per day", "per fortnight"])
+
+    @pytest.mark.parametrize(
+        ("params", "message"),
+        [
+            ({"memory": [128, 64]}, "Memory must be between 128 MB"),
+            (
+                {"memory": [1, 11], "memory_unit": "GB"},
+                "Memory must be between 0.125 GB",
+            ),
+            ({"ephemeral_storage": [256]}, "Ephemeral storage must be between 512 MB"),
+            (
+                {"ephemeral_storage": 0.25, "storage_unit": "GB"},
+                "Ephemeral storage must be between 0.5 GB",
+            ),
+            ({"number_of_requests": [0]}, "Number of requests"),
+            ({"duration_of_each_request_in_ms": [-1]}, "Duration"),
+        ],
+    )
+    def test_limits(self, params, message):
+        """Inputs outside the AWS Lambda limits are rejected."""
+        with pytest.raises(ValueError, match=message):
+            calculate_batch(**params)
+
+
+class TestVectorizedHelpers:
+    """Tests for the vectorized building blocks."""
+
+    @pytest.mark.parametrize("usage", [0.0, 500.0, 1000.0, 2500.0, 1e6])
+    def test_tiered_cost_matches_scalar(self, usage):
+        """The vectorized tiered cost matches calculate_tiered_cost."""
+        tiers = {"1000": "0.01", "2000": "0.005"}
+        expected = calculate_tiered_cost(usage, tiers, 0.001, [])
+        result = tiered_cost(
+            np.array([usage]),
+            np.array([[1000.0, 2000.0]]),
+            np.array([[0.01, 0.005]]),
+            np.array([0.001]),
+        )
+        assert result[0] == approx(expected)
+
+    def test_tiered_cost_without_tiers(self):
+        """Without tiers, all usage is billed at the overflow rate."""
+        result = tiered_cost(
+            np.array([10.0]), np.empty((1, 0)), np.empty((1, 0)), np.array([0.5])
+        )
+        assert result[0] == approx(5.0)
+
+    def test_encode(self):
+        """Categories are mapped through the lookup table, keeping the shape."""
+        result = encode([["MB", "GB"], ["GB", "GB"]], {"MB": 1, "GB": 2}, "unit")
+        assert result.tolist() == [[1, 2], [2, 2]]
+
+    def test_encode_unit(self):
+        """Unit names become codes and codes pass through."""
+        names = ["per day", "per second", "per day"]
+        codes = encode_unit(names, REQUEST_UNITS, "request unit")
+        assert codes.dtype == np.int8
+        assert [REQUEST_UNITS[code] for code in codes] == names
+        assert encode_unit(codes, REQUEST_UNITS, "request unit") == approx(codes)
+
+    def test_encode_unit_invalid_code(self):
+        """Codes outside the unit table are rejected."""
+        with pytest.raises(ValueError, match="Unknown memory unit code: 2"):
+            encode_unit(np.array([0, 2]), SIZE_UNITS, "memory unit")
+
+
+class TestUnitCodes:
+    """Tests for pricing workloads with pre-encoded units."""
+
+    def test_matches_unit_names(self):
+        """Unit codes price the same as unit names."""
+        request_unit = list(REQUEST_UNITS)
+        memory_unit = ["MB", "GB", "MB", "GB", "MB", "GB"]
+        memory = [128, 1, 2048, 0.5, 512, 10]
+        expected = calculate_batch(
+            number_of_requests=[5] * 6,
+            request_unit=request_unit,
+            memory=memory,
+            memory_unit=memory_unit,
+        )
+        result = calculate_batch(
+            number_of_requests=[5] * 6,
+            request_unit=np.arange(len(REQUEST_UNITS)),
+            memory=memory,
+            memory_unit=[SIZE_UNITS.index(unit) for unit in memory_unit],
+            storage_unit=SIZE_UNITS.index("MB"),
+        )
+        assert result == approx(expected)
+
+    def test_calculate(self):
+        """calculate() takes unit codes and reports the unit names."""
+        result = calculate(
+            request_unit=REQUEST_UNITS.index("per second"),
+            memory=1,
+            memory_unit=SIZE_UNITS.index("GB"),
+        )
+        expected = calculate(request_unit="per second", memory=1, memory_unit="GB")
+        assert result == expected
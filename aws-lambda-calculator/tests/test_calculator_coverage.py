@@ -1,32 +1,26 @@
+import subprocess
+import sys
+
 import pytest
 from pytest import approx
+from aws_lambda_calculator import calculator
 from aws_lambda_calculator.calculator import (
     calculate,
-    open_json_file,
     unit_conversion_requests,
     unit_conversion_memory,
     unit_conversion_ephemeral_storage,
     calculate_tiered_cost,
+    CONVERSION_CACHE_SIZE,
+    cache_stats,
+    clear_caches,
 )
-from aws_lambda_calculator.models import CalculationResult
+from aws_lambda_calculator.models import CalculationRequest, CalculationResult
 from pydantic import ValidationError
 
 
 class TestCalculatorFunctionCoverage:
     """Tests to improve coverage of calculator functions."""
 
-    def test_open_json_file_valid_region(self):
-        """Test opening JSON file for valid region."""
-        result = open_json_file("us-east-1")
-        assert isinstance(result, dict)
-        assert "Requests" in result
-        assert "EphemeralStorage" in result
-
-    def test_open_json_file_invalid_region(self):
-        """Test opening JSON file for invalid region."""
-        result = open_json_file("invalid-region")
-        assert result == {}
-
     def test_unit_conversion_requests_per_second(self):
         """Test request conversion for per second unit."""
         steps = []
@@ -180,3 +174,100 @@ class TestCalculatorFunctionCoverage:
                 ephemeral_storage=512,
                 storage_unit="MB",
             )
+
+
+class TestMemoization:
+    """Unit conversions are memoized in bounded caches."""
+
+    def setup_method(self):
+        clear_caches()
+
+    def test_repeated_quote_hits_every_cache(self):
+        """A repeated scenario skips every unit conversion."""
+        first = calculate(memory=1024, ephemeral_storage=1024)
+        second = calculate(memory=1024, ephemeral_storage=1024)
+        assert second.total_cost == first.total_cost
+        assert second.calculation_steps == first.calculation_steps
+        stats = cache_stats()
+        assert set(stats) == {"requests", "memory", "ephemeral_storage"}
+        for info in stats.values():
+            assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+    def test_cached_conversion_still_records_its_step(self):
+        """A cache hit appends the same step as the first conversion."""
+        first, second = [], []
+        assert unit_conversion_memory(512, "MB", first) == 0.5
+        assert unit_conversion_memory(512, "MB", second) == 0.5
+        assert first == second and len(first) == 1
+        assert cache_stats()["memory"].hits == 1
+
+    def test_values_are_keyed_by_type(self):
+        """1000 and 1000.0 requests are distinct entries, as their steps differ."""
+        unit_conversion_requests(1000, "per month", [])
+        unit_conversion_requests(1000.0, "per month", [])
+        assert cache_stats()["requests"].misses == 2
+
+    def test_least_recently_used_entries_are_evicted(self):
+        """The caches never grow beyond their bound."""
+        for memory in range(CONVERSION_CACHE_SIZE + 10):
+            unit_conversion_memory(memory + 1, "MB", [])
+        info = cache_stats()["memory"]
+        assert info.currsize == info.maxsize == CONVERSION_CACHE_SIZE
+        unit_conversion_memory(1, "MB", [])
+        assert cache_stats()["memory"].hits == 0
+
+    def test_errors_are_not_cached(self):
+        """Invalid inputs raise on every call and take no cache entry."""
+        for _ in range(2):
+            with pytest.raises(ValidationError):
+                calculate(memory=64)
+            with pytest.raises(ValueError, match="Unknown memory unit"):
+                unit_conversion_memory(512, "TB", [])
+        assert cache_stats()["memory"].currsize == 0
+
+    def test_unhashable_inputs_are_rejected(self):
+        """Inputs that cannot key a cache are rejected by the model."""
+        with pytest.raises(ValidationError):
+            calculate(region=["us-east-1"])
+        assert cache_stats()["memory"].currsize == 0
+
+    def test_every_quote_gets_its_own_request(self, monkeypatch):
+        """Repeated quotes build a new request rather than sharing a cached one."""
+        built = []
+
+        class RecordedRequest(CalculationRequest):
+            def __init__(self, **data):
+                super().__init__(**data)
+                built.append(self)
+
+        monkeypatch.setattr(calculator, "CalculationRequest", RecordedRequest)
+        calculate()
+        calculate()
+        assert len(built) == 2 and built[0] is not built[1]
+
+
+class TestPackageImports:
+    def test_scalar_api_does_not_import_numpy(self):
+        """Importing the package and quoting one workload leaves numpy unloaded."""
+        code = (
+            "import sys, aws_lambda_calculator as pkg; "
+            "pkg.calculate(region='us-east-1', architecture='x86', "
+            "number_of_requests=1, request_unit='per month', "
+            "duration_of_each_request_in_ms=100, memory=128, memory_unit='MB', "
+            "ephemeral_storage=512, storage_unit='MB'); "
+            "print('numpy' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
+
+    def test_vectorized_api_is_loaded_on_access(self):
+        """Batch functions resolve lazily, even where a submodule shares their name."""
+        import aws_lambda_calculator
+        import aws_lambda_calculator.sensitivity
+
+        assert callable(aws_lambda_calculator.sensitivity)
+        assert callable(aws_lambda_calculator.calculate_batch)
+        with pytest.raises(AttributeError):
+            aws_lambda_calculator.not_an_api  # noqa: B018
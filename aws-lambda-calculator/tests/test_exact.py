@@ -0,0 +1,97 @@
+import itertools
+
+import pytest
+from pytest import approx
+from aws_lambda_calculator.calculator import calculate
+from aws_lambda_calculator.exact import (
+    ratio,
+    round_half_up,
+    tiered_cost_nanos,
+    to_pico,
+)
+from aws_lambda_calculator.pricing import OVERFLOW_RATE
+
+TIERS = [
+    (6_000_000_000, to_pico("0.0000166667")),
+    (15_000_000_000, to_pico("0.0000150000")),
+]
+
+
+class TestExactArithmetic:
+    """Tests for the scaled-integer helpers."""
+
+    def test_ratio_uses_decimal_value(self):
+        """Floats are taken at the decimal value they are written as."""
+        assert ratio(0.1) == (1, 10)
+        assert ratio("0.0000166667") == (166667, 10_000_000_000)
+
+    def test_to_pico(self):
+        """Rates become integer pico-dollars."""
+        assert to_pico("0.0000002000") == 200_000
+        assert to_pico(OVERFLOW_RATE) == 13_333_400
+
+    def test_round_half_up(self):
+        """Halves round up, everything else to the nearest integer."""
+        assert round_half_up(5, 2) == 3
+        assert round_half_up(7, 3) == 2
+        assert round_half_up(0, 3) == 0
+
+    @pytest.mark.parametrize(
+        "usage, expected",
+        [
+            (0, 0),
+            (1, 16_667),  # 16,666.7 nano-dollars, rounded once
+            (6_000_000_000, 100_000_200_000_000),
+            (15_000_000_000, 100_000_200_000_000 + 135_000_000_000_000),
+            (16_000_000_000, 235_000_200_000_000 + 13_333_400_000_000),
+        ],
+    )
+    def test_tiered_cost_nanos(self, usage, expected):
+        """Tiers and the overflow rate are billed exactly."""
+        assert tiered_cost_nanos((usage, 1), TIERS, to_pico(OVERFLOW_RATE)) == expected
+
+    def test_fractional_usage(self):
+        """Usage given as a fraction is only rounded at the end."""
+        # 1/3 GB-s at 0.0000166667 USD = 5,555.5666... nano-dollars
+        assert tiered_cost_nanos((1, 3), TIERS, 0) == 5_556
+
+
+class TestCalculateExact:
+    """Tests for calculate(exact=True)."""
+
+    @pytest.mark.parametrize(
+        "region, architecture, request_unit, memory, include_free_tier",
+        list(
+            itertools.product(
+                ["us-east-1", "ap-southeast-2"],
+                ["x86", "arm64"],
+                ["per second", "per day"],
+                [128, 1769, 10240],
+                [True, False],
+            )
+        ),
+    )
+    def test_matches_float_path(
+        self, region, architecture, request_unit, memory, include_free_tier
+    ):
+        """The exact total agrees with the float total to within float error."""
+        params = {
+            "region": region,
+            "architecture": architecture,
+            "number_of_requests": 3000,
+            "request_unit": request_unit,
+            "duration_of_each_request_in_ms": 333,
+            "memory": memory,
+            "ephemeral_storage": 3.3,
+            "storage_unit": "GB",
+            "include_free_tier": include_free_tier,
+        }
+        inexact = calculate(**params)
+        exact = calculate(**params, exact=True)
+        assert exact.total_cost_nano_usd is not None
+        assert exact.total_cost == approx(inexact.total_cost, rel=1e-9, abs=1e-9)
+        assert exact.total_cost == exact.total_cost_nano_usd / 1e9
+
+    def test_off_by_default(self):
+        """Float results carry no nano-dollar total."""
+        assert calculate().total_cost_nano_usd is None
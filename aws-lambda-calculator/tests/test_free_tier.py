@@ -0,0 +1,145 @@
+import numpy as np
+import pytest
+from pytest import approx
+from aws_lambda_calculator import aggregate, calculate, calculate_account
+from aws_lambda_calculator.calculator import (
+    FREE_TIER_COMPUTE_GB_SEC,
+    FREE_TIER_REQUESTS,
+)
+from aws_lambda_calculator.free_tier import FREE_TIER_POLICIES, allocate_free_tier
+
+# Three functions over two months, together well beyond the free tier
+FLEET = {
+    "architecture": [["x86", "x86"], ["arm64", "arm64"], ["x86", "x86"]],
+    "number_of_requests": [[2_000_000, 500_000], [1_500_000, 100], [300_000, 0.5]],
+    "request_unit": "per month",
+    "duration_of_each_request_in_ms": 200,
+    "memory": [[512], [1024], [256]],
+}
+
+
+class TestAllocateFreeTier:
+    """Tests for sharing the free tier allowance between functions."""
+
+    def test_pro_rata(self):
+        """The allowance is split in proportion to usage."""
+        free = allocate_free_tier([100.0, 300.0], 200.0)
+        assert free.tolist() == [50.0, 150.0]
+
+    def test_largest_first(self):
+        """The largest usage is covered first, ties in order."""
+        free = allocate_free_tier([100.0, 300.0, 100.0], 350.0, "largest-first")
+        assert free.tolist() == [50.0, 300.0, 0.0]
+
+    def test_by_architecture(self):
+        """The first architecture is covered before the next one."""
+        free = allocate_free_tier(
+            [100.0, 300.0, 100.0], 250.0, "by-architecture", [1, 0, 0]
+        )
+        assert free.tolist() == [0.0, 187.5, 62.5]
+        arm64_first = allocate_free_tier(
+            [100.0, 300.0, 100.0],
+            250.0,
+            "by-architecture",
+            [1, 0, 0],
+            architecture_order=("arm64", "x86"),
+        )
+        assert arm64_first.tolist() == [100.0, 112.5, 37.5]
+
+    @pytest.mark.parametrize("policy", FREE_TIER_POLICIES)
+    def test_months_are_independent(self, policy):
+        """Each month gets the whole allowance, up to the account's usage."""
+        rng = np.random.default_rng(0)
+        usage = rng.uniform(0, 100, (50, 12))
+        usage[:, 0] = 0.1
+        free = allocate_free_tier(usage, 1000.0, policy, rng.integers(0, 2, (50, 1)))
+        assert free.shape == usage.shape
+        assert np.all((free >= 0) & (free <= usage))
+        assert free.sum(axis=0) == approx(np.minimum(usage.sum(axis=0), 1000.0))
+
+    @pytest.mark.parametrize(
+        "policy, message",
+        [
+            ("first-come", "Unknown free tier policy: first-come"),
+            ("by-architecture", "needs each function's architecture"),
+        ],
+    )
+    def test_invalid(self, policy, message):
+        """Unknown policies and missing architectures are rejected."""
+        with pytest.raises(ValueError, match=message):
+            allocate_free_tier([1.0], 1.0, policy)
+
+
+class TestCalculateAccount:
+    """Tests for pricing an account with one shared free tier."""
+
+    @pytest.mark.parametrize("policy", FREE_TIER_POLICIES)
+    def test_free_tier_counted_once(self, policy):
+        """Each month the account gets one free tier, whatever the policy."""
+        result = calculate_account(**FLEET, free_tier_policy=policy)
+        assert result.free_tier_compute_gb_sec.sum(axis=0) == approx(
+            np.minimum(
+                result.total_compute_gb_sec.sum(axis=0), FREE_TIER_COMPUTE_GB_SEC
+            )
+        )
+        assert result.free_tier_requests.sum(axis=0) == approx(
+            np.minimum(result.requests_per_month.sum(axis=0), FREE_TIER_REQUESTS)
+        )
+
+    def test_matches_account_bill(self):
+        """The functions sum to the aggregated account bill."""
+        for month in range(2):
+            columns = {
+                name: np.broadcast_to(value, (3, 2))[:, month]
+                if np.ndim(value) == 2
+                else value
+                for name, value in FLEET.items()
+            }
+            total = calculate_account(**columns).total_cost.sum()
+            assert total == approx(aggregate(**columns).account_total)
+
+    def test_tiers_applied_once_per_group(self):
+        """Beyond the 6B GB-s breakpoint the account climbs the tiers once, as aggregated."""
+        # ~4B GB-s per function in the first month, far below the breakpoints in the second
+        workload = {
+            "number_of_requests": [[444_445, 1000]] * 3,
+            "request_unit": "per month",
+            "duration_of_each_request_in_ms": 900_000,
+            "memory": 10240,
+            "architecture": [["x86"], ["x86"], ["arm64"]],
+        }
+        result = calculate_account(**workload)
+        for month in range(2):
+            expected = aggregate(
+                **{
+                    **workload,
+                    "number_of_requests": [444_445, 1000][month],
+                    "architecture": ["x86", "x86", "arm64"],
+                }
+            )
+            assert result.compute_charges[:, month] == approx(expected.compute_charges)
+            assert result.total_cost[:, month] == approx(expected.total_cost)
+        assert result.tier_cost.sum(axis=-1) == approx(result.compute_charges)
+        assert result.tier_usage_gb_sec.sum(axis=-1) == approx(
+            result.billable_compute_gb_sec
+        )
+
+    def test_single_function(self):
+        """A single function gets the whole free tier, as in calculate()."""
+        result = calculate_account(number_of_requests=[5_000_000], memory=1024)
+        expected = calculate(number_of_requests=5_000_000, memory=1024)
+        assert result.total_cost[0] == approx(expected.total_cost)
+
+    def test_ineligible_functions(self):
+        """Functions without the free tier leave it to the others."""
+        result = calculate_account(
+            number_of_requests=[1000, 1000, 1000],
+            include_free_tier=[True, False, True],
+            workload_type=["standard", "standard", "edge"],
+        )
+        assert result.free_tier_requests.tolist() == [30416.0, 0.0, 0.0]
+
+    def test_scalar(self):
+        """A single workload is not an account."""
+        with pytest.raises(ValueError, match="at least one array"):
+            calculate_account()
@@ -0,0 +1,70 @@
+import pytest
+from aws_lambda_calculator.calculator import calculate
+from aws_lambda_calculator.instrumentation import (
+    PHASES,
+    HistogramSink,
+    instrument,
+    phase_timer,
+)
+
+
+class TestInstrument:
+    """Tests for the opt-in phase timers of calculate()."""
+
+    def test_off_by_default(self):
+        """Without an active sink no timer is created."""
+        assert phase_timer() is None
+
+    def test_records_every_phase(self):
+        """Each phase of a quote is recorded once, in order."""
+        recorded = []
+        with instrument(lambda phase, seconds: recorded.append((phase, seconds))):
+            calculate(workload_type="streaming", response_size_in_mb=1, exact=True)
+        assert [phase for phase, _ in recorded] == list(PHASES)
+        assert all(seconds >= 0 for _, seconds in recorded)
+
+    def test_skips_phases_not_run(self):
+        """Streaming and exact charges are only recorded for quotes computing them."""
+        recorded = []
+        with instrument(lambda phase, seconds: recorded.append(phase)):
+            calculate()
+        assert recorded == [
+            phase
+            for phase in PHASES
+            if phase not in ("streaming_charges", "exact_charges")
+        ]
+
+    def test_histogram_sink_default(self):
+        """The default sink aggregates repeated quotes per phase."""
+        with instrument() as sink:
+            for _ in range(5):
+                calculate()
+        assert isinstance(sink, HistogramSink)
+        summary = sink.summary()
+        assert set(summary) == set(PHASES) - {"streaming_charges", "exact_charges"}
+        assert all(stats["count"] == 5 for stats in summary.values())
+
+    def test_sink_restored_after_block(self):
+        """The sink is only active inside the block, even after an error."""
+        with pytest.raises(ValueError), instrument():
+            calculate(memory=1)
+        assert phase_timer() is None
+
+
+class TestHistogramSink:
+    """Tests for the in-memory histogram aggregator."""
+
+    def test_quantiles(self):
+        """Quantiles are read from the bucket bounds."""
+        sink = HistogramSink(buckets=(1.0, 2.0, 4.0))
+        for seconds in (0.5, 0.5, 1.5, 3.0):
+            sink.record("phase", seconds)
+        assert sink.quantile("phase", 0.5) == 1.0
+        assert sink.quantile("phase", 0.99) == 4.0
+        assert sink.summary()["phase"]["total"] == pytest.approx(5.5)
+
+    def test_overflow_bucket(self):
+        """Durations above every bucket report the observed maximum."""
+        sink = HistogramSink(buckets=(1.0,))
+        sink.record("phase", 10.0)
+        assert sink.quantile("phase", 0.99) == 10.0
@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+from pytest import approx
+from aws_lambda_calculator.memory_pricing import (
+    calculate_by_memory,
+    cross_check,
+    memory_price_lookup,
+)
+from aws_lambda_calculator.pricing import load_pricing
+from aws_lambda_calculator.sweep import sweep
+
+WORKLOAD = {
+    "number_of_requests": 10,
+    "request_unit": "per second",
+    "duration_of_each_request_in_ms": 250,
+    "include_free_tier": False,
+}
+
+
+class TestMemoryPriceLookup:
+    """Tests for the dense per-MB Memory price arrays."""
+
+    @pytest.mark.parametrize("rounding", ["snap", "interpolate"])
+    def test_listed_sizes(self, rounding):
+        """Listed sizes are priced at their listed price."""
+        lookup = memory_price_lookup(("us-east-1",), rounding)
+        for size, price in load_pricing("us-east-1").memory_prices_for("arm64"):
+            assert lookup[0, 1, int(size)] == price
+
+    def test_snap_to_next_size(self):
+        """Sizes between listed ones snap up to the next listed size."""
+        lookup = memory_price_lookup(("us-east-1",), "snap")
+        assert lookup[0, 0, 1000] == lookup[0, 0, 1024]
+        assert lookup[0, 0, 129] == lookup[0, 0, 512]
+
+    def test_interpolate(self):
+        """Sizes between listed ones are interpolated linearly."""
+        lookup = memory_price_lookup(("us-east-1",), "interpolate")
+        assert lookup[0, 0, 1280] == approx(
+            (lookup[0, 0, 1024] + lookup[0, 0, 1536]) / 2
+        )
+
+    def test_unknown_rounding(self):
+        """An unknown rounding mode is rejected."""
+        with pytest.raises(ValueError, match="Unknown memory rounding"):
+            memory_price_lookup(("us-east-1",), "nearest")
+
+
+class TestCalculateByMemory:
+    """Tests for the Memory table pricing engine."""
+
+    def test_close_to_tier_engine_in_first_tier(self):
+        """Within the first tier the engines differ only by the rounding of listed prices."""
+        result = calculate_by_memory(
+            region=["us-east-1", "eu-central-2", "af-south-1"],
+            memory=[1024, 2048, 10240],
+            **WORKLOAD,
+        )
+        assert np.all(np.abs(result.discrepancy) < 0.01)
+
+    def test_between_sizes(self):
+        """Interpolating by default stays close to the tiers, snapping prices the larger size."""
+        interpolated = calculate_by_memory(memory=1769, **WORKLOAD)
+        snapped = calculate_by_memory(memory=1769, rounding="snap", **WORKLOAD)
+        assert abs(interpolated.discrepancy) < 0.01
+        assert snapped.discrepancy > 0.1
+
+    def test_free_tier(self):
+        """The free GB-seconds are deducted before pricing by the millisecond."""
+        result = calculate_by_memory(
+            number_of_requests=100, request_unit="per month", memory=1024
+        )
+        assert result.total_cost[()] == 0.0
+
+    def test_sweep_path(self):
+        """The sweep prices from the same Memory lookup."""
+        memory = [128, 700, 4096]
+        grid = sweep(memory=memory, memory_rounding="interpolate", **WORKLOAD)
+        expected = calculate_by_memory(
+            memory=memory, rounding="interpolate", **WORKLOAD
+        )
+        assert grid.total_cost == approx(expected.total_cost)
+
+
+class TestCrossCheck:
+    """Tests for the Memory table vs tier rate cross-check."""
+
+    def test_reports_rounded_prices(self):
+        """Listed prices rounded far from the tier rate are reported, largest first."""
+        discrepancies = cross_check(("us-east-1", "mx-central-1"), tolerance=0.01)
+        assert discrepancies
+        differences = [abs(d.relative_difference) for d in discrepancies]
+        assert differences == sorted(differences, reverse=True)
+        assert all(d.memory_mb == 128 for d in discrepancies)
+
+    def test_tolerance(self):
+        """Nothing is reported within a loose tolerance."""
+        assert cross_check(("us-east-1",), tolerance=0.05) == []
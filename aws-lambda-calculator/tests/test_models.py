@@ -1,6 +1,11 @@
 import pytest
 from pydantic import ValidationError
-from aws_lambda_calculator.models import CalculationRequest, CalculationResult
+from aws_lambda_calculator.models import (
+    REQUEST_UNITS,
+    SIZE_UNITS,
+    CalculationRequest,
+    CalculationResult,
+)
 
 
 class TestCalculationRequest:
@@ -227,6 +232,26 @@ class TestCalculationRequest:
         )
         assert request.architecture == "arm64"
 
+    def test_unit_codes(self):
+        """Pre-encoded units are decoded to their names."""
+        request = CalculationRequest(
+            request_unit=REQUEST_UNITS.index("per hour"),
+            memory=1,
+            memory_unit=SIZE_UNITS.index("GB"),
+            storage_unit=SIZE_UNITS.index("MB"),
+        )
+        assert request.request_unit == "per hour"
+        assert request.memory_unit == "GB"
+        assert request.storage_unit == "MB"
+
+    @pytest.mark.parametrize(
+        "field, code", [("request_unit", 6), ("memory_unit", -1), ("storage_unit", 2)]
+    )
+    def test_invalid_unit_code(self, field, code):
+        """Unit codes outside the unit tables are rejected."""
+        with pytest.raises(ValidationError, match="code"):
+            CalculationRequest(**{field: code})
+
 
 class TestCalculationResult:
     """Tests for CalculationResult pydantic model."""
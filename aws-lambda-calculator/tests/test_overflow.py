@@ -0,0 +1,123 @@
+import json
+import os
+
+import numpy as np
+import pytest
+from pytest import approx
+from aws_lambda_calculator.batch import calculate_batch
+from aws_lambda_calculator.calculator import calc_monthly_compute_charges, calculate
+from aws_lambda_calculator.pricing import JSONS_DIR, load_pricing
+from aws_lambda_calculator.solver import solve_for
+
+REGIONS = sorted(
+    name.removesuffix(".json")
+    for name in os.listdir(JSONS_DIR)
+    if name.endswith(".json")
+)
+ARCHITECTURES = ["x86", "arm64"]
+
+# 1 GB x 1 s per request: the number of requests equals the GB-seconds
+HIGH_USAGE = {
+    "request_unit": "per month",
+    "duration_of_each_request_in_ms": 1000,
+    "memory": 1,
+    "memory_unit": "GB",
+    "ephemeral_storage": 512,
+    "storage_unit": "MB",
+    "include_free_tier": False,
+}
+
+
+def _expected_cost(region, architecture, gb_sec):
+    """Price usage straight from the region's cost factors file."""
+    with open(os.path.join(JSONS_DIR, f"{region}.json")) as file:
+        data = json.load(file)
+    tiers = sorted((int(t), float(r)) for t, r in data[architecture]["Tier"].items())
+    cost, lower = 0.0, 0
+    for threshold, rate in tiers:
+        cost += (min(gb_sec, threshold) - lower) * rate
+        lower = min(gb_sec, threshold)
+    cost += (gb_sec - lower) * float(data[architecture]["OverflowRate"])
+    return cost + gb_sec * float(data["Requests"])
+
+
+@pytest.mark.parametrize("architecture", ARCHITECTURES)
+@pytest.mark.parametrize("region", REGIONS)
+class TestOverflowRate:
+    """Very high usage is billed at each region and architecture's own overflow rate."""
+
+    @pytest.mark.parametrize("gb_sec", [20_000_000_000, 250_000_000_000])
+    def test_calculate(self, region, architecture, gb_sec):
+        """calculate() prices usage beyond the last tier from the region's OverflowRate."""
+        result = calculate(
+            region=region,
+            architecture=architecture,
+            number_of_requests=gb_sec,
+            **HIGH_USAGE,
+        )
+        assert result.total_cost == approx(_expected_cost(region, architecture, gb_sec))
+
+    def test_exact(self, region, architecture):
+        """The exact mode uses the same overflow rate."""
+        params = {
+            "region": region,
+            "architecture": architecture,
+            "number_of_requests": 100_000_000_000,
+            **HIGH_USAGE,
+        }
+        result = calculate(**params, exact=True)
+        assert result.total_cost == approx(calculate(**params).total_cost)
+
+    def test_batch(self, region, architecture):
+        """The vectorized path matches calculate() past the last tier."""
+        usage = np.array([16e9, 40e9, 1e12])
+        totals = calculate_batch(
+            region=region,
+            architecture=architecture,
+            number_of_requests=usage,
+            **HIGH_USAGE,
+        )
+        for total, gb_sec in zip(totals, usage):
+            assert total == approx(_expected_cost(region, architecture, gb_sec))
+
+    def test_solver(self, region, architecture):
+        """Inverting a budget deep into the overflow tier recovers the usage."""
+        budget = _expected_cost(region, architecture, 100e9)
+        result = solve_for(
+            budget,
+            "requests",
+            region=region,
+            architecture=architecture,
+            number_of_requests=1,
+            **HIGH_USAGE,
+        )
+        assert result.value == approx(100e9)
+
+    def test_raw_cost_factors(self, region, architecture):
+        """Compute charges from the raw JSON factors use their own OverflowRate."""
+        with open(os.path.join(JSONS_DIR, f"{region}.json")) as file:
+            data = json.load(file)
+        gb_sec = 20_000_000_000
+        _, compute, _ = calc_monthly_compute_charges(
+            gb_sec, 1000, 1.0, data[architecture], False, []
+        )
+        requests = gb_sec * float(data["Requests"])
+        assert compute == approx(
+            _expected_cost(region, architecture, gb_sec) - requests
+        )
+
+    def test_pricing_model(self, region, architecture):
+        """The pricing model carries the overflow rate from the file."""
+        with open(os.path.join(JSONS_DIR, f"{region}.json")) as file:
+            expected = float(json.load(file)[architecture]["OverflowRate"])
+        schedule = load_pricing(region).schedule_for(architecture)
+        assert schedule.overflow_rate == expected
+
+
+def test_arm64_overflow_differs_from_x86():
+    """arm64 overflow usage is cheaper than the old hardcoded x86 rate."""
+    x86, arm64 = (
+        load_pricing("us-east-1").schedule_for(arch).overflow_rate
+        for arch in ARCHITECTURES
+    )
+    assert (x86, arm64) == (0.0000133334, 0.0000106667)
@@ -0,0 +1,89 @@
+import pytest
+from pytest import approx
+from aws_lambda_calculator.calculator import calculate_tiered_cost
+from aws_lambda_calculator.pricing import TierSchedule, load_pricing, pricing_version
+from aws_lambda_calculator.snapshots import load_index
+
+TIER_COST_FACTOR = {"15000000000": "0.0000150000", "6000000000": "0.0000166667"}
+OVERFLOW = 0.0000133334
+
+
+class TestTierSchedule:
+    """Tests for the precomputed cumulative tier tables."""
+
+    def test_sorted_with_cumulative_cost(self):
+        """Breakpoints are sorted and the cost at each breakpoint is precomputed."""
+        schedule = TierSchedule.from_cost_factor(TIER_COST_FACTOR, OVERFLOW)
+        assert schedule.thresholds == (6e9, 15e9)
+        assert schedule.rates == (0.0000166667, 0.0000150000)
+        assert schedule.cumulative == approx((100_000.2, 235_000.2))
+
+    @pytest.mark.parametrize(
+        "usage", [0.0, 1.0, 5_999_999_999.5, 6e9, 6e9 + 1, 15e9, 20e9, 1e13]
+    )
+    def test_cost_matches_tier_walk(self, usage):
+        """The binary-search cost matches walking the tiers one by one."""
+        schedule = TierSchedule.from_cost_factor(TIER_COST_FACTOR, OVERFLOW)
+        expected = calculate_tiered_cost(usage, TIER_COST_FACTOR, OVERFLOW, [])
+        assert schedule.cost(usage) == approx(expected)
+
+    @pytest.mark.parametrize("usage", [1.0, 3e9, 6e9, 10e9, 15e9, 40e9])
+    def test_usage_for_inverts_cost(self, usage):
+        """The inverse lookup recovers the usage from its cost."""
+        schedule = TierSchedule.from_cost_factor(TIER_COST_FACTOR, OVERFLOW)
+        assert schedule.usage_for(schedule.cost(usage)) == approx(usage)
+
+    def test_locate(self):
+        """Usage on a breakpoint belongs to the tier ending there."""
+        schedule = TierSchedule.from_cost_factor(TIER_COST_FACTOR, OVERFLOW)
+        assert [schedule.locate(u) for u in (0, 6e9, 6e9 + 1, 15e9, 16e9)] == [
+            0,
+            0,
+            1,
+            1,
+            2,
+        ]
+
+    def test_many_tiers(self):
+        """Large schedules are priced like the tier walk."""
+        tiers = {str((t + 1) * 1000): 1.0 / (t + 1) for t in range(500)}
+        schedule = TierSchedule.from_cost_factor(tiers, 0.0001)
+        for usage in (0.5, 999.0, 123_456.0, 600_000.0):
+            assert schedule.cost(usage) == approx(
+                calculate_tiered_cost(usage, tiers, 0.0001, [])
+            )
+
+    def test_empty_schedule(self):
+        """Without tiers all usage is billed at the overflow rate."""
+        schedule = TierSchedule.from_tiers((), 0.5)
+        assert schedule.cost(10.0) == 5.0
+        assert schedule.usage_for(5.0) == 10.0
+
+    def test_zero_overflow_rate(self):
+        """A cost beyond a free overflow is unreachable."""
+        schedule = TierSchedule.from_tiers([(10.0, 1.0)], 0.0)
+        assert schedule.usage_for(11.0) == float("inf")
+
+    def test_built_at_load_time(self):
+        """The cached region model carries one schedule per architecture."""
+        pricing = load_pricing("us-east-1")
+        assert pricing.schedule_for("arm64").thresholds == (7.5e9, 18.75e9)
+        assert pricing.schedule_for("x86") is load_pricing("us-east-1").schedule_for(
+            "x86"
+        )
+
+
+class TestPricingVersion:
+    """Tests for the version of a region's current cost factors."""
+
+    def test_digest_of_cost_factors(self):
+        """The version is the digest the snapshot store files the cost factors under."""
+        index = load_index()
+        for region in ("us-east-1", "eu-west-1"):
+            assert pricing_version(region) == index.histories[region][1][-1]
+        assert pricing_version("us-east-1") != pricing_version("eu-west-1")
+
+    def test_unknown_region(self):
+        """Regions outside the region index have no version."""
+        with pytest.raises(ValueError, match="Unknown region"):
+            pricing_version("moon-1")
@@ -0,0 +1,222 @@
+import io
+import json
+from datetime import date
+
+import numpy as np
+import pytest
+from pytest import approx
+from aws_lambda_calculator import pricing_diff
+from aws_lambda_calculator.batch import calculate_batch
+from aws_lambda_calculator.pricing_diff import (
+    current_source,
+    diff_fields,
+    jsons_source,
+    load_source,
+    main,
+    read_workloads,
+    reprice_workloads,
+    snapshot_source,
+)
+
+WORKLOADS = """function,region,number_of_requests,request_unit,memory
+api,us-east-1,10,per second,1024
+cron,us-east-1,1,per hour,128
+etl,eu-west-1,5,per second,4096
+"""
+
+
+@pytest.fixture
+def current():
+    return jsons_source()
+
+
+@pytest.fixture
+def raised(current):
+    """us-east-1 with requests at twice the price."""
+    region = json.loads(json.dumps(current["us-east-1"]))
+    region["Requests"] = str(float(region["Requests"]) * 2)
+    return {**current, "us-east-1": region}
+
+
+class TestDiffFields:
+    """Tests for the field-level pricing diff."""
+
+    def test_no_changes(self, current):
+        """Identical sources have no changed fields."""
+        assert diff_fields(current, current) == []
+
+    def test_changed_field(self, current, raised):
+        """A changed rate is reported with its path and relative change."""
+        (change,) = diff_fields(current, raised)
+        assert (change.region, change.field) == ("us-east-1", "Requests")
+        assert change.relative_change == approx(1.0)
+
+    def test_added_and_removed_regions(self, current):
+        """Regions in one source only are reported field by field."""
+        changes = diff_fields(
+            {"moon-1": {"Requests": "1"}}, {"mars-1": {"Requests": "1"}}
+        )
+        assert [(c.region, c.old, c.new) for c in changes] == [
+            ("mars-1", None, "1"),
+            ("moon-1", "1", None),
+        ]
+        assert changes[0].relative_change is None
+
+    def test_selected_regions(self, current, raised):
+        """Selected regions are compared only when both sources have them."""
+        assert diff_fields(current, raised, ["eu-west-1"]) == []
+        assert len(diff_fields(current, raised, ["us-east-1"])) == 1
+        with pytest.raises(ValueError, match="Unknown region: moon-1"):
+            diff_fields(current, {**raised, "moon-1": {}}, ["moon-1"])
+
+    def test_current_source(self, current):
+        """The regions of the region index are the committed region JSONs."""
+        assert current_source() == current
+
+    def test_snapshot_source(self, current):
+        """The bundled snapshot holds the committed cost factors."""
+        assert diff_fields(snapshot_source(date(2026, 10, 19)), current) == []
+        assert snapshot_source(date(2020, 1, 1)) == {}
+
+
+class TestRepriceWorkloads:
+    """Tests for repricing a workload file under two pricing sources."""
+
+    def test_read_workloads(self):
+        """Columns not in the file take the calculate() defaults."""
+        functions, columns = read_workloads(io.StringIO(WORKLOADS))
+        assert functions == ["api", "cron", "etl"]
+        assert columns["memory"].tolist() == [1024, 128, 4096]
+        assert columns["architecture"] == "x86"
+
+    @pytest.mark.parametrize(
+        "text, message",
+        [
+            ("region\nus-east-1\n", "Missing CSV columns: function"),
+            ("function,colour\napi,red\n", "Unknown CSV columns: colour"),
+            ("function\n", "empty"),
+        ],
+    )
+    def test_invalid_workload_file(self, text, message):
+        """Malformed workload files are rejected."""
+        with pytest.raises(ValueError, match=message):
+            read_workloads(io.StringIO(text))
+
+    def test_deltas_sorted_by_impact(self, current, raised):
+        """Only workloads beyond the free tier in us-east-1 move, ties keep file order."""
+        functions, columns = read_workloads(io.StringIO(WORKLOADS))
+        result = reprice_workloads(functions, columns, current, raised)
+        assert result.functions == ["api", "cron", "etl"]
+        assert result.old_cost[0] == approx(
+            calculate_batch(
+                number_of_requests=10, request_unit="per second", memory=1024
+            )
+        )
+        requests = np.floor(10 * 60 * 60 * 730) - 1_000_000
+        assert result.delta[0] == approx(
+            requests * float(current["us-east-1"]["Requests"])
+        )
+        assert result.delta[1:].tolist() == [0, 0]
+
+    def test_fleet(self, current, raised):
+        """A 40k function fleet reprices in one vectorized pass."""
+        size = 40_000
+        rng = np.random.default_rng(0)
+        columns = {
+            "region": rng.choice(["us-east-1", "eu-west-1", "ap-south-1"], size),
+            "number_of_requests": rng.integers(1, 10_000_000, size),
+            "memory": rng.integers(128, 10240, size),
+        }
+        functions = [f"function-{i}" for i in range(size)]
+        result = reprice_workloads(functions, columns, current, raised)
+        assert np.all(np.diff(np.abs(result.delta)) <= 0)
+        assert np.count_nonzero(result.delta) <= np.sum(
+            columns["region"] == "us-east-1"
+        )
+
+
+class TestMain:
+    """Tests for the pricing diff command line."""
+
+    def test_regions(self, tmp_path, capsys):
+        """Comparing two regions reprices every workload in both."""
+        workloads = tmp_path / "workloads.csv"
+        workloads.write_text(WORKLOADS)
+        output = tmp_path / "deltas.csv"
+        main(
+            [
+                "current",
+                "current",
+                "--regions",
+                "us-east-1",
+                "eu-west-1",
+                "--workloads",
+                str(workloads),
+                "--output",
+                str(output),
+            ]
+        )
+        assert "us-east-1 -> eu-west-1 EphemeralStorage" in capsys.readouterr().out
+        rows = output.read_text().splitlines()
+        assert rows[0] == "function,old_cost,new_cost,delta,relative_delta"
+        assert len(rows) == 4
+
+    def test_deltas_on_stdout(self, tmp_path, capsys):
+        """With the deltas on stdout, the field report goes to stderr."""
+        workloads = tmp_path / "workloads.csv"
+        workloads.write_text(WORKLOADS)
+        main(
+            [
+                "current",
+                "current",
+                "--regions",
+                "us-east-1",
+                "eu-west-1",
+                "--workloads",
+                str(workloads),
+            ]
+        )
+        captured = capsys.readouterr()
+        rows = captured.out.splitlines()
+        assert rows[0] == "function,old_cost,new_cost,delta,relative_delta"
+        assert len(rows) == 4
+        assert "us-east-1 -> eu-west-1 EphemeralStorage" in captured.err
+
+    def test_regions_by_name(self, capsys):
+        """Regions to compare may be given by location name."""
+        main(["current", "current", "--regions", "US East (N. Virginia)", "eu-west-1"])
+        assert "us-east-1 -> eu-west-1 EphemeralStorage" in capsys.readouterr().out
+
+    def test_unknown_region(self):
+        """Regions neither indexed nor in a source are rejected."""
+        with pytest.raises(ValueError, match="Unknown region: moon-1"):
+            main(["current", "current", "--regions", "moon-1", "eu-west-1"])
+
+    def test_region_missing_from_source(self):
+        """A source without a compared region is an error, not zero pricing."""
+        with pytest.raises(
+            ValueError, match=r"Unknown region: us-east-1 \(not in 2020-01-01\)"
+        ):
+            main(["2020-01-01", "current", "--regions", "us-east-1", "eu-west-1"])
+
+    def test_directory_source(self, tmp_path, current, capsys):
+        """A directory of scraped JSONs is compared against the committed ones."""
+        for region, data in current.items():
+            (tmp_path / f"{region}.json").write_text(json.dumps(data))
+        main([str(tmp_path), "current"])
+        assert capsys.readouterr().out == "No pricing changes\n"
+
+    def test_unknown_source(self):
+        """Sources that are neither dates nor directories are rejected."""
+        with pytest.raises(ValueError, match="Unknown pricing source"):
+            main(["yesterday", "current"])
+
+    def test_snapshot_errors_pass_through(self, monkeypatch):
+        """Errors reading the snapshot store of a valid date are not masked."""
+
+        def missing(as_of):
+            raise ValueError(f"No snapshot on or before {as_of}")
+
+        monkeypatch.setattr(pricing_diff, "snapshot_source", missing)
+        with pytest.raises(ValueError, match="No snapshot on or before 2020-01-01"):
+            load_source("2020-01-01")
@@ -0,0 +1,193 @@
+import numpy as np
+import pytest
+from pytest import approx
+from aws_lambda_calculator.batch import calculate_batch
+from aws_lambda_calculator.calculator import calculate
+from aws_lambda_calculator.pricing import (
+    RegionPricing,
+    load_pricing,
+    warn_fallback_rates,
+)
+from aws_lambda_calculator.provisioned import price_provisioned, snapstart_charges
+
+HOURS = 720  # hourly periods of a 30-day month
+
+
+def steady(concurrency: float, duration_ms: float = 100) -> np.ndarray:
+    """Hourly invocations keeping a steady average concurrency."""
+    return np.full(HOURS, concurrency * 3600 * 1000 / duration_ms)
+
+
+class TestPriceProvisioned:
+    """Tests for provisioned concurrency with on-demand spillover."""
+
+    def test_without_provisioned_concurrency(self):
+        """Level 0 is the on-demand price of the whole month's usage."""
+        invocations = steady(3)
+        result = price_provisioned(invocations, 100, [0], memory=1024)
+        expected = calculate_batch(
+            number_of_requests=invocations.sum(),
+            request_unit="per month",
+            duration_of_each_request_in_ms=100,
+            memory=1024,
+        )
+        assert result.total_cost[0] == approx(expected)
+        assert result.provisioned_concurrency_charges[0] == 0
+
+    def test_fully_provisioned(self):
+        """At or above the peak demand nothing spills over to on-demand."""
+        result = price_provisioned(steady(3), 100, [3, 5], memory=1024)
+        assert np.all(result.on_demand_compute_charges == 0)
+        rate = load_pricing("us-east-1").provisioned_duration_rates["x86"]
+        assert result.provisioned_duration_charges == approx(
+            [3 * HOURS * 3600 * rate] * 2
+        )
+
+    def test_partial_spillover(self):
+        """Demand above the level spills over; the split follows each period's demand."""
+        invocations = np.concatenate([steady(1)[:360], steady(4)[:360]])
+        result = price_provisioned(
+            invocations, 100, [2], memory=1024, include_free_tier=False
+        )
+        # 360 hours at 2 of 4 spill over, 2 x 360 hours of concurrency
+        tier_rate = load_pricing("us-east-1").tiers_for("x86")[0][1]
+        assert result.on_demand_compute_charges[0] == approx(2 * 360 * 3600 * tier_rate)
+
+    def test_cheapest_level(self):
+        """Steady traffic is cheapest fully provisioned, a rare burst on demand."""
+        assert price_provisioned(steady(10), 100, memory=2048).cheapest_level == 10
+        burst = np.zeros(HOURS)
+        burst[0] = steady(10)[0]
+        assert price_provisioned(burst, 100, memory=2048).cheapest_level == 0
+
+    def test_default_levels(self):
+        """Every level up to the peak demand is priced by default."""
+        result = price_provisioned(steady(2.5), 100)
+        assert result.provisioned_concurrency.tolist() == [0, 1, 2, 3]
+
+    @pytest.mark.parametrize(
+        "kwargs, message",
+        [
+            ({"invocations": []}, "non-empty"),
+            ({"invocations": [-1]}, "must not be negative"),
+            ({"provisioned_concurrency": [1.5]}, "whole number"),
+            ({"period_seconds": 0}, "period length"),
+            ({"architecture": "sparc"}, "Unknown architecture"),
+            ({"region": "moon-1"}, "Unknown region"),
+            ({"memory": 64}, "Memory must be between"),
+        ],
+    )
+    def test_invalid_input(self, kwargs, message):
+        """Invalid traffic curves and configurations are rejected."""
+        arguments = {"invocations": [100.0], "duration_ms": 100, **kwargs}
+        with pytest.raises(ValueError, match=message):
+            price_provisioned(**arguments)
+
+
+class TestSnapStartCharges:
+    """Tests for the SnapStart cache and restore charges."""
+
+    def test_cache_and_restores(self):
+        """The cache is billed for three hours at least, restores per GB."""
+        pricing = load_pricing("us-east-1")
+        charges = snapstart_charges(
+            [0, 1000], [3600, 7200 * 4], memory=2, memory_unit="GB"
+        )
+        assert charges == approx(
+            [
+                3 * 3600 * 2 * pricing.snapstart_cache_rate,
+                8 * 3600 * 2 * pricing.snapstart_cache_rate
+                + 1000 * 2 * pricing.snapstart_restore_rate,
+            ]
+        )
+
+
+class TestProvisionedRates:
+    """Tests for reading the provisioned concurrency and SnapStart rates."""
+
+    def test_scraped_rates(self):
+        """Rates present in the cost factors are used as is."""
+        pricing = RegionPricing.from_cost_factors(
+            "test",
+            {"arm64": {"ProvisionedConcurrency": "0.1"}, "SnapStartRestore": "0.2"},
+        )
+        assert pricing.provisioned_concurrency_rates["arm64"] == 0.1
+        assert pricing.snapstart_restore_rate == 0.2
+
+    def test_fallback_rates(self, caplog):
+        """Cost factors scraped before these SKUs fall back to the us-east-1 rates, quietly."""
+        pricing = RegionPricing.from_cost_factors("test", {})
+        assert pricing.provisioned_duration_rates == {
+            "x86": 0.0000097222,
+            "arm64": 0.0000077778,
+        }
+        assert "x86.ProvisionedDuration" in pricing.fallback_rates
+        assert "SnapStartCache" in pricing.fallback_rates
+        assert caplog.text == ""
+
+    def test_fallback_rates_listed(self):
+        """Only the rates missing from the cost factors are listed."""
+        pricing = RegionPricing.from_cost_factors(
+            "test",
+            {
+                "x86": {"ProvisionedConcurrency": "0.1", "ProvisionedDuration": "0.1"},
+                "arm64": {
+                    "ProvisionedConcurrency": "0.1",
+                    "ProvisionedDuration": "0.1",
+                },
+                "SnapStartCache": "0.1",
+                "SnapStartRestore": "0.1",
+                "EdgeRequests": "0.1",
+                "EdgeDuration": "0.1",
+            },
+        )
+        assert pricing.fallback_rates == ("ResponseStreaming",)
+
+    def test_us_east_1_is_not_a_fallback(self):
+        """The fallback rates are us-east-1's own, so it has none."""
+        pricing = RegionPricing.from_cost_factors("us-east-1", {})
+        assert pricing.fallback_rates == ()
+
+
+class TestFallbackWarnings:
+    """Tests for the warnings about rates billed at the us-east-1 fallback."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_warnings(self):
+        warn_fallback_rates.cache_clear()
+        yield
+        warn_fallback_rates.cache_clear()
+
+    def test_loading_is_quiet(self, caplog):
+        """Standard quotes in a region without the newer SKUs do not warn."""
+        load_pricing.cache_clear()
+        calculate(region="eu-west-1")
+        calculate_batch(region=["eu-west-1", "ap-south-1"])
+        assert caplog.text == ""
+
+    def test_provisioned(self, caplog):
+        """Pricing provisioned concurrency names the architecture's missing rates."""
+        price_provisioned(steady(3), 100, [1], region="eu-west-1", architecture="arm64")
+        assert (
+            "No arm64.ProvisionedConcurrency, arm64.ProvisionedDuration rates scraped "
+            "for region 'eu-west-1', pricing them at the us-east-1 rates"
+        ) in caplog.text
+
+    def test_snapstart(self, caplog):
+        """SnapStart charges name the missing SnapStart rates."""
+        snapstart_charges(10, 3600, region="eu-west-1")
+        assert "No SnapStartCache, SnapStartRestore rates scraped" in caplog.text
+
+    @pytest.mark.parametrize(
+        ("workload_type", "rates"),
+        [("edge", "EdgeRequests, EdgeDuration"), ("streaming", "ResponseStreaming")],
+    )
+    def test_workload_types(self, caplog, workload_type, rates):
+        """Edge and streaming quotes warn, once per region, in both engines."""
+        calculate(region="eu-west-1", workload_type=workload_type)
+        calculate_batch(
+            region=["eu-west-1", "ap-south-1", "us-east-1"],
+            workload_type=[workload_type, "standard", workload_type],
+        )
+        assert caplog.text.count(f"No {rates} rates scraped") == 1
+        assert "'ap-south-1'" not in caplog.text
@@ -0,0 +1,146 @@
+import json
+import os
+
+import pytest
+from aws_lambda_calculator.pricing import JSONS_DIR
+from aws_lambda_calculator.pricing_table import load_pricing_table
+from aws_lambda_calculator.regions import (
+    REGIONS_FILE,
+    build_region_index,
+    load_region_index,
+    partition_of,
+    read_region_index,
+    select_regions,
+    write_region_index,
+)
+
+
+@pytest.fixture
+def index():
+    return load_region_index()
+
+
+class TestRegionIndex:
+    """Tests for the region index shipped with the pricing data."""
+
+    def test_matches_region_jsons(self, index):
+        """The committed index is what regenerating it from jsons/ produces."""
+        with open(REGIONS_FILE) as file:
+            shipped = json.load(file)
+        names = {info.code: info.name for info in index}
+        assert build_region_index(names) == shipped
+        assert sorted(index.codes) == sorted(
+            name.removesuffix(".json")
+            for name in os.listdir(JSONS_DIR)
+            if name.endswith(".json")
+        )
+
+    def test_every_region_is_named(self, index):
+        """Every region has a location name from the pricing API."""
+        assert all(info.name != info.code for info in index)
+        assert index.get("ap-southeast-6").name == "Asia Pacific (New Zealand)"
+
+    def test_offsets_are_pricing_table_rows(self, index):
+        """A region's offset is its row in a pricing table of every region."""
+        table = load_pricing_table(index.codes)
+        for info in index:
+            assert table.region_index(info.code) == info.offset
+
+    def test_partitions_and_architectures(self, index):
+        """GovCloud regions are in their own partition; every region has both archs."""
+        assert index.get("us-gov-west-1").partition == "aws-us-gov"
+        assert index.get("eu-west-1").partition == "aws"
+        assert partition_of("cn-north-1") == "aws-cn"
+        assert all(info.architectures == ("x86", "arm64") for info in index)
+
+    @pytest.mark.parametrize(
+        "region",
+        ["eu-central-1", "EU (Frankfurt)", "Europe (Frankfurt)", " eu (frankfurt) "],
+    )
+    def test_resolve(self, index, region):
+        """Regions resolve by code, location name or alias, ignoring case."""
+        assert index.resolve(region).code == "eu-central-1"
+
+    def test_unknown_region(self, index):
+        """Unknown regions are rejected, by code or by name."""
+        assert "moon-1" not in index
+        with pytest.raises(ValueError, match="Unknown region: moon-1"):
+            index.get("moon-1")
+        with pytest.raises(ValueError, match="Unknown region: Moon"):
+            index.resolve("Moon")
+        with pytest.raises(ValueError, match="Unknown region: EU"):
+            index.get("EU (Frankfurt)")
+
+
+class TestSelectRegions:
+    """Tests for wildcard and fuzzy region selectors."""
+
+    @pytest.mark.parametrize(
+        ("selector", "expected"),
+        [
+            ("us-gov-*", ("us-gov-east-1", "us-gov-west-1")),
+            ("aws-us-gov", ("us-gov-east-1", "us-gov-west-1")),
+            ("eu-west-?", ("eu-west-1", "eu-west-2", "eu-west-3")),
+            ("*(frankfurt)", ("eu-central-1",)),
+            ("Europe (Paris), us-east-1", ("eu-west-3", "us-east-1")),
+            ("us-east-1,US East (N. Virginia)", ("us-east-1",)),
+            ("us-*&aws", ("us-east-1", "us-east-2", "us-west-1", "us-west-2")),
+            (["ca-*", "mx-central-1"], ("ca-central-1", "ca-west-1", "mx-central-1")),
+        ],
+    )
+    def test_select(self, selector, expected):
+        """Terms are unions of conditions joined by &; regions come in index order."""
+        assert select_regions(selector) == expected
+
+    def test_every_region(self, index):
+        """`*`, `all` and an architecture every region offers pick every region."""
+        assert select_regions("*") == select_regions("ALL") == index.codes
+        assert select_regions("arm64") == index.codes
+        assert len(select_regions("eu-*&arm64")) == 8
+
+    def test_did_you_mean(self):
+        """Misspelled regions are rejected with the closest match."""
+        with pytest.raises(ValueError, match=r"eu-wset-1 \(did you mean eu-west-1\?\)"):
+            select_regions("eu-wset-1")
+
+    def test_no_match(self):
+        """Selectors picking no region are rejected."""
+        with pytest.raises(ValueError, match="No regions match: xx-\\*"):
+            select_regions("xx-*")
+
+
+class TestWriteRegionIndex:
+    """Tests for regenerating the index after a scrape."""
+
+    def test_new_regions_keep_known_names(self, tmp_path):
+        """Known regions keep their names; new ones take the given name or their code."""
+        jsons = tmp_path / "jsons"
+        jsons.mkdir()
+        for code in ("eu-west-1", "us-east-1"):
+            (jsons / f"{code}.json").write_text('{"x86": {"Tier": {"1": "1"}}}')
+        path = str(tmp_path / "regions.json")
+        write_region_index({"us-east-1": "US East (N. Virginia)"}, str(jsons), path)
+
+        (jsons / "ap-south-9.json").write_text("{}")
+        index = write_region_index({"eu-west-1": "EU (Ireland)"}, str(jsons), path)
+        assert index.codes == ("ap-south-9", "eu-west-1", "us-east-1")
+        assert [info.name for info in index] == [
+            "ap-south-9",
+            "EU (Ireland)",
+            "US East (N. Virginia)",
+        ]
+        assert index.get("ap-south-9").architectures == ()
+        assert index.get("eu-west-1").aliases == ("Europe (Ireland)",)
+        assert index.get("us-east-1").file == "jsons/us-east-1.json"
+        assert read_region_index(path) == index
+
+    def test_missing_index_is_empty(self, tmp_path):
+        """A store without an index has no regions."""
+        assert len(read_region_index(str(tmp_path / "regions.json"))) == 0
+
+    def test_unsupported_schema(self, tmp_path):
+        """Indexes of another schema version are rejected."""
+        path = tmp_path / "regions.json"
+        path.write_text('{"schema_version": 99, "regions": []}')
+        with pytest.raises(ValueError, match="Unsupported region index schema"):
+            read_region_index(str(path))
@@ -0,0 +1,142 @@
+import numpy as np
+import pytest
+from pytest import approx
+from aws_lambda_calculator.batch import calculate_batch, calculate_batch_result
+from aws_lambda_calculator.calculator import calculate
+from aws_lambda_calculator.results import CompactResult
+
+MEMORY = [128, 1024, 4096]
+
+# Workloads covering the free tier, each compute tier, Lambda@Edge and streaming
+SCENARIOS = [
+    {"number_of_requests": 1000, "request_unit": "per month"},
+    {"number_of_requests": 10, "request_unit": "per second", "memory": 2048},
+    {
+        "number_of_requests": 5000,
+        "request_unit": "per second",
+        "memory": 10240,
+        "duration_of_each_request_in_ms": 900,
+        "include_free_tier": False,
+    },
+    {"architecture": "arm64", "region": "eu-west-1", "ephemeral_storage": 2048},
+    {"workload_type": "edge", "number_of_requests": 50, "request_unit": "per second"},
+    {"workload_type": "streaming", "response_size_in_mb": 9},
+]
+
+BREAKDOWN_FIELDS = (
+    "compute_charges",
+    "request_charges",
+    "ephemeral_storage_charges",
+    "response_streaming_charges",
+    "requests_per_month",
+    "memory_in_gb",
+    "storage_in_gb",
+    "total_compute_sec",
+    "total_compute_gb_sec",
+    "free_tier_compute_gb_sec",
+    "billable_compute_gb_sec",
+    "free_tier_requests",
+    "billable_requests",
+    "billable_ephemeral_storage_gb",
+)
+
+
+class TestCompactResult:
+    """Tests for the slotted per-workload result."""
+
+    def test_slotted(self):
+        """Compact results carry no per-instance dict."""
+        result = CompactResult(1.0, 2.0, 3.0, 0.0, 6.0)
+        assert not hasattr(result, "__dict__")
+
+    def test_to_calculation_result(self):
+        """Conversion keeps the charges and leaves out the steps."""
+        result = CompactResult(1.0, 2.0, 3.0, 0.0, 6.0).to_calculation_result()
+        assert result.total_cost == 6.0
+        assert result.ephemeral_storage_charges == 3.0
+        assert result.calculation_steps == []
+
+
+class TestBatchResult:
+    """Tests for the columnar batch result."""
+
+    @pytest.fixture
+    def batch(self):
+        return calculate_batch_result(memory=MEMORY, ephemeral_storage=1024)
+
+    def test_columns(self, batch):
+        """The charge columns add up to calculate_batch() totals."""
+        assert len(batch) == 3
+        total = (
+            batch.compute_charges
+            + batch.request_charges
+            + batch.ephemeral_storage_charges
+            + batch.response_streaming_charges
+        )
+        assert batch.total_cost == approx(total)
+        assert np.array_equal(
+            batch.total_cost, calculate_batch(memory=MEMORY, ephemeral_storage=1024)
+        )
+        assert batch.tier_cost.shape == (3, 3)
+        assert batch.tier_cost.sum(axis=-1) == approx(batch.compute_charges)
+
+    def test_rows(self, batch):
+        """Rows materialize on demand and match calculate()."""
+        rows = list(batch)
+        assert rows[1] == batch[1]
+        for row, memory in zip(rows, MEMORY):
+            expected = calculate(memory=memory, ephemeral_storage=1024).total_cost
+            assert row.total_cost == approx(expected)
+
+    def test_to_calculation_results(self, batch):
+        """Every row converts to a CalculationResult."""
+        results = batch.to_calculation_results()
+        assert [result.total_cost for result in results] == batch.total_cost.tolist()
+        assert batch.to_calculation_result(2) == results[2]
+
+
+class TestBreakdown:
+    """Tests for the structured breakdown of calculate() and the batch path."""
+
+    def test_calculate_fields(self):
+        """The breakdown holds the values rendered in the steps."""
+        result = calculate(
+            number_of_requests=10,
+            request_unit="per second",
+            memory=1024,
+            duration_of_each_request_in_ms=100,
+            ephemeral_storage=1024,
+        )
+        assert result.requests_per_month == 26_280_000
+        assert result.memory_in_gb == 1.0
+        assert result.total_compute_gb_sec == approx(2_628_000)
+        assert result.free_tier_compute_gb_sec == 400_000
+        assert result.billable_compute_gb_sec == approx(2_228_000)
+        assert result.billable_requests == 25_280_000
+        assert result.billable_ephemeral_storage_gb == 0.5
+        assert [tier.up_to_gb_sec for tier in result.tiers] == [6e9]
+        assert result.tiers[0].cost == approx(result.compute_charges)
+        assert result.total_cost == approx(
+            result.compute_charges
+            + result.request_charges
+            + result.ephemeral_storage_charges
+        )
+
+    def test_overflow_tier(self):
+        """Usage beyond the last breakpoint is listed without a breakpoint."""
+        result = calculate(**SCENARIOS[2])
+        assert [tier.up_to_gb_sec for tier in result.tiers] == [6e9, 15e9, None]
+        assert sum(tier.cost for tier in result.tiers) == approx(result.compute_charges)
+
+    @pytest.mark.parametrize("scenario", SCENARIOS)
+    def test_batch_matches_calculate(self, scenario):
+        """The batch columns convert to the same breakdown as calculate()."""
+        expected = calculate(**scenario)
+        result = calculate_batch_result(**scenario).to_calculation_result(0)
+        for field in BREAKDOWN_FIELDS:
+            assert getattr(result, field) == approx(getattr(expected, field)), field
+        assert len(result.tiers) == len(expected.tiers)
+        for tier, expected_tier in zip(result.tiers, expected.tiers):
+            assert tier.up_to_gb_sec == expected_tier.up_to_gb_sec
+            assert tier.usage_gb_sec == approx(expected_tier.usage_gb_sec)
+            assert tier.cost == approx(expected_tier.cost)
@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+from pytest import approx
+from aws_lambda_calculator import calculate_batch, sensitivity
+from aws_lambda_calculator.sensitivity import marginal_rate
+
+INPUTS = {
+    "number_of_requests": 1000000,
+    "duration_of_each_request_in_ms": 1500,
+    "memory": 1024,
+    "ephemeral_storage": 2048,
+    "response_size_in_mb": 0,
+}
+
+# Workloads away from any breakpoint, so that a small step stays on one linear piece
+SCENARIOS = [
+    {},
+    {"number_of_requests": 20, "request_unit": "per second", "memory": 2048},
+    {
+        "number_of_requests": 5000,
+        "request_unit": "per second",
+        "memory": 10000,
+        "duration_of_each_request_in_ms": 900,
+        "include_free_tier": False,
+    },
+    {"architecture": "arm64", "region": "eu-west-1", "memory": 4, "memory_unit": "GB"},
+    {"workload_type": "edge", "number_of_requests": 50, "request_unit": "per second"},
+    {"workload_type": "streaming", "response_size_in_mb": 9},
+]
+
+
+class TestSensitivity:
+    """Tests for the analytic cost derivatives."""
+
+    @pytest.mark.parametrize("scenario", SCENARIOS)
+    @pytest.mark.parametrize("name", INPUTS)
+    def test_matches_finite_difference(self, scenario, name):
+        """Each derivative is the slope of calculate_batch() around the workload."""
+        params = {**INPUTS, **scenario}
+        # a step of many requests so that rounding requests per month down is negligible
+        step = params[name] * 1e-3 if name == "number_of_requests" else 1e-3
+        cost = calculate_batch(**params)
+        stepped = calculate_batch(**{**params, name: params[name] + step})
+        result = sensitivity(**params)
+        assert getattr(result, name) == approx((stepped - cost) / step, rel=1e-4)
+        assert result.total_cost == approx(cost)
+
+    def test_free_tier(self):
+        """Usage within the free tier costs nothing more, usage beyond it does."""
+        within = sensitivity(number_of_requests=1000, request_unit="per month")
+        beyond = sensitivity(number_of_requests=1000, include_free_tier=False)
+        assert within.number_of_requests == 0
+        assert within.duration_of_each_request_in_ms == 0
+        assert beyond.number_of_requests > 0
+        assert beyond.duration_of_each_request_in_ms > 0
+
+    def test_storage_breakpoint(self):
+        """At the free 512 MB of storage, one more MB is billed."""
+        result = sensitivity(ephemeral_storage=512, include_free_tier=False)
+        assert result.ephemeral_storage > 0
+
+    def test_vectorized(self):
+        """Arrays of workloads give a derivative per workload."""
+        memory = np.array([[128, 1024], [2048, 4096]])
+        result = sensitivity(memory=memory)
+        assert result.memory.shape == (2, 2)
+        assert result.row(3) == sensitivity(memory=4096).row()
+
+    def test_marginal_rate(self):
+        """The rate of the tier above a breakpoint bills the next unit."""
+        rates = marginal_rate(
+            np.array([0.0, 999.0, 1000.0, 2500.0]),
+            np.array([[1000.0, 2000.0, 2000.0]]),
+            np.array([[0.01, 0.005, 0.0]]),
+            np.array([0.001]),
+        )
+        assert rates.tolist() == [0.01, 0.01, 0.005, 0.001]
@@ -0,0 +1,150 @@
+import numpy as np
+import pytest
+from pytest import approx
+from aws_lambda_calculator.batch import calculate_batch
+from aws_lambda_calculator.calculator import calculate
+from aws_lambda_calculator.simulate import (
+    Fixed,
+    LogNormal,
+    Percentiles,
+    Poisson,
+    Seasonal,
+    simulate,
+)
+
+
+class TestSimulate:
+    """Tests for the Monte Carlo cost distribution."""
+
+    def test_reproducible(self):
+        """The same seed reproduces the same result."""
+        params = {
+            "number_of_requests": Poisson(1_000_000),
+            "duration_of_each_request_in_ms": LogNormal(100, 0.5),
+            "samples": 10_000,
+            "seed": 7,
+        }
+        assert simulate(**params) == simulate(**params)
+
+    def test_constant_inputs(self):
+        """Without uncertainty, every percentile is the calculated cost."""
+        result = simulate(memory=1024, samples=1_000, seed=1)
+        expected = calculate(memory=1024).total_cost
+        assert result.mean == approx(expected)
+        assert result.percentiles == {
+            "p50": approx(expected),
+            "p90": approx(expected),
+            "p99": approx(expected),
+        }
+        assert sum(result.histogram_counts) == 1_000
+
+    def test_percentiles_match_exact(self):
+        """Streamed percentiles match the exact percentiles of the same samples."""
+        duration = LogNormal.from_percentiles(100, 800)
+        result = simulate(
+            number_of_requests=Poisson(1_000_000),
+            duration_of_each_request_in_ms=duration,
+            memory=1024,
+            samples=200_000,
+            seed=42,
+            chunk_size=30_000,
+            percentiles=(5, 50, 99),
+        )
+
+        rng = np.random.default_rng(42)
+        requests, durations = [], []
+        for start in range(0, 200_000, 30_000):
+            size = min(30_000, 200_000 - start)
+            requests.append(rng.poisson(1_000_000, size).astype(float))
+            durations.append(duration.sample(rng, size))
+        costs = calculate_batch(
+            number_of_requests=np.concatenate(requests),
+            duration_of_each_request_in_ms=np.concatenate(durations),
+            memory=1024,
+        )
+
+        assert result.mean == approx(costs.mean())
+        expected = np.percentile(costs, [5, 50, 99])
+        assert [result.percentiles[p] for p in ("p5", "p50", "p99")] == approx(
+            expected, rel=1e-3
+        )
+
+    def test_histogram(self):
+        """The histogram has the requested number of bins over the sampled range."""
+        result = simulate(
+            duration_of_each_request_in_ms=LogNormal(200, 1.0),
+            samples=5_000,
+            seed=3,
+            bins=20,
+        )
+        assert len(result.histogram_edges) == 21
+        assert len(result.histogram_counts) == 20
+        assert sum(result.histogram_counts) == 5_000
+
+    def test_random_seed_reported(self):
+        """Without a seed, the generated one is reported and reproduces the result."""
+        params = {"duration_of_each_request_in_ms": LogNormal(200, 1.0), "samples": 500}
+        result = simulate(**params)
+        assert simulate(seed=result.seed, **params) == result
+
+    def test_invalid_samples(self):
+        """At least one sample is required."""
+        with pytest.raises(ValueError, match="samples"):
+            simulate(samples=0)
+
+
+class TestDistributions:
+    """Tests for the input distributions."""
+
+    def test_fixed(self):
+        """A fixed distribution always returns its value."""
+        assert Fixed(3).sample(np.random.default_rng(), 4).tolist() == [3.0] * 4
+
+    def test_lognormal_from_percentiles(self):
+        """A fitted log-normal reproduces its percentiles."""
+        samples = LogNormal.from_percentiles(100, 900).sample(
+            np.random.default_rng(0), 200_000
+        )
+        assert np.percentile(samples, [50, 99]) == approx([100, 900], rel=0.02)
+
+    def test_lognormal_invalid_percentiles(self):
+        """Percentiles must be ordered."""
+        with pytest.raises(ValueError, match="p50 <= p99"):
+            LogNormal.from_percentiles(200, 100)
+
+    def test_seasonal_monthly_mean(self):
+        """Seasonal samples are monthly totals: 30 days and the first 10 hours of one."""
+        samples = Seasonal([100] * 12 + [300] * 12).sample(
+            np.random.default_rng(0), 10_000
+        )
+        assert samples.mean() == approx(200 * 720 + 100 * 10, rel=1e-3)
+
+    def test_seasonal_profile_over_the_month(self):
+        """The profile is repeated hour by hour: a month is 4 weeks and 58 hours."""
+        weekdays = [100.0] * 120 + [0.0] * 48
+        samples = Seasonal(weekdays).sample(np.random.default_rng(0), 10_000)
+        assert samples.mean() == approx(100 * (4 * 120 + 58), rel=1e-3)
+
+    def test_seasonal_invalid_profile(self):
+        """Empty or negative profiles are rejected."""
+        for rates in ([], [100, -1]):
+            with pytest.raises(ValueError, match="Hourly rates"):
+                Seasonal(rates).sample(np.random.default_rng(0), 10)
+
+    def test_seasonal_requires_monthly_unit(self):
+        """Seasonal monthly totals priced per day would be 30 times too expensive."""
+        seasonal = Seasonal([1_000] * 24)
+        with pytest.raises(ValueError, match="per month"):
+            simulate(number_of_requests=seasonal, samples=100)
+        result = simulate(
+            number_of_requests=seasonal, request_unit="per month", samples=100, seed=0
+        )
+        expected = calculate(number_of_requests=730_000, request_unit="per month")
+        assert result.percentiles["p50"] == approx(expected.total_cost, rel=0.01)
+
+    def test_percentiles(self):
+        """Percentile points are reproduced by the samples."""
+        samples = Percentiles({0: 0, 50: 10, 100: 100}).sample(
+            np.random.default_rng(0), 100_000
+        )
+        assert np.percentile(samples, [25, 50, 75]) == approx([5, 10, 55], rel=0.02)
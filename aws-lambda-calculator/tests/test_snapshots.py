@@ -0,0 +1,99 @@
+import json
+from datetime import date
+
+import pytest
+from aws_lambda_calculator.calculator import calculate
+from aws_lambda_calculator.pricing import load_pricing, load_pricing_as_of
+from aws_lambda_calculator.snapshots import (
+    SCHEMA_VERSION,
+    content_digest,
+    load_snapshot,
+    read_index,
+    record_snapshots,
+)
+
+COST_FACTORS = {"Requests": "0.0000002000", "EphemeralStorage": "0.0000000309"}
+RAISED = {**COST_FACTORS, "Requests": "0.0000003000"}
+
+
+class TestRecordSnapshots:
+    """Tests for appending pricing to the snapshot store."""
+
+    def test_deduplicates_content(self, tmp_path):
+        """Regions with the same cost factors share one stored object."""
+        digests = record_snapshots(
+            {"us-east-1": COST_FACTORS, "us-east-2": COST_FACTORS},
+            date(2025, 1, 1),
+            str(tmp_path),
+        )
+        assert (
+            digests["us-east-1"] == digests["us-east-2"] == content_digest(COST_FACTORS)
+        )
+        assert len(list((tmp_path / "objects").iterdir())) == 1
+        assert load_snapshot(digests["us-east-1"], str(tmp_path)) == COST_FACTORS
+
+    def test_history_grows_on_change_only(self, tmp_path):
+        """Unchanged regions keep their snapshot, changed ones get a new one."""
+        record_snapshots({"us-east-1": COST_FACTORS}, date(2025, 1, 1), str(tmp_path))
+        record_snapshots({"us-east-1": COST_FACTORS}, date(2025, 4, 1), str(tmp_path))
+        record_snapshots({"us-east-1": RAISED}, date(2025, 7, 1), str(tmp_path))
+
+        index = read_index(str(tmp_path))
+        dates, digests = index.histories["us-east-1"]
+        assert dates == ("2025-01-01", "2025-07-01")
+        assert index.digest_for("us-east-1", date(2025, 6, 30)) == digests[0]
+        assert index.digest_for("us-east-1", date(2025, 7, 1)) == digests[1]
+
+    def test_append_only(self, tmp_path):
+        """A snapshot older than a region's latest one is rejected."""
+        record_snapshots({"us-east-1": COST_FACTORS}, date(2025, 7, 1), str(tmp_path))
+        with pytest.raises(ValueError, match="append-only"):
+            record_snapshots({"us-east-1": RAISED}, date(2025, 1, 1), str(tmp_path))
+
+    def test_lookup_errors(self, tmp_path):
+        """Unknown regions and dates before the first snapshot are rejected."""
+        record_snapshots({"us-east-1": COST_FACTORS}, date(2025, 1, 1), str(tmp_path))
+        index = read_index(str(tmp_path))
+        with pytest.raises(ValueError, match="Unknown region"):
+            index.digest_for("moon-1", date(2025, 1, 1))
+        with pytest.raises(ValueError, match="No pricing snapshot"):
+            index.digest_for("us-east-1", date(2024, 12, 31))
+
+    def test_unsupported_schema(self, tmp_path):
+        """An index written by a newer schema is not misread."""
+        (tmp_path / "index.json").write_text(
+            json.dumps({"schema_version": SCHEMA_VERSION + 1, "regions": {}})
+        )
+        with pytest.raises(ValueError, match="Unsupported pricing snapshot schema"):
+            read_index(str(tmp_path))
+
+
+class TestPricingAsOf:
+    """Tests for pricing with the bundled snapshots."""
+
+    def test_bundled_snapshot_matches_current(self):
+        """The bundled store holds the current cost factors of every region."""
+        assert load_pricing_as_of("us-east-1", date(2026, 10, 19)) == load_pricing(
+            "us-east-1"
+        )
+
+    def test_snapshots_are_cached(self):
+        """Dates resolving to the same snapshot share one parsed pricing model."""
+        assert load_pricing_as_of("us-east-1", date(2027, 1, 1)) is load_pricing_as_of(
+            "us-east-1", date(2026, 12, 1)
+        )
+
+    def test_calculate(self):
+        """calculate() accepts the date as a date or an ISO string."""
+        current = calculate()
+        historical = calculate(pricing_as_of="2026-10-19")
+        assert historical.total_cost == current.total_cost
+        assert "Pricing as of 2026-10-19" in historical.calculation_steps
+        assert (
+            calculate(pricing_as_of=date(2026, 10, 19)).total_cost == current.total_cost
+        )
+
+    def test_before_first_snapshot(self):
+        """Dates before the bundled history are rejected."""
+        with pytest.raises(ValueError, match="No pricing snapshot"):
+            calculate(pricing_as_of="2020-01-01")
@@ -0,0 +1,150 @@
+import math
+
+import pytest
+from pytest import approx
+from aws_lambda_calculator.calculator import calculate
+from aws_lambda_calculator.solver import solve_for
+from aws_lambda_calculator.pricing import load_pricing
+
+BASE = {
+    "region": "us-east-1",
+    "architecture": "x86",
+    "number_of_requests": 1_000_000,
+    "request_unit": "per day",
+    "duration_of_each_request_in_ms": 100,
+    "memory": 1024,
+    "memory_unit": "MB",
+    "ephemeral_storage": 2048,
+    "storage_unit": "MB",
+}
+
+
+class TestSolveFor:
+    """Tests for inverting the monthly cost for a given budget."""
+
+    @pytest.mark.parametrize("architecture", ["x86", "arm64"])
+    @pytest.mark.parametrize("include_free_tier", [True, False])
+    @pytest.mark.parametrize("budget", [1.0, 100.0, 250_000.0])
+    def test_requests_per_month_brackets_budget(
+        self, architecture, include_free_tier, budget
+    ):
+        """Flooring the solved request count stays within budget, one more request exceeds it."""
+        params = {
+            **BASE,
+            "architecture": architecture,
+            "request_unit": "per month",
+            "include_free_tier": include_free_tier,
+        }
+        result = solve_for(budget, "requests", **params)
+        requests = math.floor(result.value)
+
+        params["number_of_requests"] = requests
+        assert calculate(**params).total_cost <= budget + 1e-9
+        params["number_of_requests"] = requests + 1
+        assert calculate(**params).total_cost > budget - 1e-6
+
+    def test_requests_in_request_unit(self):
+        """The solved request count is expressed in the requested unit."""
+        per_day = solve_for(100.0, "requests", **BASE)
+        per_month = solve_for(
+            100.0, "requests", **{**BASE, "request_unit": "per month"}
+        )
+        assert per_day.unit == "per day"
+        assert per_day.value == approx(per_month.value / (730 / 24))
+
+    @pytest.mark.parametrize("budget", [10.0, 100.0, 10_000.0])
+    def test_duration_brackets_budget(self, budget):
+        """Flooring the solved duration stays within budget, one more ms exceeds it."""
+        result = solve_for(budget, "duration", **BASE)
+        assert result.unit == "ms"
+        duration = math.floor(result.value)
+
+        within = calculate(**{**BASE, "duration_of_each_request_in_ms": duration})
+        above = calculate(**{**BASE, "duration_of_each_request_in_ms": duration + 1})
+        assert within.total_cost <= budget
+        assert above.total_cost > budget
+
+    def test_memory_matches_budget(self):
+        """Calculating at the solved memory costs exactly the budget."""
+        result = solve_for(50.0, "memory", **BASE)
+        assert result.unit == "MB"
+        cost = calculate(**{**BASE, "memory": result.value}).total_cost
+        assert cost == approx(50.0)
+
+    def test_memory_in_gb(self):
+        """The solved memory is expressed in the requested memory unit."""
+        in_mb = solve_for(50.0, "memory", **BASE)
+        in_gb = solve_for(50.0, "memory", **{**BASE, "memory": 1, "memory_unit": "GB"})
+        assert in_gb.unit == "GB"
+        assert in_gb.value == approx(in_mb.value / 1024)
+
+    def test_memory_capped_at_lambda_limit(self):
+        """A budget larger than any memory size needs returns the 10,240 MB limit."""
+        result = solve_for(1_000_000.0, "memory", **BASE)
+        assert result.value == approx(10240)
+
+    def test_memory_below_minimum(self):
+        """A budget that cannot afford 128 MB is rejected."""
+        with pytest.raises(ValueError, match="minimum memory"):
+            solve_for(
+                1.0,
+                "memory",
+                **{
+                    **BASE,
+                    "request_unit": "per month",
+                    "duration_of_each_request_in_ms": 100_000,
+                    "ephemeral_storage": 512,
+                },
+            )
+
+    def test_budget_below_fixed_cost(self):
+        """A budget below the cost that does not depend on the unknown is rejected."""
+        with pytest.raises(ValueError, match="below the fixed monthly cost"):
+            solve_for(0.01, "duration", **{**BASE, "request_unit": "per second"})
+
+    def test_free_tier_covers_everything(self):
+        """Within the free tier, a zero budget still buys requests."""
+        params = {**BASE, "request_unit": "per month", "ephemeral_storage": 512}
+        result = solve_for(0.0, "requests", **params)
+        # 400,000 GB-s at 1 GB x 0.1 s per request, capped by the 1M free requests
+        assert result.value == approx(1_000_000)
+
+    def test_overflow_tier(self):
+        """Budgets large enough to reach the overflow rate are still inverted exactly."""
+        params = {**BASE, "request_unit": "per month", "ephemeral_storage": 512}
+        result = solve_for(1e9, "requests", **params)
+        params["number_of_requests"] = math.floor(result.value)
+        assert calculate(**params).total_cost == approx(1e9)
+
+    def test_negative_budget(self):
+        """A negative budget is rejected."""
+        with pytest.raises(ValueError, match="non-negative"):
+            solve_for(-1.0, "requests", **BASE)
+
+    def test_unknown_variable(self):
+        """An unsupported unknown is rejected."""
+        with pytest.raises(ValueError, match="Unknown variable"):
+            solve_for(1.0, "storage", **BASE)
+
+    def test_unknown_region(self):
+        """A region without a pricing file is rejected."""
+        with pytest.raises(ValueError, match="Unknown region"):
+            solve_for(1.0, "requests", **{**BASE, "region": "invalid-region"})
+
+
+class TestLoadPricing:
+    """Tests for the cached pricing model."""
+
+    def test_cached(self):
+        """The pricing model is parsed once per region."""
+        assert load_pricing("us-east-1") is load_pricing("us-east-1")
+
+    def test_tiers_sorted(self):
+        """Tier breakpoints are parsed and sorted ascending."""
+        tiers = load_pricing("us-east-1").tiers_for("x86")
+        assert tiers == ((6e9, 0.0000166667), (15e9, 0.0000150000))
+
+    def test_unknown_architecture(self):
+        """An unknown architecture is rejected."""
+        with pytest.raises(ValueError, match="Unknown architecture"):
+            load_pricing("us-east-1").tiers_for("mips")
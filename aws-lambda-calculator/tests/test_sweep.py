@@ -0,0 +1,143 @@
+import numpy as np
+import pytest
+from pytest import approx
+from aws_lambda_calculator.calculator import calculate
+from aws_lambda_calculator.sweep import compare_regions, sweep, sweep_chunks
+
+
+class TestSweep:
+    """Tests for grid evaluation of the monthly cost."""
+
+    def test_axes_in_parameter_order(self):
+        """Sequences become axes in the order of calculate()'s parameters."""
+        result = sweep(
+            memory=[128, 1024, 2048],
+            region=["us-east-1", "eu-west-1"],
+            duration_of_each_request_in_ms=[100, 200, 300, 400],
+        )
+        assert list(result.axes) == [
+            "region",
+            "duration_of_each_request_in_ms",
+            "memory",
+        ]
+        assert result.total_cost.shape == (2, 4, 3)
+
+    def test_cells_match_calculate(self):
+        """Every cell costs the same as through calculate()."""
+        result = sweep(
+            region=["us-east-1", "ap-east-1"],
+            architecture=["x86", "arm64"],
+            number_of_requests=[10, 100_000],
+            request_unit=["per minute", "per month"],
+            memory=[1, 4],
+            memory_unit="GB",
+            include_free_tier=[True, False],
+            chunk_size=7,
+        )
+        axes = list(result.axes)
+        for index in np.ndindex(result.total_cost.shape):
+            params = {name: result.axes[name][i].item() for name, i in zip(axes, index)}
+            expected = calculate(memory_unit="GB", **params).total_cost
+            assert result.total_cost[index] == approx(expected, rel=1e-12)
+
+    def test_no_axes(self):
+        """Without any sequence, the sweep is a single cell."""
+        result = sweep()
+        assert result.total_cost.shape == ()
+        assert float(result.total_cost) == approx(calculate().total_cost)
+
+    def test_dtype(self):
+        """The result cube can be stored in a smaller dtype."""
+        result = sweep(memory=[128, 256], dtype=np.float32)
+        assert result.total_cost.dtype == np.float32
+
+    def test_to_long(self):
+        """The long format has one row per cell."""
+        columns = sweep(
+            memory=[128, 256], request_unit=["per day", "per hour"]
+        ).to_long()
+        assert columns["request_unit"].tolist() == [
+            "per day",
+            "per day",
+            "per hour",
+            "per hour",
+        ]
+        assert columns["memory"].tolist() == [128, 256, 128, 256]
+        assert len(columns["total_cost"]) == 4
+
+    def test_to_records(self):
+        """Records are plain Python values."""
+        records = sweep(memory=[128, 256]).to_records()
+        assert records[1] == {
+            "memory": 256,
+            "total_cost": approx(calculate(memory=256).total_cost),
+        }
+
+    def test_invalid_axis(self):
+        """Empty axes are rejected."""
+        with pytest.raises(ValueError, match="non-empty 1-D sequence"):
+            sweep(memory=[])
+
+    def test_limits_per_unit(self):
+        """Memory limits are checked against every memory unit on the grid."""
+        with pytest.raises(ValueError, match="Memory must be between 0.125 GB"):
+            sweep(memory=[128, 1024], memory_unit=["MB", "GB"])
+
+
+class TestSweepChunks:
+    """Tests for streaming a sweep in long format."""
+
+    def test_chunks_match_cube(self):
+        """Concatenated chunks equal the flattened cube."""
+        params = {
+            "region": ["us-east-1", "sa-east-1", "me-south-1"],
+            "number_of_requests": np.arange(1, 11) * 1_000,
+            "memory": [128, 512, 3008],
+        }
+        chunks = list(sweep_chunks(chunk_size=16, **params))
+        assert [len(chunk["total_cost"]) for chunk in chunks] == [
+            16,
+            16,
+            16,
+            16,
+            16,
+            10,
+        ]
+
+        long = sweep(**params).to_long()
+        for name, column in long.items():
+            streamed = np.concatenate([chunk[name] for chunk in chunks])
+            assert streamed.tolist() == column.tolist()
+
+    def test_no_axes(self):
+        """Without any sequence, a single chunk holds the single cell."""
+        chunks = list(sweep_chunks())
+        assert len(chunks) == 1
+        assert chunks[0]["total_cost"].tolist() == [approx(calculate().total_cost)]
+
+
+class TestCompareRegions:
+    """Tests for pricing one workload across a selection of regions."""
+
+    def test_cells_match_calculate(self):
+        """Each selected region costs the same as through calculate()."""
+        result = compare_regions("us-gov-*,eu-west-1", "arm64", memory=1024)
+        assert list(result.axes) == ["region"]
+        assert result.axes["region"].tolist() == [
+            "eu-west-1",
+            "us-gov-east-1",
+            "us-gov-west-1",
+        ]
+        for region, cost in zip(result.axes["region"], result.total_cost):
+            expected = calculate(region=str(region), architecture="arm64", memory=1024)
+            assert cost == approx(expected.total_cost, rel=1e-9)
+
+    def test_other_axes(self):
+        """Other parameters may still be swept alongside the regions."""
+        result = compare_regions("eu-*", memory=[128, 1024])
+        assert result.total_cost.shape == (8, 2)
+
+    def test_no_match(self):
+        """A selector picking no region is rejected."""
+        with pytest.raises(ValueError, match="No regions match"):
+            compare_regions("eu-*&aws-us-gov")
@@ -0,0 +1,123 @@
+import io
+
+import numpy as np
+import pytest
+from pytest import approx
+from aws_lambda_calculator.calculator import calculate
+from aws_lambda_calculator.timeseries import price_series, read_csv
+
+CONFIG = {
+    "region": "us-east-1",
+    "architecture": "x86",
+    "memory": 1024,
+    "memory_unit": "MB",
+    "ephemeral_storage": 1024,
+    "storage_unit": "MB",
+}
+
+
+class TestPriceSeries:
+    """Tests for pricing an ordered usage series."""
+
+    @pytest.mark.parametrize("include_free_tier", [True, False])
+    def test_flat_month_matches_calculate(self, include_free_tier):
+        """A constant hourly series over 730 hours costs what calculate() charges."""
+        result = price_series(
+            np.full(730, 3600.0), 200, include_free_tier=include_free_tier, **CONFIG
+        )
+        expected = calculate(
+            number_of_requests=1,
+            request_unit="per second",
+            duration_of_each_request_in_ms=200,
+            include_free_tier=include_free_tier,
+            **CONFIG,
+        )
+        assert result.total_cost == approx(expected.total_cost)
+
+    def test_cumulative_curve_is_monotonic(self):
+        """The cost curve never decreases and stays flat while the free tier lasts."""
+        invocations = np.random.default_rng(0).poisson(50_000, 730)
+        result = price_series(invocations, 300, **CONFIG)
+        assert np.all(np.diff(result.cumulative_cost) >= -1e-12)
+        assert result.cumulative_cost[0] == approx(0.0, abs=1e-3)
+
+    def test_tier_crossed_mid_month(self):
+        """The tier boundary is crossed in the period the usage reaches it."""
+        # 1 GB x 1 s per request: 1e9 GB-s per hour reaches 6e9 GB-s during hour 6
+        hourly = np.full(10, 1e9)
+        result = price_series(
+            hourly,
+            1000,
+            include_free_tier=False,
+            **{**CONFIG, "memory": 1, "memory_unit": "GB", "ephemeral_storage": 512},
+        )
+        costs = np.diff(result.cumulative_cost, prepend=0.0)
+        request = 1e9 * 2e-7
+        assert costs[5] == approx(1e9 * 0.0000166667 + request)
+        assert costs[6] == approx(1e9 * 0.0000150000 + request)
+
+    def test_months_restart_tiers(self):
+        """Tiers and the free tier restart at each calendar month."""
+        timestamps = np.arange("2025-01-01T00", "2025-03-01T00", dtype="datetime64[h]")
+        invocations = np.full(len(timestamps), 1000.0)
+        result = price_series(invocations, 500, timestamps, **CONFIG)
+        assert result.months.tolist() == [
+            np.datetime64("2025-01", "M").item(),
+            np.datetime64("2025-02", "M").item(),
+        ]
+        single = price_series(invocations[: 31 * 24], 500, **CONFIG)
+        assert result.monthly_cost[0] == approx(single.total_cost)
+        assert result.total_cost == approx(result.monthly_cost.sum())
+
+    def test_many_functions(self):
+        """Each function of a 2-D series is priced independently."""
+        invocations = np.array([np.full(24, 1e5), np.full(24, 2e6)])
+        result = price_series(
+            invocations, [[100], [900]], architecture=["x86", "arm64"], chunk_size=24
+        )
+        for row, architecture, duration in [(0, "x86", 100), (1, "arm64", 900)]:
+            single = price_series(invocations[row], duration, architecture=architecture)
+            assert result.cumulative_cost[row] == approx(single.cumulative_cost)
+
+    def test_year_of_minutes(self):
+        """A year of per-minute data for many functions is priced in one call."""
+        timestamps = np.arange(
+            "2025-01-01T00:00", "2026-01-01T00:00", dtype="datetime64[m]"
+        )
+        invocations = np.random.default_rng(1).poisson(20, (20, len(timestamps)))
+        result = price_series(invocations, 120, timestamps, **CONFIG)
+        assert result.monthly_cost.shape == (20, 12)
+        assert result.total_cost == approx(result.monthly_cost.sum(axis=1))
+
+    def test_invalid_input(self):
+        """Negative usage, unsorted timestamps and bad limits are rejected."""
+        with pytest.raises(ValueError, match="must not be negative"):
+            price_series([-1.0], 100)
+        with pytest.raises(ValueError, match="ascending"):
+            price_series([1.0, 1.0], 100, ["2025-01-02", "2025-01-01"])
+        with pytest.raises(ValueError, match="Memory must be"):
+            price_series([1.0], 100, memory=64)
+
+
+class TestReadCsv:
+    """Tests for reading a usage series from CSV."""
+
+    def test_pivots_long_rows(self):
+        """Rows are pivoted into a (functions, periods) grid, missing cells are idle."""
+        stream = io.StringIO(
+            "timestamp,function,invocations,duration_ms\n"
+            "2025-01-01T01:00:00,api,20,150\n"
+            "2025-01-01T00:00:00,api,10,100\n"
+            "2025-01-01T00:00:00,worker,5,900\n"
+        )
+        series = read_csv(stream)
+        assert series.functions == ("api", "worker")
+        assert series.invocations.tolist() == [[10, 20], [5, 0]]
+        assert series.duration_ms.tolist() == [[100, 150], [900, 0]]
+        result = price_series(series.invocations, series.duration_ms, series.timestamps)
+        assert result.cumulative_cost.shape == (2, 2)
+
+    def test_missing_columns(self):
+        """A CSV without the expected columns is rejected."""
+        with pytest.raises(ValueError, match="Missing CSV columns: duration_ms"):
+            read_csv(io.StringIO("timestamp,function,invocations\n"))
@@ -0,0 +1,112 @@
+import pytest
+from pytest import approx
+from aws_lambda_calculator.batch import calculate_batch
+from aws_lambda_calculator.calculator import calculate
+
+WORKLOAD = {
+    "number_of_requests": 100,
+    "request_unit": "million per month",
+    "duration_of_each_request_in_ms": 20,
+    "memory": 128,
+}
+
+
+class TestEdgeWorkloads:
+    """Tests for Lambda@Edge pricing."""
+
+    def test_flat_rates_without_free_tier(self):
+        """Requests and duration are billed at the edge rates, free tier or not."""
+        result = calculate(workload_type="edge", **WORKLOAD)
+        gb_sec = 100_000_000 * 0.02 * 0.125
+        assert result.total_cost == approx(
+            100_000_000 * 0.0000006 + gb_sec * 0.00005001
+        )
+        assert result.total_cost == approx(
+            calculate(
+                workload_type="edge", include_free_tier=False, **WORKLOAD
+            ).total_cost
+        )
+
+    def test_no_ephemeral_storage_charges(self):
+        """Lambda@Edge functions are not billed for ephemeral storage."""
+        small = calculate(workload_type="edge", **WORKLOAD)
+        large = calculate(workload_type="edge", ephemeral_storage=10240, **WORKLOAD)
+        assert small.total_cost == large.total_cost
+
+    def test_x86_only(self):
+        """Lambda@Edge functions cannot run on arm64."""
+        with pytest.raises(ValueError, match="only supports the x86"):
+            calculate(workload_type="edge", architecture="arm64", **WORKLOAD)
+
+    def test_exact(self):
+        """The exact mode prices edge workloads the same way."""
+        result = calculate(workload_type="edge", exact=True, **WORKLOAD)
+        assert result.total_cost == approx(
+            calculate(workload_type="edge", **WORKLOAD).total_cost
+        )
+
+
+class TestStreamingWorkloads:
+    """Tests for response streaming pricing."""
+
+    def test_bytes_beyond_six_mb(self):
+        """Only the bytes beyond the first 6 MB of each response are billed."""
+        standard = calculate(**WORKLOAD).total_cost
+        streaming = calculate(
+            workload_type="streaming", response_size_in_mb=10, **WORKLOAD
+        )
+        assert streaming.total_cost - standard == approx(100_000_000 * 4 / 1024 * 0.008)
+        assert any("response streaming" in step for step in streaming.calculation_steps)
+
+    def test_small_responses(self):
+        """Responses within 6 MB cost the same as a standard function."""
+        streaming = calculate(
+            workload_type="streaming", response_size_in_mb=6, **WORKLOAD
+        )
+        assert streaming.total_cost == calculate(**WORKLOAD).total_cost
+
+    def test_exact(self):
+        """The exact mode adds the streaming charges as a fourth charge."""
+        result = calculate(
+            workload_type="streaming", response_size_in_mb=6.5, exact=True, **WORKLOAD
+        )
+        assert result.total_cost == approx(
+            calculate(
+                workload_type="streaming", response_size_in_mb=6.5, **WORKLOAD
+            ).total_cost
+        )
+
+    def test_negative_response_size(self):
+        """A negative response size is rejected."""
+        with pytest.raises(ValueError):
+            calculate(workload_type="streaming", response_size_in_mb=-1, **WORKLOAD)
+
+
+class TestBatchWorkloadTypes:
+    """Tests for the workload types in the batch path."""
+
+    def test_matches_calculate(self):
+        """A mixed batch prices each workload type like calculate()."""
+        kinds = ["standard", "edge", "streaming"]
+        costs = calculate_batch(workload_type=kinds, response_size_in_mb=12, **WORKLOAD)
+        for kind, cost in zip(kinds, costs):
+            expected = calculate(
+                workload_type=kind, response_size_in_mb=12, **WORKLOAD
+            ).total_cost
+            assert cost == approx(expected)
+
+    @pytest.mark.parametrize(
+        "kwargs, message",
+        [
+            (
+                {"workload_type": "edge", "architecture": "arm64"},
+                "only supports the x86",
+            ),
+            ({"workload_type": "websocket"}, "Unknown workload type"),
+            ({"response_size_in_mb": -1}, "must not be negative"),
+        ],
+    )
+    def test_invalid_input(self, kwargs, message):
+        """Invalid workload types and response sizes are rejected."""
+        with pytest.raises(ValueError, match=message):
+            calculate_batch(**WORKLOAD, **kwargs)
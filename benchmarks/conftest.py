@@ -0,0 +1,37 @@
+import logging
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def workload():
+    """The quote every benchmark starts from, as calculate() keyword arguments."""
+    return {
+        "region": "us-east-1",
+        "architecture": "x86",
+        "number_of_requests": 1_000_000,
+        "request_unit": "per day",
+        "duration_of_each_request_in_ms": 100,
+        "memory": 512,
+        "memory_unit": "MB",
+        "ephemeral_storage": 10,
+        "storage_unit": "GB",
+    }
+
+
+@pytest.fixture(autouse=True)
+def quiet():
+    """Benchmark with the package logger at WARNING unless a test asks for verbose."""
+    calc_logger = logging.getLogger("aws_lambda_calculator")
+    level = calc_logger.level
+    calc_logger.setLevel(logging.WARNING)
+    yield calc_logger
+    calc_logger.setLevel(level)
+
+
+@pytest.fixture(params=[False, True], ids=["quiet", "verbose"])
+def verbose(request, quiet):
+    """Run the benchmark with the package logger at WARNING, then at DEBUG."""
+    if request.param:
+        quiet.setLevel(logging.DEBUG)
+    return request.param
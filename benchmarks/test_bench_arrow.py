@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+from aws_lambda_calculator import calculate_batch
+
+pa = pytest.importorskip("pyarrow")
+from aws_lambda_calculator.arrow_io import calculate_table
+
+SIZE = 100_000
+REGIONS = ["us-east-1", "eu-west-1", "ap-southeast-2", "sa-east-1"]
+
+
+@pytest.fixture(scope="module")
+def fleet():
+    """A fleet inventory as it comes out of Parquet, regions dictionary-encoded."""
+    rng = np.random.default_rng(0)
+    return pa.table(
+        {
+            "function": [f"function-{i}" for i in range(SIZE)],
+            "region": pa.DictionaryArray.from_arrays(
+                rng.integers(0, len(REGIONS), SIZE).astype(np.int32), REGIONS
+            ),
+            "architecture": pa.array(rng.choice(["x86", "arm64"], SIZE)),
+            "number_of_requests": rng.integers(1, 10_000_000, SIZE).astype(float),
+            "duration_of_each_request_in_ms": rng.uniform(1, 5000, SIZE),
+            "memory": rng.choice([128.0, 512.0, 1024.0, 2048.0], SIZE),
+        }
+    )
+
+
+@pytest.mark.benchmark(group="arrow")
+def test_arrow_rows_to_kwargs(benchmark, fleet):
+    """Converting the table to per-workload rows before calculate_batch()."""
+
+    def price():
+        rows = fleet.drop_columns(["function"]).to_pylist()
+        columns = {name: [row[name] for row in rows] for name in rows[0]}
+        return calculate_batch(**columns)
+
+    benchmark(price)
+
+
+@pytest.mark.benchmark(group="arrow")
+def test_arrow_native(benchmark, fleet):
+    """Pricing the Arrow columns in place."""
+    benchmark(calculate_table, fleet)
@@ -0,0 +1,299 @@
+from datetime import date
+
+import numpy as np
+import pytest
+from aws_lambda_calculator import (
+    aggregate,
+    calculate,
+    calculate_account,
+    calculate_batch,
+    compare_regions,
+    instrument,
+    select_regions,
+)
+from aws_lambda_calculator.batch import (
+    requests_per_month_multiplier,
+    tiered_cost,
+    unit_to_gb,
+)
+from aws_lambda_calculator.calculator import (
+    cache_stats,
+    calculate_tiered_cost,
+    clear_caches,
+)
+from aws_lambda_calculator.exact import tiered_cost_nanos, to_pico
+from aws_lambda_calculator.free_tier import FREE_TIER_POLICIES
+from aws_lambda_calculator.models import REQUEST_UNITS, SIZE_UNITS
+from aws_lambda_calculator.pricing import (
+    OVERFLOW_RATE,
+    TierSchedule,
+    _load_snapshot_pricing,
+    load_pricing,
+    load_pricing_as_of,
+)
+from aws_lambda_calculator.pricing_table import load_pricing_table
+from aws_lambda_calculator.timeseries import price_series
+
+
+@pytest.mark.benchmark(group="quote")
+def test_single_quote(benchmark, verbose, workload):
+    """Latency of one calculate() call, with and without debug logging."""
+    result = benchmark(calculate, **workload)
+    assert result.total_cost > 0
+
+
+@pytest.mark.benchmark(group="quote")
+def test_single_quote_instrumented(benchmark, workload):
+    """Latency of one calculate() call with the phase timers recording."""
+    with instrument():
+        benchmark(calculate, **workload)
+
+
+@pytest.mark.benchmark(group="quote")
+def test_single_quote_exact(benchmark, workload):
+    """Latency of one calculate() call in integer nano-dollar mode."""
+    result = benchmark(calculate, **workload, exact=True)
+    assert result.total_cost_nano_usd is not None
+
+
+@pytest.mark.benchmark(group="pricing-load")
+def test_pricing_load_cold(benchmark):
+    """Parsing a region's cost factors from disk on every call."""
+    benchmark.pedantic(
+        load_pricing, args=("us-east-1",), setup=load_pricing.cache_clear, rounds=200
+    )
+
+
+@pytest.mark.benchmark(group="pricing-load")
+def test_pricing_load_warm(benchmark):
+    """Fetching a region's cost factors once they are cached."""
+    load_pricing("us-east-1")
+    benchmark(load_pricing, "us-east-1")
+
+
+@pytest.mark.benchmark(group="pricing-load")
+def test_pricing_load_as_of_cold(benchmark):
+    """Parsing a historical snapshot from disk on every call."""
+
+    def clear():
+        load_pricing_as_of.cache_clear()
+        _load_snapshot_pricing.cache_clear()
+
+    benchmark.pedantic(
+        load_pricing_as_of,
+        args=("us-east-1", date(2026, 10, 19)),
+        setup=clear,
+        rounds=200,
+    )
+
+
+@pytest.mark.benchmark(group="pricing-load")
+def test_pricing_load_as_of_warm(benchmark):
+    """Fetching a historical snapshot once it is cached."""
+    load_pricing_as_of("us-east-1", date(2026, 10, 19))
+    benchmark(load_pricing_as_of, "us-east-1", date(2026, 10, 19))
+
+
+@pytest.mark.benchmark(group="batch")
+@pytest.mark.parametrize("size", [1_000, 100_000])
+def test_batch_throughput(benchmark, size, workload):
+    """Pricing many workloads at once through calculate_batch()."""
+    rng = np.random.default_rng(0)
+    params = {
+        **workload,
+        "region": rng.choice(["us-east-1", "eu-west-1", "ap-south-1"], size),
+        "number_of_requests": rng.integers(1, 10_000_000, size),
+        "memory": rng.integers(128, 10240, size),
+    }
+    totals = benchmark(calculate_batch, **params)
+    assert totals.shape == (size,)
+
+
+@pytest.mark.benchmark(group="batch")
+def test_batch_workload_types(benchmark, workload):
+    """A batch mixing standard, Lambda@Edge and response-streaming workloads."""
+    size = 100_000
+    rng = np.random.default_rng(0)
+    params = {
+        **workload,
+        "number_of_requests": rng.integers(1, 10_000_000, size),
+        "workload_type": rng.choice(["standard", "edge", "streaming"], size),
+        "response_size_in_mb": rng.uniform(0, 20, size),
+    }
+    totals = benchmark(calculate_batch, **params)
+    assert totals.shape == (size,)
+
+
+@pytest.mark.benchmark(group="aggregate")
+def test_aggregate_fleet(benchmark, workload):
+    """One account bill for a 100k-function fleet across three regions."""
+    size = 100_000
+    rng = np.random.default_rng(1)
+    params = {
+        **workload,
+        "region": rng.choice(["us-east-1", "eu-west-1", "ap-south-1"], size),
+        "number_of_requests": rng.integers(1, 1_000_000, size),
+        "memory": rng.integers(128, 10240, size),
+    }
+    result = benchmark(aggregate, **params)
+    assert result.total_cost.shape == (size,)
+
+
+@pytest.mark.benchmark(group="timeseries")
+def test_price_series_year_of_minutes(benchmark, workload):
+    """A year of per-minute invocations for 20 functions, priced month by month."""
+    timestamps = np.arange(
+        "2025-01-01T00:00", "2026-01-01T00:00", dtype="datetime64[m]"
+    )
+    invocations = np.random.default_rng(1).poisson(20, (20, len(timestamps)))
+    config = {
+        key: workload[key]
+        for key in ("region", "architecture", "memory", "memory_unit")
+    }
+    result = benchmark(price_series, invocations, 120, timestamps, **config)
+    assert result.monthly_cost.shape == (20, 12)
+
+
+@pytest.mark.benchmark(group="free-tier")
+@pytest.mark.parametrize("policy", FREE_TIER_POLICIES)
+def test_account_free_tier(benchmark, policy, workload):
+    """A year of a 100k-function account sharing one free tier."""
+    functions, months = 100_000, 12
+    rng = np.random.default_rng(0)
+    params = {
+        **workload,
+        "architecture": rng.choice(["x86", "arm64"], (functions, 1)),
+        "number_of_requests": rng.integers(1, 1_000_000, (functions, months)),
+        "free_tier_policy": policy,
+    }
+    result = benchmark(calculate_account, **params)
+    assert result.total_cost.shape == (functions, months)
+
+
+@pytest.mark.benchmark(group="unit-conversion")
+@pytest.mark.parametrize("encoded", [False, True], ids=["names", "codes"])
+def test_unit_conversion(benchmark, encoded):
+    """Converting a million request and memory units, as names or pre-encoded codes."""
+    size = 1_000_000
+    rng = np.random.default_rng(0)
+    request_unit = rng.integers(0, len(REQUEST_UNITS), size)
+    memory_unit = rng.integers(0, len(SIZE_UNITS), size)
+    if not encoded:
+        request_unit = np.array(REQUEST_UNITS)[request_unit]
+        memory_unit = np.array(SIZE_UNITS)[memory_unit]
+
+    def convert():
+        return requests_per_month_multiplier(request_unit) * unit_to_gb(
+            memory_unit, "memory unit"
+        )
+
+    assert benchmark(convert).shape == (size,)
+
+
+@pytest.mark.benchmark(group="memoization")
+@pytest.mark.parametrize("cached", [False, True], ids=["cold", "memoized"])
+def test_zipf_quote_mix(benchmark, cached, workload):
+    """
+    1,000 quotes drawn from 200 scenarios with Zipf popularity, as a busy endpoint sees
+    them; cold empties the unit conversion caches before every quote.
+    """
+    rng = np.random.default_rng(0)
+    scenarios = [
+        {
+            **workload,
+            "memory": int(memory),
+            "duration_of_each_request_in_ms": int(duration),
+        }
+        for memory, duration in zip(
+            rng.integers(128, 10_240, 200), rng.integers(1, 900_000, 200)
+        )
+    ]
+    ranks = np.minimum(rng.zipf(1.3, 1_000), len(scenarios)) - 1
+    mix = [scenarios[rank] for rank in ranks]
+
+    def run():
+        for params in mix:
+            if not cached:
+                clear_caches()
+            calculate(**params)
+
+    clear_caches()
+    benchmark(run)
+    for name, info in cache_stats().items():
+        benchmark.extra_info[f"{name}_hit_rate"] = info.hits / (info.hits + info.misses)
+
+
+def _cold_pricing():
+    load_pricing.cache_clear()
+    load_pricing_table.cache_clear()
+
+
+@pytest.mark.benchmark(group="multi-region")
+def test_compare_regions(benchmark, workload):
+    """Every region priced in one vectorized sweep, cost factors loaded cold."""
+    params = {name: value for name, value in workload.items() if name != "region"}
+    result = benchmark.pedantic(
+        compare_regions, args=("*",), kwargs=params, setup=_cold_pricing, rounds=50
+    )
+    assert result.total_cost.shape == (len(select_regions("*")),)
+
+
+@pytest.mark.benchmark(group="multi-region")
+def test_calculate_per_region(benchmark, workload):
+    """Every region priced by its own calculate() call, cost factors loaded cold."""
+    params = {name: value for name, value in workload.items() if name != "region"}
+
+    def run():
+        return [calculate(region=code, **params) for code in select_regions("*")]
+
+    assert len(benchmark.pedantic(run, setup=_cold_pricing, rounds=50)) > 1
+
+
+def _tiers(count: int) -> dict[str, float]:
+    return {str((t + 1) * 1_000_000_000): 0.0000166667 - t * 1e-9 for t in range(count)}
+
+
+@pytest.mark.benchmark(group="tiered-cost")
+@pytest.mark.parametrize("tier_count", [2, 8, 64, 512])
+def test_tiered_cost(benchmark, tier_count):
+    """calculate_tiered_cost() with usage past the last of many tiers."""
+    tiers = _tiers(tier_count)
+    usage = (tier_count + 1) * 1e9
+    cost = benchmark(lambda: calculate_tiered_cost(usage, tiers, OVERFLOW_RATE, []))
+    assert cost > 0
+
+
+@pytest.mark.benchmark(group="tiered-cost-schedule")
+@pytest.mark.parametrize("tier_count", [2, 8, 64, 512])
+def test_tiered_cost_schedule(benchmark, tier_count):
+    """TierSchedule.cost() on a schedule prepared at load time."""
+    schedule = TierSchedule.from_cost_factor(_tiers(tier_count), OVERFLOW_RATE)
+    cost = benchmark(schedule.cost, (tier_count + 1) * 1e9)
+    assert cost > 0
+
+
+@pytest.mark.benchmark(group="tiered-cost-vectorized")
+@pytest.mark.parametrize("tier_count", [2, 8, 64])
+def test_tiered_cost_vectorized(benchmark, tier_count):
+    """The vectorized tiered_cost() over 10,000 usages and many tiers."""
+    thresholds = np.array([float(t) for t in _tiers(tier_count)])
+    rates = np.array(list(_tiers(tier_count).values()))
+    usage = np.linspace(0, (tier_count + 1) * 1e9, 10_000)
+    cost = benchmark(
+        tiered_cost,
+        usage,
+        np.broadcast_to(thresholds, (usage.size, tier_count)),
+        np.broadcast_to(rates, (usage.size, tier_count)),
+        np.full(usage.size, OVERFLOW_RATE),
+    )
+    assert cost.shape == usage.shape
+
+
+@pytest.mark.benchmark(group="tiered-cost-exact")
+@pytest.mark.parametrize("tier_count", [2, 8, 64, 512])
+def test_tiered_cost_exact(benchmark, tier_count):
+    """tiered_cost_nanos() with usage past the last of many tiers."""
+    tiers = sorted((int(t), to_pico(rate)) for t, rate in _tiers(tier_count).items())
+    usage = ((tier_count + 1) * 1_000_000_000, 1)
+    cost = benchmark(tiered_cost_nanos, usage, tiers, to_pico(OVERFLOW_RATE))
+    assert cost > 0
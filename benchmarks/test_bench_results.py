@@ -0,0 +1,64 @@
+import tracemalloc
+
+import numpy as np
+import pytest
+from aws_lambda_calculator import calculate_batch_result
+from aws_lambda_calculator.models import CalculationResult
+
+SIZE = 100_000
+
+
+@pytest.fixture(scope="module")
+def batch(workload):
+    rng = np.random.default_rng(0)
+    return calculate_batch_result(
+        **{**workload, "number_of_requests": rng.integers(1, 10_000_000, SIZE)}
+    )
+
+
+def _bytes_per_result(build) -> float:
+    """Memory still allocated per result once `build` has returned them all."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    results = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / len(results)
+
+
+@pytest.mark.benchmark(group="results")
+def test_results_pydantic(benchmark, batch):
+    """One CalculationResult per workload, with an empty steps list."""
+
+    def build():
+        return [
+            CalculationResult(total_cost=total, calculation_steps=[])
+            for total in batch.total_cost.tolist()
+        ]
+
+    benchmark.extra_info["bytes_per_result"] = _bytes_per_result(build)
+    benchmark.pedantic(build, rounds=5)
+
+
+@pytest.mark.benchmark(group="results")
+def test_results_compact(benchmark, batch):
+    """One slotted CompactResult per workload."""
+
+    def build():
+        return list(batch)
+
+    benchmark.extra_info["bytes_per_result"] = _bytes_per_result(build)
+    benchmark.pedantic(build, rounds=5)
+
+
+@pytest.mark.benchmark(group="results")
+def test_results_columnar(benchmark, workload):
+    """The columnar BatchResult, priced and held as arrays only."""
+    rng = np.random.default_rng(0)
+    requests = rng.integers(1, 10_000_000, SIZE)
+
+    def build():
+        return calculate_batch_result(**{**workload, "number_of_requests": requests})
+
+    benchmark.extra_info["bytes_per_result"] = build().nbytes / SIZE
+    benchmark.pedantic(build, rounds=5)
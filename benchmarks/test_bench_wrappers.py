@@ -0,0 +1,46 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+import cli
+from aws_lambda import handler
+
+
+@pytest.fixture
+def cli_args(workload):
+    """The benchmark workload as CLI options."""
+    return [f"--{name.replace('_', '-')}={value}" for name, value in workload.items()]
+
+
+@pytest.mark.benchmark(group="handler")
+def test_handler(benchmark, verbose, workload):
+    """End-to-end Lambda handler time, with and without calculation steps."""
+    event = {"body": json.dumps({**workload, "verbose": verbose})}
+    response = benchmark(handler, event, None)
+    assert response["statusCode"] == 200
+
+
+@pytest.mark.benchmark(group="cli")
+def test_cli_in_process(benchmark, monkeypatch, capsys, cli_args):
+    """Argument parsing, pricing and output of the CLI, without interpreter start-up."""
+    monkeypatch.setattr(sys, "argv", ["cli.py", *cli_args])
+    benchmark(cli.run)
+    assert "Total cost:" in capsys.readouterr().out
+
+
+@pytest.mark.benchmark(group="cli")
+def test_cli_subprocess(benchmark, cli_args):
+    """Full CLI invocation, including interpreter start-up and imports."""
+
+    def run():
+        return subprocess.run(
+            [sys.executable, "src/cli.py", *cli_args],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+
+    result = benchmark.pedantic(run, rounds=5, iterations=1)
+    assert result.returncode == 0
@@ -1,13 +1,104 @@
+import hashlib
 import json
 import logging
+import os
+import time
+from contextlib import nullcontext
+from typing import Any
 from utils.logger import logger
-from aws_lambda_calculator import calculate
+from aws_lambda_calculator import (
+    HistogramSink,
+    calculate,
+    instrument,
+    load_region_index,
+    pricing_version,
+)
+from aws_lambda_calculator.models import CalculationRequest
 
 # Extracting the version from the package metadata
 from importlib import metadata
 
 __version__ = metadata.version("aws_lambda_calculator")
 
+EMF_NAMESPACE = "AwsLambdaCalculator"
+
+# A quote only changes with the pricing, which its ETag covers; the edge may keep a GET
+# quote longer than browsers since clients revalidate with If-None-Match anyway
+CACHE_CONTROL = "public, max-age=300, s-maxage=3600"
+# POST quotes are for the client only, which revalidates them with their ETag
+PRIVATE_CACHE_CONTROL = "private, no-cache"
+
+
+def emf_enabled() -> bool:
+    """Phase timings are emitted only when EMF_METRICS=true, so they cost nothing otherwise."""
+    return os.environ.get("EMF_METRICS", "false").lower() == "true"
+
+
+def emf_line(sink: HistogramSink) -> str:
+    """Render the phase timings of a quote as a CloudWatch Embedded Metric Format line."""
+    timings = {f"{phase}_ms": total * 1000 for phase, total in sink.totals.items()}
+    return json.dumps(
+        {
+            "_aws": {
+                "Timestamp": int(time.time() * 1000),
+                "CloudWatchMetrics": [
+                    {
+                        "Namespace": EMF_NAMESPACE,
+                        "Dimensions": [["Service"]],
+                        "Metrics": [
+                            {"Name": name, "Unit": "Milliseconds"} for name in timings
+                        ],
+                    }
+                ],
+            },
+            "Service": "aws-lambda-calculator",
+            **timings,
+        }
+    )
+
+
+def request_payload(event: dict) -> dict[str, Any]:
+    """The quote parameters of a POST body, or of the query string of a GET request."""
+    if event.get("body") is not None:
+        return json.loads(event["body"])
+    payload: dict[str, Any] = {}
+    for name, value in (event.get("queryStringParameters") or {}).items():
+        # numbers and booleans arrive as strings
+        try:
+            payload[name] = json.loads(value)
+        except ValueError:
+            payload[name] = value
+    return payload
+
+
+def request_header(event: dict, name: str) -> str | None:
+    """A request header, whatever its case."""
+    for header, value in (event.get("headers") or {}).items():
+        if header.lower() == name.lower():
+            return value
+    return None
+
+
+def quote_etag(params: dict) -> str:
+    """
+    A strong ETag of a quote: the digest of the validated request, e.g.
+    CalculationRequest.model_dump(mode="json"), along with the versions of the
+    calculator and of the region's pricing, which fully determine it.
+    """
+    normalized = json.dumps(params, sort_keys=True, separators=(",", ":"))
+    digest = hashlib.sha256(
+        f"{__version__}\n{pricing_version(params['region'])}\n{normalized}".encode()
+    ).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Whether an If-None-Match header names the ETag; weak tags compare equal."""
+    if if_none_match is None:
+        return False
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
 
 def handler(event: dict, context: object) -> dict:
     """
@@ -16,20 +107,35 @@ def handler(event: dict, context: object) -> dict:
     logger.info("Lambda function invoked.")
     logger.debug(f"Received event: {json.dumps(event, indent=2)}")
 
-    def make_response(status_code: int, payload: dict) -> dict:
-        """Helper to format Lambda proxy integration responses with CORS."""
+    def make_response(
+        status_code: int, payload: dict | None, etag: str | None = None
+    ) -> dict:
+        """
+        Helper to format Lambda proxy integration responses with CORS. Bodies are
+        serialized with sorted keys, so equal quotes are byte-identical; only tagged
+        responses may be cached, and only GET ones by shared caches.
+        """
+        cache_control = "no-store"
+        if etag:
+            public = event.get("httpMethod", "POST").upper() == "GET"
+            cache_control = CACHE_CONTROL if public else PRIVATE_CACHE_CONTROL
+        headers = {
+            "Access-Control-Allow-Origin": "*",
+            "Access-Control-Allow-Headers": "*",
+            "Access-Control-Allow-Methods": "OPTIONS,POST,GET",
+            "Access-Control-Expose-Headers": "ETag",
+            "Cache-Control": cache_control,
+        }
+        if etag:
+            headers["ETag"] = etag
         return {
             "statusCode": status_code,
-            "headers": {
-                "Access-Control-Allow-Origin": "*",
-                "Access-Control-Allow-Headers": "*",
-                "Access-Control-Allow-Methods": "OPTIONS,POST,GET",
-            },
-            "body": json.dumps(payload),
+            "headers": headers,
+            "body": "" if payload is None else json.dumps(payload, sort_keys=True),
         }
 
     try:
-        payload = json.loads(event.get("body", "{}"))
+        payload = request_payload(event)
 
         # Check for verbose flag (default to True as per requirements)
         verbose = payload.get("verbose", True)
@@ -44,8 +150,9 @@ def handler(event: dict, context: object) -> dict:
         ephemeral_storage = payload.get("ephemeral_storage")
         storage_unit = payload.get("storage_unit")
         include_free_tier = payload.get("include_free_tier", True)
+        with_sensitivity = payload.get("sensitivity", False)
 
-        required_params = {
+        required_params: dict[str, Any] = {
             "region": region,
             "architecture": architecture,
             "number_of_requests": number_of_requests,
@@ -61,6 +168,36 @@ def handler(event: dict, context: object) -> dict:
             if value is None:
                 raise KeyError(name)
 
+        # Regions may be given by code or location name, e.g. "EU (Ireland)"
+        try:
+            region = load_region_index().resolve(str(region)).code
+        except ValueError as e:
+            logger.error(str(e))
+            return make_response(400, {"status": "error", "message": str(e)})
+        required_params["region"] = region
+
+        # Only valid quotes are tagged, by their normalized inputs, e.g. 128 and 128.0 MB
+        try:
+            request = CalculationRequest.model_validate(
+                {**required_params, "include_free_tier": include_free_tier}
+            )
+        except ValueError as e:
+            logger.error(f"Invalid request: {e}")
+            return make_response(400, {"status": "error", "message": str(e)})
+
+        # The quote is fully determined by its inputs and the pricing, so a client
+        # holding the same ETag is told so before anything is computed
+        etag = quote_etag(
+            {
+                **request.model_dump(mode="json"),
+                "verbose": verbose,
+                "sensitivity": with_sensitivity,
+            }
+        )
+        if etag_matches(request_header(event, "If-None-Match"), etag):
+            logger.info("Quote not modified.")
+            return make_response(304, None, etag)
+
         # Set logger to DEBUG level if verbose mode is enabled
         if verbose:
             calc_logger = logging.getLogger("aws_lambda_calculator")
@@ -68,23 +205,26 @@ def handler(event: dict, context: object) -> dict:
             logger.setLevel(logging.DEBUG)
 
         logger.info("Calculating cost...")
-        result = calculate(
-            region=region,
-            architecture=architecture,
-            number_of_requests=number_of_requests,
-            request_unit=request_unit,
-            duration_of_each_request_in_ms=duration_of_each_request_in_ms,
-            memory=memory,
-            memory_unit=memory_unit,
-            ephemeral_storage=ephemeral_storage,
-            storage_unit=storage_unit,
-            include_free_tier=include_free_tier,
-        )
+        with instrument(HistogramSink()) if emf_enabled() else nullcontext() as sink:
+            result = calculate(**request.model_dump())
+        if isinstance(sink, HistogramSink):
+            # CloudWatch extracts the metrics from EMF lines written to stdout
+            print(emf_line(sink))
 
         response_data = {"status": "success", "cost": round(result.total_cost, 6)}
         if verbose:
             response_data["calculation_steps"] = result.calculation_steps
-        return make_response(200, response_data)
+        if with_sensitivity:
+            # USD per extra unit of each input, in the units of the request; imported
+            # here so plain quotes don't load numpy on a cold start
+            from aws_lambda_calculator.sensitivity import sensitivity
+
+            gradient = sensitivity(
+                **request.model_dump(exclude={"pricing_as_of"})
+            ).row()
+            gradient.pop("total_cost")
+            response_data["sensitivity"] = gradient
+        return make_response(200, response_data, etag)
 
     except KeyError as e:
         logger.error(f"Missing required field: {e}")
@@ -1,7 +1,8 @@
 import argparse
 import sys
 from utils.logger import logger
-from aws_lambda_calculator import calculate
+from aws_lambda_calculator import calculate, load_region_index, solve_for
+from aws_lambda_calculator.calculator import REQUESTS_PER_MONTH
 from importlib import metadata
 
 __version__ = metadata.version("aws_lambda_calculator")
@@ -20,51 +21,21 @@ def parse_args() -> argparse.Namespace:
         exit_on_error=True,
     )
 
-    # Required arguments
-    parser.add_argument(
+    # Required arguments: one region, or a selection of regions to compare
+    regions = parser.add_mutually_exclusive_group(required=True)
+    regions.add_argument(
         "-r",
         "--region",
         type=str,
-        required=True,
-        choices=[
-            "af-south-1",
-            "ap-east-1",
-            "ap-east-2",
-            "ap-northeast-1",
-            "ap-northeast-2",
-            "ap-northeast-3",
-            "ap-south-1",
-            "ap-south-2",
-            "ap-southeast-1",
-            "ap-southeast-2",
-            "ap-southeast-3",
-            "ap-southeast-4",
-            "ap-southeast-5",
-            "ap-southeast-7",
-            "ca-central-1",
-            "ca-west-1",
-            "eu-central-1",
-            "eu-central-2",
-            "eu-north-1",
-            "eu-south-1",
-            "eu-south-2",
-            "eu-west-1",
-            "eu-west-2",
-            "eu-west-3",
-            "il-central-1",
-            "me-central-1",
-            "me-south-1",
-            "mx-central-1",
-            "sa-east-1",
-            "us-east-1",
-            "us-east-2",
-            "us-gov-east-1",
-            "us-gov-west-1",
-            "us-west-1",
-            "us-west-2",
-        ],
+        choices=load_region_index().codes,
         help="AWS region code",
     )
+    regions.add_argument(
+        "--regions",
+        type=str,
+        metavar="SELECTOR",
+        help="Compare the cost in several regions, e.g. 'eu-*', 'us-gov-*', 'arm64' or 'eu-*&arm64,us-east-1'",
+    )
     parser.add_argument(
         "-a",
         "--architecture",
@@ -73,8 +44,9 @@ def parse_args() -> argparse.Namespace:
         choices=["x86", "arm64"],
         help="Architecture (x86 or arm64)",
     )
+    # Number of requests, duration and memory are required unless solved for (see below)
     parser.add_argument(
-        "-n", "--number-of-requests", type=int, required=True, help="Number of requests"
+        "-n", "--number-of-requests", type=int, help="Number of requests"
     )
     parser.add_argument(
         "-nu",
@@ -95,12 +67,9 @@ def parse_args() -> argparse.Namespace:
         "-d",
         "--duration-of-each-request-in-ms",
         type=int,
-        required=True,
         help="Duration of each request in milliseconds",
     )
-    parser.add_argument(
-        "-m", "--memory", type=float, required=True, help="Amount of memory"
-    )
+    parser.add_argument("-m", "--memory", type=float, help="Amount of memory")
     parser.add_argument(
         "-mu",
         "--memory-unit",
@@ -139,6 +108,26 @@ def parse_args() -> argparse.Namespace:
         help="Include AWS Lambda free tier benefits (default: true)",
     )
 
+    # Optional inverse solver
+    parser.add_argument(
+        "--solve-for",
+        type=str,
+        choices=["requests", "duration", "memory"],
+        help="Solve for the largest value of this input that stays within --budget",
+    )
+    parser.add_argument(
+        "--budget",
+        type=float,
+        help="Monthly budget in USD (required with --solve-for)",
+    )
+
+    # Optional sensitivity report
+    parser.add_argument(
+        "--sensitivity",
+        action="store_true",
+        help="Also show how much the cost changes per extra unit of each input",
+    )
+
     # Version argument
     parser.add_argument(
         "-V",
@@ -147,7 +136,30 @@ def parse_args() -> argparse.Namespace:
         version=f"%(prog)s {__version__}",
         help="Show the version of the CLI tool",
     )
-    return parser.parse_args()
+    args = parser.parse_args()
+
+    solvable = {
+        "requests": ("-n/--number-of-requests", args.number_of_requests),
+        "duration": (
+            "-d/--duration-of-each-request-in-ms",
+            args.duration_of_each_request_in_ms,
+        ),
+        "memory": ("-m/--memory", args.memory),
+    }
+    missing = [
+        flag
+        for unknown, (flag, value) in solvable.items()
+        if value is None and unknown != args.solve_for
+    ]
+    if missing:
+        parser.error(f"the following arguments are required: {', '.join(missing)}")
+    if args.solve_for and args.budget is None:
+        parser.error("argument --budget is required with --solve-for")
+    if args.regions and (args.solve_for or args.sensitivity):
+        parser.error(
+            "argument --regions cannot be combined with --solve-for or --sensitivity"
+        )
+    return args
 
 
 def run() -> None:
@@ -162,6 +174,59 @@ def run() -> None:
         logger.info("Starting CLI tool...")
         logger.debug(f"Arguments received: {vars(args)}")
 
+        if args.solve_for:
+            # The solved input may be omitted; solve_for ignores its value anyway
+            inputs = {
+                "number_of_requests": args.number_of_requests,
+                "duration_of_each_request_in_ms": args.duration_of_each_request_in_ms,
+                "memory": args.memory,
+            }
+            solution = solve_for(
+                budget=args.budget,
+                unknown=args.solve_for,
+                region=args.region,
+                architecture=args.architecture,
+                request_unit=args.request_unit,
+                memory_unit=args.memory_unit,
+                ephemeral_storage=args.ephemeral_storage,
+                storage_unit=args.storage_unit,
+                include_free_tier=args.free_tier.lower() == "true",
+                **{name: value for name, value in inputs.items() if value is not None},
+            )
+            logger.info(
+                f"Solved {solution.unknown}: {solution.value:,.6f} {solution.unit}"
+            )
+            logger.info("Execution completed successfully.")
+            print(
+                f"Maximum {solution.unknown} for ${solution.budget:.2f} USD: {solution.value:,.6f} {solution.unit}"
+            )
+            return
+
+        if args.regions:
+            # One vectorized evaluation over every selected region, cheapest first;
+            # imported here so plain quotes don't load numpy
+            from aws_lambda_calculator import compare_regions
+
+            comparison = compare_regions(
+                args.regions,
+                architecture=args.architecture,
+                number_of_requests=args.number_of_requests,
+                request_unit=args.request_unit,
+                duration_of_each_request_in_ms=args.duration_of_each_request_in_ms,
+                memory=args.memory,
+                memory_unit=args.memory_unit,
+                ephemeral_storage=args.ephemeral_storage,
+                storage_unit=args.storage_unit,
+                include_free_tier=args.free_tier.lower() == "true",
+            )
+            index = load_region_index()
+            costs = zip(comparison.axes["region"], comparison.total_cost)
+            for code, cost in sorted(costs, key=lambda row: row[1]):
+                logger.info(f"{code}: {cost:.6f} USD")
+                print(f"{code} ({index.get(str(code)).name}): {cost:.6f} USD")
+            logger.info("Execution completed successfully.")
+            return
+
         # Call the calculate function with parsed values
         result = calculate(
             region=args.region,
@@ -177,9 +242,46 @@ def run() -> None:
         )
 
         logger.info(f"Total cost: {result.total_cost:.6f} USD")
-        logger.info("Execution completed successfully.")
         print(f"Total cost: {result.total_cost:.6f} USD")
 
+        if args.sensitivity:
+            from aws_lambda_calculator.sensitivity import sensitivity
+
+            gradient = sensitivity(
+                region=args.region,
+                architecture=args.architecture,
+                number_of_requests=args.number_of_requests,
+                request_unit=args.request_unit,
+                duration_of_each_request_in_ms=args.duration_of_each_request_in_ms,
+                memory=args.memory,
+                memory_unit=args.memory_unit,
+                ephemeral_storage=args.ephemeral_storage,
+                storage_unit=args.storage_unit,
+                include_free_tier=args.free_tier.lower() == "true",
+            ).row()
+            # report in budget-review steps rather than per single unit; the gradient
+            # is per unit of the input, e.g. per million for "million per month"
+            requests_step = 1_000_000 / REQUESTS_PER_MONTH[args.request_unit]
+            memory_step = 128 if args.memory_unit == "MB" else 0.125
+            storage_step = 1024 if args.storage_unit == "MB" else 1
+            print(
+                f"Cost per extra million requests per month: "
+                f"{gradient['number_of_requests'] * requests_step:.6f} USD"
+            )
+            print(
+                f"Cost per extra ms of duration: "
+                f"{gradient['duration_of_each_request_in_ms']:.6f} USD"
+            )
+            print(
+                f"Cost per extra 128 MB of memory: "
+                f"{gradient['memory'] * memory_step:.6f} USD"
+            )
+            print(
+                f"Cost per extra GB of ephemeral storage: "
+                f"{gradient['ephemeral_storage'] * storage_step:.6f} USD"
+            )
+        logger.info("Execution completed successfully.")
+
     except Exception as e:
         logger.error(f"An error occurred: {e}")
         sys.exit(1)
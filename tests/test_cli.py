@@ -192,3 +192,221 @@ def test_cli_version():
     print(f"exit code: {exit_code}, stderr: {stderr}")
     assert exit_code == 0
     assert "aws_lambda_calculator" in stdout  # Check if version is printed
+
+
+def test_cli_solve_for_requests():
+    """Test CLI inverse solver without a number of requests."""
+    stdout, stderr, exit_code = run_cli(
+        "--region",
+        "us-east-1",
+        "--architecture",
+        "arm64",
+        "--request-unit",
+        "per day",
+        "--duration-of-each-request-in-ms",
+        "100",
+        "--memory",
+        "1024",
+        "--memory-unit",
+        "MB",
+        "--ephemeral-storage",
+        "512",
+        "--storage-unit",
+        "MB",
+        "--solve-for",
+        "requests",
+        "--budget",
+        "100",
+    )
+
+    print(f"CLI output: {stdout}")
+    print(f"exit code: {exit_code}, stderr: {stderr}")
+    assert exit_code == 0
+    assert "Maximum requests for $100.00 USD:" in stdout
+    assert "per day" in stdout
+
+
+def test_cli_solve_for_requires_budget():
+    """Test CLI inverse solver without a budget."""
+    _, stderr, exit_code = run_cli(
+        "--region",
+        "us-east-1",
+        "--architecture",
+        "x86",
+        "--number-of-requests",
+        "1000",
+        "--request-unit",
+        "per day",
+        "--memory",
+        "1024",
+        "--memory-unit",
+        "MB",
+        "--ephemeral-storage",
+        "512",
+        "--storage-unit",
+        "MB",
+        "--solve-for",
+        "duration",
+    )
+
+    print(f"exit code: {exit_code}, stderr: {stderr}")
+    assert exit_code != 0
+    assert "argument --budget is required with --solve-for" in stderr
+
+
+def test_cli_missing_solvable_argument():
+    """Test CLI without memory when not solving for it."""
+    _, stderr, exit_code = run_cli(
+        "--region",
+        "us-east-1",
+        "--architecture",
+        "x86",
+        "--number-of-requests",
+        "1000",
+        "--request-unit",
+        "per day",
+        "--duration-of-each-request-in-ms",
+        "100",
+        "--memory-unit",
+        "MB",
+        "--ephemeral-storage",
+        "512",
+        "--storage-unit",
+        "MB",
+    )
+
+    print(f"exit code: {exit_code}, stderr: {stderr}")
+    assert exit_code != 0
+    assert "the following arguments are required: -m/--memory" in stderr
+
+
+def test_cli_sensitivity():
+    """Test CLI reports the cost per extra unit of each input."""
+    stdout, stderr, exit_code = run_cli(
+        "--region",
+        "us-east-1",
+        "--architecture",
+        "x86",
+        "--number-of-requests",
+        "1000000",
+        "--request-unit",
+        "per day",
+        "--duration-of-each-request-in-ms",
+        "100",
+        "--memory",
+        "512",
+        "--memory-unit",
+        "MB",
+        "--ephemeral-storage",
+        "10",
+        "--storage-unit",
+        "GB",
+        "--sensitivity",
+    )
+
+    print(f"CLI output: {stdout}")
+    print(f"exit code: {exit_code}, stderr: {stderr}")
+    assert exit_code == 0
+    assert "Total cost:" in stdout
+    assert "Cost per extra million requests per month:" in stdout
+    assert "Cost per extra ms of duration:" in stdout
+    assert "Cost per extra 128 MB of memory:" in stdout
+
+
+def test_cli_sensitivity_request_units():
+    """Test CLI reports the same cost per million requests whatever the request unit."""
+    reports = []
+    for number_of_requests, request_unit in (
+        ("30000000", "per month"),
+        ("30", "million per month"),
+    ):
+        stdout, stderr, exit_code = run_cli(
+            "--region",
+            "us-east-1",
+            "--architecture",
+            "x86",
+            "--number-of-requests",
+            number_of_requests,
+            "--request-unit",
+            request_unit,
+            "--duration-of-each-request-in-ms",
+            "100",
+            "--memory",
+            "512",
+            "--memory-unit",
+            "MB",
+            "--ephemeral-storage",
+            "512",
+            "--storage-unit",
+            "MB",
+            "--sensitivity",
+        )
+        assert exit_code == 0, stderr
+        reports.append(
+            next(line for line in stdout.splitlines() if "million requests" in line)
+        )
+    assert reports[0] == reports[1]
+
+
+def test_cli_every_indexed_region():
+    """Test CLI offers every region of the region index, including the newest."""
+    stdout, stderr, exit_code = run_cli(
+        "--region",
+        "ap-southeast-6",
+        "--architecture",
+        "arm64",
+        "--number-of-requests",
+        "1000000",
+        "--request-unit",
+        "per day",
+        "--duration-of-each-request-in-ms",
+        "100",
+        "--memory",
+        "512",
+        "--memory-unit",
+        "MB",
+        "--ephemeral-storage",
+        "10",
+        "--storage-unit",
+        "GB",
+    )
+
+    print(f"CLI output: {stdout}")
+    print(f"exit code: {exit_code}, stderr: {stderr}")
+    assert exit_code == 0
+    assert "Total cost:" in stdout
+
+
+def test_cli_compare_regions():
+    """Test CLI prices a selection of regions, cheapest first."""
+    stdout, stderr, exit_code = run_cli(
+        "--regions",
+        "us-gov-*,eu-west-1",
+        "--architecture",
+        "arm64",
+        "--number-of-requests",
+        "1000000",
+        "--request-unit",
+        "per day",
+        "--duration-of-each-request-in-ms",
+        "100",
+        "--memory",
+        "512",
+        "--memory-unit",
+        "MB",
+        "--ephemeral-storage",
+        "10",
+        "--storage-unit",
+        "GB",
+    )
+
+    print(f"CLI output: {stdout}")
+    print(f"exit code: {exit_code}, stderr: {stderr}")
+    assert exit_code == 0
+    lines = stdout.splitlines()
+    assert [line.split()[0] for line in lines] == [
+        "eu-west-1",
+        "us-gov-west-1",
+        "us-gov-east-1",
+    ]
+    assert lines[0].startswith("eu-west-1 (EU (Ireland)):")
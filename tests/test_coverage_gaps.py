@@ -3,7 +3,6 @@
 import pytest
 from aws_lambda_calculator import calculate
 from aws_lambda_calculator.calculator import (
-    open_json_file,
     unit_conversion_requests,
     unit_conversion_memory,
     unit_conversion_ephemeral_storage,
@@ -15,11 +14,6 @@ from aws_lambda_calculator.models import CalculationResult
 class TestCoverageGaps:
     """Test cases to improve coverage for calculator.py."""
 
-    def test_open_json_file_invalid_region(self):
-        """Test open_json_file with non-existent region."""
-        result = open_json_file("invalid-region-999")
-        assert result == {}
-
     def test_unit_conversion_requests_invalid_unit(self):
         """Test unit_conversion_requests with invalid unit."""
         with pytest.raises(ValueError, match="Unknown request unit: invalid_unit"):
@@ -42,7 +42,7 @@ class TestLambdaErrorHandling:
         event = {"body": json.dumps(payload)}
         response = handler(event, None)
 
-        assert response["statusCode"] == 500
+        assert response["statusCode"] == 400  # Invalid input is a client error
         body = json.loads(response["body"])
         assert body["status"] == "error"
         assert "validation error" in body["message"].lower()
@@ -166,3 +166,211 @@ def test_lambda_verbose_with_different_units():
     calculation_steps = body["calculation_steps"]
     assert isinstance(calculation_steps, list)
     assert len(calculation_steps) > 0
+
+
+def test_lambda_emf_metrics(monkeypatch, capsys):
+    """Test Lambda handler emits phase timings as an EMF line when enabled."""
+    monkeypatch.setenv("EMF_METRICS", "true")
+    payload = {
+        "region": "us-east-1",
+        "architecture": "x86",
+        "number_of_requests": 1000000,
+        "request_unit": "per day",
+        "duration_of_each_request_in_ms": 100,
+        "memory": 512,
+        "memory_unit": "MB",
+        "ephemeral_storage": 10,
+        "storage_unit": "GB",
+        "verbose": False,
+    }
+    response = handler({"body": json.dumps(payload)}, None)
+    assert response["statusCode"] == 200
+
+    lines = [line for line in capsys.readouterr().out.splitlines() if '"_aws"' in line]
+    assert len(lines) == 1
+    emf = json.loads(lines[0])
+    metrics = emf["_aws"]["CloudWatchMetrics"][0]
+    assert metrics["Namespace"] == "AwsLambdaCalculator"
+    assert {metric["Name"] for metric in metrics["Metrics"]} >= {
+        "validation_ms",
+        "compute_charges_ms",
+    }
+    assert emf["validation_ms"] >= 0
+
+
+def test_lambda_emf_metrics_off(capsys):
+    """Test Lambda handler emits no EMF line by default."""
+    payload = {
+        "region": "us-east-1",
+        "architecture": "x86",
+        "number_of_requests": 1000000,
+        "request_unit": "per day",
+        "duration_of_each_request_in_ms": 100,
+        "memory": 512,
+        "memory_unit": "MB",
+        "ephemeral_storage": 10,
+        "storage_unit": "GB",
+        "verbose": False,
+    }
+    handler({"body": json.dumps(payload)}, None)
+    assert '"_aws"' not in capsys.readouterr().out
+
+
+def test_lambda_sensitivity():
+    """Test Lambda handler returns the cost derivatives on request."""
+    payload = {
+        "region": "us-east-1",
+        "architecture": "x86",
+        "number_of_requests": 1000000,
+        "request_unit": "per day",
+        "duration_of_each_request_in_ms": 100,
+        "memory": 512,
+        "memory_unit": "MB",
+        "ephemeral_storage": 10,
+        "storage_unit": "GB",
+        "verbose": False,
+        "sensitivity": True,
+    }
+    body = json.loads(handler({"body": json.dumps(payload)}, None)["body"])
+    assert body["status"] == "success"
+    assert set(body["sensitivity"]) == {
+        "number_of_requests",
+        "duration_of_each_request_in_ms",
+        "memory",
+        "ephemeral_storage",
+        "response_size_in_mb",
+    }
+    assert body["sensitivity"]["duration_of_each_request_in_ms"] > 0
+
+
+def test_lambda_region_by_name():
+    """Test Lambda handler accepts a region by its location name."""
+    payload = {
+        "architecture": "x86",
+        "number_of_requests": 1000000,
+        "request_unit": "per day",
+        "duration_of_each_request_in_ms": 100,
+        "memory": 512,
+        "memory_unit": "MB",
+        "ephemeral_storage": 10,
+        "storage_unit": "GB",
+        "verbose": False,
+    }
+    by_code = handler({"body": json.dumps({**payload, "region": "eu-west-1"})}, None)
+    by_name = handler({"body": json.dumps({**payload, "region": "EU (Ireland)"})}, None)
+    assert by_name["statusCode"] == 200
+    assert json.loads(by_name["body"]) == json.loads(by_code["body"])
+
+
+def test_lambda_unknown_region():
+    """Test Lambda handler rejects regions missing from the region index."""
+    payload = {
+        "region": "moon-1",
+        "architecture": "x86",
+        "number_of_requests": 1000000,
+        "request_unit": "per day",
+        "duration_of_each_request_in_ms": 100,
+        "memory": 512,
+        "memory_unit": "MB",
+        "ephemeral_storage": 10,
+        "storage_unit": "GB",
+    }
+    response = handler({"body": json.dumps(payload)}, None)
+    assert response["statusCode"] == 400
+    assert json.loads(response["body"])["message"] == "Unknown region: moon-1"
+
+
+QUOTE = {
+    "region": "us-east-1",
+    "architecture": "x86",
+    "number_of_requests": 1000000,
+    "request_unit": "per day",
+    "duration_of_each_request_in_ms": 100,
+    "memory": 512,
+    "memory_unit": "MB",
+    "ephemeral_storage": 10,
+    "storage_unit": "GB",
+}
+
+
+def test_lambda_etag():
+    """Test Lambda handler tags quotes by their normalized request."""
+    first = handler({"body": json.dumps(QUOTE)}, None)
+    reordered = handler({"body": json.dumps(dict(reversed(QUOTE.items())))}, None)
+    by_name = handler(
+        {"body": json.dumps({**QUOTE, "region": "US East (N. Virginia)"})}, None
+    )
+    as_float = handler(
+        {"body": json.dumps({**QUOTE, "memory": 512.0, "memory_unit": 0})}, None
+    )
+    other = handler({"body": json.dumps({**QUOTE, "memory": 1024})}, None)
+    etag = first["headers"]["ETag"]
+    assert etag.startswith('"') and etag.endswith('"')
+    assert reordered["headers"]["ETag"] == by_name["headers"]["ETag"] == etag
+    assert as_float["headers"]["ETag"] == etag
+    assert reordered["body"] == by_name["body"] == first["body"]
+    assert other["headers"]["ETag"] != etag
+    assert first["headers"]["Cache-Control"] == "private, no-cache"
+
+
+def test_lambda_if_none_match(monkeypatch):
+    """Test Lambda handler answers 304 to a matching ETag without calculating."""
+    etag = handler({"body": json.dumps(QUOTE)}, None)["headers"]["ETag"]
+
+    def fail(**kwargs):
+        raise AssertionError("quote recomputed")
+
+    monkeypatch.setattr("aws_lambda.calculate", fail)
+    for header in (etag, f"W/{etag}", f'"stale", {etag}', "*"):
+        event = {"body": json.dumps(QUOTE), "headers": {"if-none-match": header}}
+        response = handler(event, None)
+        assert response["statusCode"] == 304
+        assert response["body"] == ""
+        assert response["headers"]["ETag"] == etag
+
+
+def test_lambda_if_none_match_stale():
+    """Test Lambda handler answers a stale ETag with the full quote."""
+    event = {"body": json.dumps(QUOTE), "headers": {"If-None-Match": '"stale"'}}
+    response = handler(event, None)
+    assert response["statusCode"] == 200
+    assert json.loads(response["body"])["status"] == "success"
+
+
+def test_lambda_get_query_string():
+    """Test Lambda handler takes a GET quote from its query string parameters."""
+    post = handler({"body": json.dumps({**QUOTE, "verbose": False})}, None)
+    get = handler(
+        {
+            "httpMethod": "GET",
+            "queryStringParameters": {
+                **{name: str(value) for name, value in QUOTE.items()},
+                "verbose": "false",
+            },
+        },
+        None,
+    )
+    assert get["statusCode"] == 200
+    assert get["body"] == post["body"]
+    assert get["headers"]["ETag"] == post["headers"]["ETag"]
+    assert get["headers"]["Cache-Control"].startswith("public")
+
+
+def test_lambda_errors_not_cached():
+    """Test Lambda handler forbids caching error responses."""
+    response = handler({"body": json.dumps({**QUOTE, "region": "moon-1"})}, None)
+    assert response["headers"]["Cache-Control"] == "no-store"
+    assert "ETag" not in response["headers"]
+
+
+def test_lambda_invalid_quote_not_matched():
+    """Test Lambda handler rejects an invalid quote whatever ETag the client holds."""
+    for header in ("*", handler({"body": json.dumps(QUOTE)}, None)["headers"]["ETag"]):
+        event = {
+            "body": json.dumps({**QUOTE, "memory": 64}),
+            "headers": {"If-None-Match": header},
+        }
+        response = handler(event, None)
+        assert response["statusCode"] == 400
+        assert "Memory must be between" in json.loads(response["body"])["message"]
+        assert response["headers"]["Cache-Control"] == "no-store"